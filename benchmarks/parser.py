@@ -0,0 +1,34 @@
+import timeit
+from functools import partial
+
+import click
+
+from fs_schema_validator.evaluator.parser import parse_template_with_grammar
+from fs_schema_validator.evaluator.scanner import scan_template
+
+TEMPLATES = [
+    "type",
+    "^[0-9a-f]{{6}}$",
+    "output_{$yaw_angle_idx}/plot_slices_results.json",
+    "output_{$yaw_angle_idx}/totalp_coeff{|_empty}_{$axis}_{$slices_idx:02}.{$format}",
+    "foo-{bar|baz}-{0..10:02}.jpg",
+]
+
+
+@click.command()
+@click.option("--number", "-n", type=click.IntRange(min=1), default=2_000)
+def main(number: int) -> None:
+    """Compare the template scanner against the parsita grammar (uncached)."""
+
+    for template in TEMPLATES:
+        grammar = timeit.timeit(partial(parse_template_with_grammar, template), number=number)
+        scanner = timeit.timeit(partial(scan_template, template), number=number)
+
+        click.echo(
+            f"{template!r:<90} grammar {grammar / number * 1e6:8.2f}µs"
+            f"  scanner {scanner / number * 1e6:8.2f}µs  ({grammar / scanner:6.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
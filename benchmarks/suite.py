@@ -0,0 +1,340 @@
+import json
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import click
+import yaml
+
+from benchmarks import trees
+from fs_schema_validator import Schema
+
+
+@dataclass(frozen=True)
+class Tree:
+    build: trees.TreeBuilder
+    # number of files at scale 1.
+    count: int
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    tree: str
+    # builds the validators given the number of files in the tree.
+    validators: Callable[[int], list[dict[str, Any]]]
+
+
+TREES = {
+    "texts": Tree(trees.text_files, 10_000),
+    "pngs": Tree(trees.png_files, 10_000),
+    "glbs": Tree(trees.glb_files, 8),
+    "deep_jsons": Tree(trees.deep_json_files, 200),
+    "json_arrays": Tree(trees.big_json_arrays, 2),
+    "zips": Tree(trees.zip_files, 4),
+}
+
+_ITEMS_SPEC = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "attrs": {
+            "id": {"type": "int", "min": 0},
+            "name": {"type": "str"},
+            "values": {"type": "array", "items": {"type": "int"}},
+        },
+    },
+}
+
+
+SCENARIOS = [
+    Scenario(
+        "file",
+        "texts",
+        lambda n: [{"type": "file", "path": f"texts/{{0..{n - 1}:06}}.txt"}],
+    ),
+    Scenario(
+        "image_header",
+        "pngs",
+        lambda n: [
+            {
+                "type": "image",
+                "format": "png",
+                "depth": "header",
+                "path": f"images/{{0..{n - 1}:06}}.png",
+            },
+        ],
+    ),
+    Scenario(
+        "image_open",
+        "pngs",
+        lambda n: [
+            {"type": "image", "format": "png", "path": f"images/{{0..{n - 1}:06}}.png"},
+        ],
+    ),
+    Scenario(
+        "image_decode",
+        "pngs",
+        lambda n: [
+            {
+                "type": "image",
+                "format": "png",
+                "depth": "decode",
+                "path": f"images/{{0..{n - 1}:06}}.png",
+            },
+        ],
+    ),
+    Scenario(
+        "gltf_full",
+        "glbs",
+        lambda n: [{"type": "gltf", "format": "glb", "path": f"meshes/{{0..{n - 1}:04}}.glb"}],
+    ),
+    Scenario(
+        "gltf_structure",
+        "glbs",
+        lambda n: [
+            {
+                "type": "gltf",
+                "format": "glb",
+                "depth": "structure",
+                "path": f"meshes/{{0..{n - 1}:04}}.glb",
+            },
+        ],
+    ),
+    Scenario(
+        "gltf_accessor_checks",
+        "glbs",
+        lambda n: [
+            {
+                "type": "gltf",
+                "format": "glb",
+                "depth": "structure",
+                "checks": ["bounds", "indices", "finite", "min_max"],
+                "path": f"meshes/{{0..{n - 1}:04}}.glb",
+            },
+        ],
+    ),
+    Scenario(
+        "json_deep",
+        "deep_jsons",
+        lambda n: [
+            {
+                "type": "json",
+                "path": f"documents/{{0..{n - 1}:04}}.json",
+                "spec": trees.deep_json_spec(),
+            },
+        ],
+    ),
+    Scenario(
+        "json_array",
+        "json_arrays",
+        lambda n: [
+            {"type": "json", "path": f"arrays/{{0..{n - 1}:04}}.json", "spec": _ITEMS_SPEC},
+        ],
+    ),
+    Scenario(
+        "json_array_stream",
+        "json_arrays",
+        lambda n: [
+            {
+                "type": "json",
+                "path": f"arrays/{{0..{n - 1}:04}}.json",
+                "spec": _ITEMS_SPEC,
+                "stream": True,
+            },
+        ],
+    ),
+    Scenario(
+        "zip_crc",
+        "zips",
+        lambda n: [{"type": "zip", "path": f"archives/{{0..{n - 1}:04}}.zip"}],
+    ),
+    Scenario(
+        "zip_headers",
+        "zips",
+        lambda n: [
+            {"type": "zip", "depth": "headers", "path": f"archives/{{0..{n - 1}:04}}.zip"},
+        ],
+    ),
+    Scenario(
+        "zip_members",
+        "zips",
+        lambda n: [
+            {
+                "type": "zip",
+                "depth": "headers",
+                "path": f"archives/{{0..{n - 1}:04}}.zip",
+                "members": [
+                    {"type": "image", "format": "png", "depth": "decode", "path": "preview.png"},
+                    {"type": "file", "path": f"data/{{0..{trees.ZIP_MEMBERS - 1}:04}}.bin"},
+                ],
+            },
+        ],
+    ),
+]
+
+
+@click.command()
+@click.option("--scale", type=click.FloatRange(min=0, min_open=True), default=1.0)
+@click.option("--repeat", "-n", type=click.IntRange(min=1), default=3)
+@click.option(
+    "--only",
+    multiple=True,
+    type=click.Choice([s.name for s in SCENARIOS]),
+    help="Run only the given scenarios.",
+)
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Where trees are generated, and kept across runs. Defaults to a temporary directory.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write results as JSON to this file.",
+)
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Results of a previous run to compare against, exiting with 1 on regressions.",
+)
+@click.option("--threshold", type=click.FloatRange(min=1), default=1.25)
+def main(  # noqa: PLR0917
+    scale: float,
+    repeat: int,
+    only: tuple[str, ...],
+    work_dir: Path | None,
+    output: Path | None,
+    compare: Path | None,
+    threshold: float,
+) -> None:
+    """Time schema loading and validation over synthetic trees, one scenario per validator."""
+
+    scenarios = [s for s in SCENARIOS if len(only) == 0 or s.name in only]
+    tmp_dir = None
+
+    if work_dir is None:
+        tmp_dir = work_dir = Path(tempfile.mkdtemp(prefix="fs-schema-validator-bench-"))
+
+    try:
+        results = {s.name: _run(s, work_dir, scale, repeat) for s in scenarios}
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir)
+
+    record = {
+        "meta": {
+            "version": _version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale,
+            "repeat": repeat,
+            "created_at": datetime.now(UTC).isoformat(),
+        },
+        "results": results,
+    }
+
+    if output is not None:
+        output.write_text(json.dumps(record, indent=2) + "\n")
+
+    if compare is not None:
+        baseline = json.loads(compare.read_text())
+
+        if baseline["meta"]["scale"] != scale:
+            click.secho("⚠️  baseline was recorded with a different --scale", fg="yellow")
+
+        if _has_regressions(baseline["results"], results, threshold):
+            raise SystemExit(1)
+
+
+def _run(scenario: Scenario, work_dir: Path, scale: float, repeat: int) -> dict[str, Any]:
+    tree = TREES[scenario.tree]
+    count = max(1, round(tree.count * scale))
+    root_dir = work_dir / f"{scenario.tree}-{count}"
+
+    if not root_dir.exists():
+        click.echo(f"generating {scenario.tree} ({count} files)...", err=True)
+        # trees are built aside, so that interrupted builds are never reused.
+        tmp_root_dir = root_dir.with_suffix(".tmp")
+        shutil.rmtree(tmp_root_dir, ignore_errors=True)
+        tree.build(tmp_root_dir, count)
+        tmp_root_dir.rename(root_dir)
+
+    schema_yaml = yaml.safe_dump({"schema": scenario.validators(count)})
+
+    load = _time(lambda: Schema.from_yaml(schema_yaml), repeat)
+    schema = Schema.from_yaml(schema_yaml)
+    validate = _time(lambda: schema.validate_(root_dir), repeat)
+
+    report = schema.validate_(root_dir)
+    assert report.okay(), f"{scenario.name}: {report.errors[:5]}"
+
+    files = [p for p in root_dir.rglob("*") if p.is_file()]
+    result: dict[str, Any] = {
+        "tree": scenario.tree,
+        "files": len(files),
+        "bytes": sum(p.stat().st_size for p in files),
+        "validators": len(schema.validators),
+        "load": load,
+        "validate": validate,
+    }
+
+    click.echo(
+        f"{scenario.name:<24} load {load['median']:8.3f}s  validate {validate['median']:8.3f}s"
+        f"  ({result['validators']} validators, {result['bytes'] / 2**20:.1f}MiB)"
+    )
+
+    return result
+
+
+def _time(f: Callable[[], object], repeat: int) -> dict[str, float]:
+    samples = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        samples.append(time.perf_counter() - start)
+
+    return {"min": min(samples), "median": statistics.median(samples), "max": max(samples)}
+
+
+def _has_regressions(baseline: dict[str, Any], results: dict[str, Any], threshold: float) -> bool:
+    regressions = False
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        for phase in ("load", "validate"):
+            ratio = result[phase]["median"] / max(baseline[name][phase]["median"], 1e-9)
+
+            if ratio > threshold:
+                regressions = True
+                click.secho(f"{name} {phase}: {ratio:.2f}x slower than baseline", fg="red")
+            elif ratio < 1 / threshold:
+                click.secho(f"{name} {phase}: {1 / ratio:.2f}x faster than baseline", fg="green")
+
+    return regressions
+
+
+def _version() -> str:
+    try:
+        return metadata.version("fs-schema-validator")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import io
+import json
+import struct
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import numpy as np
+from PIL import Image
+
+# Builders write a synthetic tree of `count` files under `root_dir`, deterministically.
+TreeBuilder = Callable[[Path, int], None]
+
+
+def text_files(root_dir: Path, count: int) -> None:
+    (root_dir / "texts").mkdir(parents=True)
+
+    for i in range(count):
+        (root_dir / "texts" / f"{i:06}.txt").write_text(f"file {i}\n")
+
+
+def png_files(root_dir: Path, count: int) -> None:
+    (root_dir / "images").mkdir(parents=True)
+
+    buf = io.BytesIO()
+    Image.linear_gradient("L").resize((64, 64)).save(buf, format="png")
+    data = buf.getvalue()
+
+    for i in range(count):
+        (root_dir / "images" / f"{i:06}.png").write_bytes(data)
+
+
+GLB_VERTICES = 250_000
+
+
+def glb_files(root_dir: Path, count: int) -> None:
+    (root_dir / "meshes").mkdir(parents=True)
+
+    rng = np.random.default_rng(0)
+
+    for i in range(count):
+        (root_dir / "meshes" / f"{i:04}.glb").write_bytes(glb(rng, GLB_VERTICES))
+
+
+def glb(rng: np.random.Generator, vertices: int) -> bytes:
+    positions = rng.random((vertices, 3), dtype=np.float32)
+    indices = np.arange(vertices - vertices % 3, dtype=np.uint32)
+    bin = positions.tobytes() + indices.tobytes()
+
+    document = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        "accessors": [
+            {
+                "bufferView": 0,
+                "componentType": 5126,
+                "count": vertices,
+                "type": "VEC3",
+                "min": positions.min(axis=0).tolist(),
+                "max": positions.max(axis=0).tolist(),
+            },
+            {"bufferView": 1, "componentType": 5125, "count": len(indices), "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteLength": positions.nbytes},
+            {"buffer": 0, "byteOffset": positions.nbytes, "byteLength": indices.nbytes},
+        ],
+        "buffers": [{"byteLength": len(bin)}],
+    }
+
+    data = json.dumps(document).encode()
+    data += b" " * (-len(data) % 4)
+    chunks = struct.pack("<II", len(data), 0x4E4F534A) + data
+    chunks += struct.pack("<II", len(bin), 0x004E4942) + bin
+
+    return struct.pack("<4sII", b"glTF", 2, 12 + len(chunks)) + chunks
+
+
+JSON_DEPTH = 64
+JSON_ITEMS = 1_000
+
+
+def deep_json_files(root_dir: Path, count: int) -> None:
+    (root_dir / "documents").mkdir(parents=True)
+
+    for i in range(count):
+        document: dict[str, Any] = {"value": i, "items": [], "child": None}
+
+        for depth in range(JSON_DEPTH):
+            document = {
+                "value": depth,
+                "items": [float(j) for j in range(JSON_ITEMS // JSON_DEPTH)],
+                "child": document,
+            }
+
+        (root_dir / "documents" / f"{i:04}.json").write_text(json.dumps(document))
+
+
+def deep_json_spec() -> dict[str, Any]:
+    spec: dict[str, Any] = {"type": "object", "attrs": {}}
+    leaf = spec
+
+    for _ in range(JSON_DEPTH + 1):
+        child: dict[str, Any] = {"type": "object", "attrs": {}, "nullable": True}
+        leaf["attrs"] = {
+            "value": {"type": "int"},
+            "items": {"type": "array", "items": {"type": "float"}},
+            "child": child,
+        }
+        leaf = child
+
+    leaf["attrs"] = {"value": {"type": "int"}}
+
+    return spec
+
+
+JSON_ARRAY_ITEMS = 200_000
+
+
+def big_json_arrays(root_dir: Path, count: int) -> None:
+    (root_dir / "arrays").mkdir(parents=True)
+
+    for i in range(count):
+        items = [
+            {"id": j, "name": f"item-{j}", "values": [j, j + 1, j + 2]}
+            for j in range(JSON_ARRAY_ITEMS)
+        ]
+        (root_dir / "arrays" / f"{i:04}.json").write_text(json.dumps(items))
+
+
+ZIP_MEMBERS = 200
+ZIP_MEMBER_SIZE = 64 * 1024
+
+
+def zip_files(root_dir: Path, count: int) -> None:
+    (root_dir / "archives").mkdir(parents=True)
+
+    rng = np.random.default_rng(0)
+    png = io.BytesIO()
+    Image.linear_gradient("L").save(png, format="png")
+
+    for i in range(count):
+        with ZipFile(
+            root_dir / "archives" / f"{i:04}.zip", mode="w", compression=ZIP_DEFLATED
+        ) as zip:
+            zip.writestr("preview.png", png.getvalue())
+
+            for j in range(ZIP_MEMBERS):
+                # half random, half zeros, so that inflating is not trivially cheap.
+                data = rng.bytes(ZIP_MEMBER_SIZE // 2) + bytes(ZIP_MEMBER_SIZE // 2)
+                zip.writestr(f"data/{j:04}.bin", data)
@@ -1,26 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import json
+import os
+import time
 import typing
-from collections.abc import Iterator
-from io import StringIO
-from itertools import chain, product
+from collections import Counter, deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import chain, groupby, islice, product
+from operator import attrgetter
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, NamedTuple
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 
 if typing.TYPE_CHECKING:
     from _typeshed import SupportsRead
 
 from fs_schema_validator import evaluator
-from fs_schema_validator.evaluator.values import Bindings, Enum, Range, String
+from fs_schema_validator.cache import ResultCache
+from fs_schema_validator.evaluator.parser import compile_template, parse_expression
+from fs_schema_validator.evaluator.values import (
+    Binding,
+    Bindings,
+    Enum,
+    Expansion,
+    Expression,
+    Range,
+    String,
+)
+from fs_schema_validator.index import DirectoryIndex, IndexEntry
+from fs_schema_validator.matching import PathMatch, PathMatcher
 from fs_schema_validator.report import ValidationReport
 from fs_schema_validator.schemas.file import FileSchema
 from fs_schema_validator.schemas.gltf import GltfSchema
 from fs_schema_validator.schemas.image import ImageSchema
 from fs_schema_validator.schemas.json import JsonSchema
 from fs_schema_validator.schemas.zip import ZipSchema
+from fs_schema_validator.utils import _assert_path_exists
 
 Validator = Annotated[
     JsonSchema | ImageSchema | GltfSchema | FileSchema | ZipSchema,
@@ -34,64 +56,794 @@ UntypedBindings = Annotated[
 
 UntypedValidator = dict[str, Any]
 
+# groups of binding names iterated in lock-step.
+Zipped = tuple[tuple[str, ...], ...]
+
 
 class UntypedSchema(BaseModel):
     validators: list[UntypedValidator] = Field(alias="schema")
     bindings: UntypedBindings
+    # groups of bindings iterated in lock-step rather than as a product.
+    zipped: list[list[str]] = Field(alias="zip", default_factory=list)
+
+    @model_validator(mode="after")
+    def check_zipped(self) -> UntypedSchema:
+        grouped = [ident for group in self.zipped for ident in group]
+
+        if len(grouped) != len(set(grouped)):
+            raise ValueError("a binding can only be part of one `zip` group")
+
+        if unbound := [ident for ident in grouped if ident not in self.bindings]:
+            raise ValueError(f"`zip` refers to unknown bindings: {', '.join(unbound)}")
+
+        return self
+
+
+# `match` validators are typed with this path, replaced by each matching path when resolved.
+MATCH_PLACEHOLDER_PATH = Path("<match>")
+
+
+class MatchedValidator(BaseModel):
+    match: PathMatch
+    validator: Validator
+
+    @model_validator(mode="after")
+    def check_no_path(self) -> MatchedValidator:
+        if self.validator.path != MATCH_PLACEHOLDER_PATH:
+            raise ValueError("`path` and `match` cannot be specified together")
+
+        return self
 
 
 class Schema(BaseModel):
     validators: list[Validator]
+    matched_validators: list[MatchedValidator] = Field(default_factory=list)
+    # number of identical validators dropped by `from_yaml`.
+    duplicates: int = 0
 
     @staticmethod
     def from_yaml(
         f: str | bytes | SupportsRead[str] | SupportsRead[bytes],
         extra_bindings: Bindings | None = None,
     ) -> Schema:
-        if extra_bindings is None:
-            extra_bindings = {}
+        untyped_validators, bindings, zipped = _load_yaml(f, extra_bindings)
+
+        filtered_untyped_validators = list(
+            _filter_validators_via_evaluation(untyped_validators, bindings, zipped)
+        )
 
-        untyped_schema = UntypedSchema(**yaml.safe_load(f))
+        expanded_untyped_validators = chain.from_iterable(
+            _expand_untyped_validator(untyped_validator, validator_bindings, zipped)
+            for untyped_validator, validator_bindings in filtered_untyped_validators
+        )
 
-        bindings = {**_type_bindings(untyped_schema.bindings), **extra_bindings}
+        validators_by_path: dict[str, list[Validator]] = {}
+        matched_validators: list[MatchedValidator] = []
+        seen: set[str] = set()
+        duplicates = 0
 
-        filtered_untyped_validators = list(
-            _filter_validators_via_evaluation(untyped_schema.validators, bindings)
+        for expanded_untyped_validator in expanded_untyped_validators:
+            validator: Validator | MatchedValidator
+
+            if "match" in expanded_untyped_validator:
+                validator = MatchedValidator.model_validate(
+                    _untyped_matched_validator(expanded_untyped_validator)
+                )
+            else:
+                # e.g. `x.{$format}`, so that validators of the same file are grouped and
+                # compared as such.
+                validator = _expand_path(
+                    _validator_adapter.validate_python(expanded_untyped_validator)
+                )
+
+            # e.g. overlapping templates, or `{|_empty}` expanding to the same validator twice.
+            # validators are compared as typed, regardless of key order or spelled-out defaults.
+            key = json.dumps(validator.model_dump(mode="json"), sort_keys=True)
+
+            if key in seen:
+                duplicates += 1
+                continue
+
+            seen.add(key)
+
+            if isinstance(validator, MatchedValidator):
+                matched_validators.append(validator)
+            else:
+                # validators of the same file run back to back, while it is still cached.
+                validators_by_path.setdefault(str(validator.path), []).append(validator)
+
+        return Schema(
+            validators=list(chain.from_iterable(validators_by_path.values())),
+            matched_validators=matched_validators,
+            duplicates=duplicates,
         )
 
-        expanded_untyped_validators = list(
-            chain.from_iterable(
-                _expand_untyped_validator(untyped_validator, bindings)
-                for untyped_validator in filtered_untyped_validators
+    def validate_(
+        self,
+        root_dir: Path,
+        executor: Executor | None = None,
+        chunksize: int = 1,
+        index: DirectoryIndex | None = None,
+        cache: ResultCache | None = None,
+        *,
+        profile: bool = False,
+        max_errors: int | None = None,
+    ) -> ValidationReport:
+        return _collect(
+            self.iter_validate(
+                root_dir,
+                executor,
+                chunksize,
+                index,
+                cache,
+                profile=profile,
+                max_errors=max_errors,
             )
         )
 
-        return Schema(validators=expanded_untyped_validators)
+    def iter_validate(
+        self,
+        root_dir: Path,
+        executor: Executor | None = None,
+        chunksize: int = 1,
+        index: DirectoryIndex | None = None,
+        cache: ResultCache | None = None,
+        *,
+        profile: bool = False,
+        max_errors: int | None = None,
+    ) -> Generator[ValidationReport]:
+        return _iter_validate(
+            self.validators,
+            self.matched_validators,
+            _Run(root_dir, index, profile, max_errors),
+            executor,
+            chunksize,
+            cache,
+        )
 
-    def validate_(self, root_dir: Path) -> ValidationReport:
-        report = ValidationReport()
+    async def avalidate(
+        self,
+        root_dir: Path,
+        concurrency: int = 16,
+        executor: Executor | None = None,
+        index: DirectoryIndex | None = None,
+        cache: ResultCache | None = None,
+        *,
+        profile: bool = False,
+        max_errors: int | None = None,
+    ) -> ValidationReport:
+        return await _avalidate(
+            self.validators,
+            self.matched_validators,
+            _Run(root_dir, index, profile, max_errors),
+            concurrency,
+            executor,
+            cache,
+        )
 
-        for validator in self.validators:
-            validator_with_expanded_path = _expand_path(validator)
 
-            if validator_with_expanded_path.validate_(root_dir, report):
-                report.mark_file_as_ok(validator_with_expanded_path.path)
+class LazySchema:
+    """A schema keeping only its unexpanded validators, expanding them on demand.
+
+    Memory stays proportional to the number of templates rather than to the number of
+    expanded validators, at the cost of reporting invalid validators only once reached.
+    """
+
+    def __init__(
+        self,
+        untyped_validators: list[UntypedValidator],
+        bindings: Bindings,
+        zipped: Zipped = (),
+    ) -> None:
+        self.untyped_validators = untyped_validators
+        self.bindings = bindings
+        self.zipped = zipped
+
+    @staticmethod
+    def from_yaml(
+        f: str | bytes | SupportsRead[str] | SupportsRead[bytes],
+        extra_bindings: Bindings | None = None,
+    ) -> LazySchema:
+        return LazySchema(*_load_yaml(f, extra_bindings))
+
+    def validators(self) -> Iterator[Validator]:
+        for expanded_untyped_validator in self._expand(matched=False):
+            yield _validator_adapter.validate_python(expanded_untyped_validator)
+
+    def matched_validators(self) -> Iterator[MatchedValidator]:
+        for expanded_untyped_validator in self._expand(matched=True):
+            yield MatchedValidator.model_validate(
+                _untyped_matched_validator(expanded_untyped_validator)
+            )
+
+    def _expand(self, matched: bool) -> Iterator[UntypedValidator]:
+        for untyped_validator, bindings in _filter_validators_via_evaluation(
+            self.untyped_validators, self.bindings, self.zipped
+        ):
+            if ("match" in untyped_validator) == matched:
+                yield from _expand_untyped_validator(untyped_validator, bindings, self.zipped)
+
+    def validate_(
+        self,
+        root_dir: Path,
+        executor: Executor | None = None,
+        chunksize: int = 1,
+        index: DirectoryIndex | None = None,
+        cache: ResultCache | None = None,
+        *,
+        profile: bool = False,
+        max_errors: int | None = None,
+    ) -> ValidationReport:
+        return _collect(
+            self.iter_validate(
+                root_dir,
+                executor,
+                chunksize,
+                index,
+                cache,
+                profile=profile,
+                max_errors=max_errors,
+            )
+        )
+
+    def iter_validate(
+        self,
+        root_dir: Path,
+        executor: Executor | None = None,
+        chunksize: int = 1,
+        index: DirectoryIndex | None = None,
+        cache: ResultCache | None = None,
+        *,
+        profile: bool = False,
+        max_errors: int | None = None,
+    ) -> Generator[ValidationReport]:
+        return _iter_validate(
+            self.validators(),
+            self.matched_validators(),
+            _Run(root_dir, index, profile, max_errors),
+            executor,
+            chunksize,
+            cache,
+        )
+
+    async def avalidate(
+        self,
+        root_dir: Path,
+        concurrency: int = 16,
+        executor: Executor | None = None,
+        index: DirectoryIndex | None = None,
+        cache: ResultCache | None = None,
+        *,
+        profile: bool = False,
+        max_errors: int | None = None,
+    ) -> ValidationReport:
+        return await _avalidate(
+            self.validators(),
+            self.matched_validators(),
+            _Run(root_dir, index, profile, max_errors),
+            concurrency,
+            executor,
+            cache,
+        )
+
+
+class LiveValidation:
+    """Keeps the report of a schema up to date as files under `root_dir` change.
+
+    Validators are expanded once and indexed by path, so that a change only re-runs the
+    validators of the files it touched. Validators resolved through `match` patterns are
+    resolved again whenever files change, as creating or removing a file may change them.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        root_dir: Path,
+        executor: Executor | None = None,
+        chunksize: int = 1,
+        cache: ResultCache | None = None,
+    ) -> None:
+        self.root_dir = root_dir
+        self.executor = executor
+        self.chunksize = chunksize
+        self.cache = cache
+        self.report = ValidationReport()
+
+        self._by_path = _by_path(map(_expand_path, schema.validators))
+        self._matched_validators = [
+            m.model_copy(update={"match": m.match.expand(m.validator.inner_bindings())})
+            for m in schema.matched_validators
+        ]
+        self._matched_by_path: dict[Path, list[Validator]] = {}
+        self._match_report = ValidationReport()
+
+    def validate_all(self) -> ValidationReport:
+        self.report = ValidationReport()
+
+        return self.revalidate(None)
+
+    def revalidate(self, changed: Iterable[Path] | None) -> ValidationReport:
+        """Re-runs the validators of `changed` paths, or of all paths when `None`.
+
+        The live report is updated in place, the returned report only holds the results of
+        this pass.
+        """
+
+        paths = set(self._by_path) if changed is None else set(changed)
+
+        if len(self._matched_validators) > 0:
+            old_match_paths = set(self._match_report.valid_paths) | {
+                e.path for e in self._match_report.errors
+            }
+            self.report.discard(old_match_paths)
+
+            self._match_report = ValidationReport()
+            matched_by_path = _by_path(
+                _resolve_matches(
+                    self._matched_validators, DirectoryIndex.scan(self.root_dir), self._match_report
+                )
+            )
+
+            # files that started or stopped matching need to be updated too.
+            paths |= {
+                path
+                for path in matched_by_path.keys() | self._matched_by_path.keys()
+                if changed is None or matched_by_path.get(path) != self._matched_by_path.get(path)
+            }
+            self._matched_by_path = matched_by_path
+
+        validators = [
+            validator
+            for path in sorted(paths)
+            for validator in (*self._by_path.get(path, ()), *self._matched_by_path.get(path, ()))
+        ]
+        report = _collect(
+            _run_validators(
+                iter(validators),
+                _Run(self.root_dir, None, False),
+                self.executor,
+                self.chunksize,
+                self.cache,
+            )
+        )
+        report.extend(self._match_report)
+
+        self.report.discard(paths)
+        self.report.extend(report)
 
         return report
 
 
-def _job(root_dir: Path, validator: Validator) -> ValidationReport:
+_validator_adapter: TypeAdapter[Validator] = TypeAdapter(Validator)
+
+# upper bound on batches submitted to an executor and not yet merged, bounding memory.
+_MAX_PENDING_BATCHES = 64
+
+_MAX_MATERIALIZED_VARIANTS = 1024
+
+# bigger files are read by each of their validators, rather than held in memory for all.
+_MAX_SHARED_READ_SIZE = 64 << 20
+
+_NESTED_VALIDATOR_FIELDS = frozenset({"members"})
+
+
+def _load_yaml(
+    f: str | bytes | SupportsRead[str] | SupportsRead[bytes],
+    extra_bindings: Bindings | None,
+) -> tuple[list[UntypedValidator], Bindings, Zipped]:
+    if extra_bindings is None:
+        extra_bindings = {}
+
+    untyped_schema = UntypedSchema(**yaml.safe_load(f))
+    bindings = {**_type_bindings(untyped_schema.bindings), **extra_bindings}
+    zipped = tuple(tuple(group) for group in untyped_schema.zipped)
+
+    # checked once overrides are applied, as they may change lengths.
+    for group in zipped:
+        if len({bindings[ident].count() for ident in group}) > 1:
+            raise ValueError(f"bindings zipped together have different lengths: {', '.join(group)}")
+
+    return untyped_schema.validators, bindings, zipped
+
+
+@dataclass(frozen=True)
+class _Run:
+    root_dir: Path
+    index: DirectoryIndex | None
+    profile: bool
+    # the run stops once this many errors were reported, and files report at most as many.
+    max_errors: int | None = None
+
+
+def _collect(reports: Iterable[ValidationReport]) -> ValidationReport:
     report = ValidationReport()
 
-    validator_with_expanded_path = _expand_path(validator)
+    for r in reports:
+        report.extend(r)
+
+    return report
+
+
+def _iter_validate(  # noqa: PLR0917
+    validators: Iterable[Validator],
+    matched_validators: Iterable[MatchedValidator],
+    run: _Run,
+    executor: Executor | None,
+    chunksize: int,
+    cache: ResultCache | None,
+) -> Generator[ValidationReport]:
+    """Yields the report of every validator, in schema order, as soon as it is available.
+
+    Match counts are yielded last, in a report of their own. Closing the iterator early, or
+    running out of `max_errors`, cancels the batches that did not start yet.
+    """
+
+    run, it, match_report = _prepare(validators, matched_validators, run)
+    errors = 0
+    reports = _run_validators(it, run, executor, chunksize, cache)
+
+    try:
+        for report in reports:
+            yield report
+
+            errors += report.error_count()
+
+            if run.max_errors is not None and errors >= run.max_errors:
+                return
+    finally:
+        reports.close()
+
+    if match_report.count() > 0:
+        yield match_report
+
+
+async def _avalidate(  # noqa: PLR0917
+    validators: Iterable[Validator],
+    matched_validators: Iterable[MatchedValidator],
+    run: _Run,
+    concurrency: int,
+    executor: Executor | None,
+    cache: ResultCache | None,
+) -> ValidationReport:
+    """Runs validators from an event loop, keeping up to `concurrency` of them in flight.
+
+    Meant for filesystems where opening a file costs far more than validating it: validators
+    still run through their blocking `validate_`, in `executor` or in a thread pool of
+    `concurrency` workers, while the loop overlaps their latency. Results are merged in
+    schema order.
+    """
+
+    # scanning, like computing cache keys, waits on the filesystem and must not block the loop.
+    run, it, match_report = await asyncio.to_thread(_prepare, validators, matched_validators, run)
+    loop_executor = ThreadPoolExecutor(concurrency) if executor is None else executor
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: deque[asyncio.Task[list[ValidationReport]]] = deque()
+    report = ValidationReport()
+
+    def exhausted() -> bool:
+        return run.max_errors is not None and report.error_count() >= run.max_errors
+
+    async def run_batch(validators_batch: list[Validator]) -> list[ValidationReport]:
+        try:
+            keys = None
+
+            if cache is not None:
+                keys = await asyncio.to_thread(_cache_keys, run, validators_batch, cache)
+
+            batch = _submit_batch(run, validators_batch, loop_executor, cache, keys)
+            await asyncio.wrap_future(batch.future)
+
+            return list(_merge_batch(batch, cache))
+        finally:
+            semaphore.release()
+
+    async def merge_next() -> None:
+        for r in await pending.popleft():
+            if not exhausted():
+                report.extend(r)
+
+    try:
+        for validators_batch in _batches(it, 1):
+            await semaphore.acquire()
+            pending.append(asyncio.create_task(run_batch(validators_batch)))
+
+            # done results are merged right away, bounding memory behind a slow validator.
+            while pending and (pending[0].done() or len(pending) >= 4 * concurrency):
+                await merge_next()
+
+            if exhausted():
+                return report
+
+        while pending and not exhausted():
+            await merge_next()
+    finally:
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if executor is None:
+            loop_executor.shutdown(wait=False, cancel_futures=True)
+
+    if not exhausted():
+        report.extend(match_report)
+
+    return report
+
+
+def _prepare(
+    validators: Iterable[Validator], matched_validators: Iterable[MatchedValidator], run: _Run
+) -> tuple[_Run, Iterator[Validator], ValidationReport]:
+    matched_validators = [
+        m.model_copy(update={"match": m.match.expand(m.validator.inner_bindings())})
+        for m in matched_validators
+    ]
+
+    if len(matched_validators) > 0 and run.index is None:
+        run = replace(run, index=DirectoryIndex.scan(run.root_dir))
+
+    # match counts are reported last, once all validators were resolved.
+    match_report = ValidationReport()
+    # paths are expanded here rather than in workers, so that batches can carry the
+    # index entries of their own paths only.
+    it: Iterator[Validator] = chain(
+        map(_expand_path, validators),
+        _resolve_matches(matched_validators, run.index, match_report),
+    )
+
+    if run.max_errors is not None:
+        it = map(partial(_cap_errors, max_errors=run.max_errors), it)
+
+    return run, it, match_report
+
+
+def _run_validators(
+    validators: Iterator[Validator],
+    run: _Run,
+    executor: Executor | None,
+    chunksize: int,
+    cache: ResultCache | None,
+) -> Generator[ValidationReport]:
+    if executor is None and cache is None:
+        for batch in _batches(validators, 1):
+            yield from _job_batch(run, batch)
+
+        return
+
+    # batches are merged in submission order, keeping the report deterministic.
+    pending: deque[_PendingBatch] = deque()
+
+    try:
+        for batch in _batches(validators, chunksize):
+            pending.append(_submit_batch(run, batch, executor, cache))
+
+            while pending and (pending[0].future.done() or len(pending) >= _MAX_PENDING_BATCHES):
+                yield from _merge_batch(pending.popleft(), cache)
+
+        while pending:
+            yield from _merge_batch(pending.popleft(), cache)
+    finally:
+        # only left non-empty when the caller stopped early.
+        for pending_batch in pending:
+            pending_batch.future.cancel()
+
+
+def _batches(validators: Iterator[Validator], size: int) -> Iterator[list[Validator]]:
+    # validators of the same path are never split across batches, so that they share reads.
+    batch: list[Validator] = []
+
+    for _, group in groupby(validators, attrgetter("path")):
+        batch.extend(group)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if len(batch) > 0:
+        yield batch
 
-    if validator_with_expanded_path.validate_(root_dir, report):
-        report.mark_file_as_ok(validator_with_expanded_path.path)
+
+def _cap_errors(validator: Validator, max_errors: int) -> Validator:
+    if isinstance(validator, JsonSchema) and (
+        validator.max_errors is None or validator.max_errors > max_errors
+    ):
+        return validator.model_copy(update={"max_errors": max_errors})
+
+    return validator
+
+
+class _PendingBatch(NamedTuple):
+    keys: list[str | None]
+    cached: list[ValidationReport | None]
+    # reports of the validators that were not cached, in order.
+    future: Future[list[ValidationReport]]
+
+
+def _cache_keys(run: _Run, batch: list[Validator], cache: ResultCache) -> list[str | None]:
+    return [
+        cache.key(run.root_dir, validator.path, validator.model_dump_json(), run.index)
+        for validator in batch
+    ]
+
+
+def _submit_batch(
+    run: _Run,
+    batch: list[Validator],
+    executor: Executor | None,
+    cache: ResultCache | None,
+    keys: list[str | None] | None = None,
+) -> _PendingBatch:
+    if keys is None:
+        keys = [None] * len(batch) if cache is None else _cache_keys(run, batch, cache)
+
+    cached: list[ValidationReport | None] = [None] * len(batch)
+
+    if cache is not None:
+        for i, key in enumerate(keys):
+            if key is not None:
+                cached[i] = cache.get(key)
+
+        batch = [validator for validator, c in zip(batch, cached, strict=True) if c is None]
+
+    future: Future[list[ValidationReport]]
+
+    if executor is None:
+        future = Future()
+        future.set_result(_job_batch(run, batch))
+    else:
+        if run.index is not None:
+            run = replace(run, index=run.index.restrict(v.path for v in batch))
+
+        future = executor.submit(_job_batch, run, batch)
+
+    return _PendingBatch(keys, cached, future)
+
+
+def _merge_batch(batch: _PendingBatch, cache: ResultCache | None) -> Iterator[ValidationReport]:
+    results = iter(batch.future.result())
+
+    for key, cached in zip(batch.keys, batch.cached, strict=True):
+        if cached is not None:
+            yield cached
+            continue
+
+        result = next(results)
+
+        if cache is not None and key is not None:
+            cache.put(key, result)
+
+        yield result
+
+
+def _job(run: _Run, validator: Validator) -> ValidationReport:
+    report = ValidationReport()
+    _run_validator(run, validator, report)
 
     return report
 
 
+def _job_batch(run: _Run, validators: list[Validator]) -> list[ValidationReport]:
+    return list(
+        chain.from_iterable(
+            _job_group(run, list(group)) for _, group in groupby(validators, attrgetter("path"))
+        )
+    )
+
+
+def _job_group(run: _Run, validators: list[Validator]) -> list[ValidationReport]:
+    """Runs validators of the same path, reading the file once for all of them.
+
+    The file is only read upfront when one of them reads it whole anyway, so that validators
+    reading headers only keep doing so.
+    """
+
+    readers = [i for i, validator in enumerate(validators) if validator.reads_whole_file()]
+
+    if len(validators) == 1 or len(readers) == 0:
+        return [_job(run, validator) for validator in validators]
+
+    start = time.perf_counter()
+    contents = _read_shared(run.root_dir / validators[0].path)
+    # the read is attributed to the first validator that would have read the file whole.
+    read_seconds = [0.0] * len(validators)
+    read_seconds[readers[0]] = time.perf_counter() - start
+
+    reports = [ValidationReport() for _ in validators]
+
+    for validator, report, seconds in zip(validators, reports, read_seconds, strict=True):
+        _run_validator(run, validator, report, contents, seconds)
+
+    return reports
+
+
+def _read_shared(path: Path) -> bytes | None:
+    # files are not mapped: a file truncated while mapped would crash with SIGBUS.
+    try:
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size > _MAX_SHARED_READ_SIZE:
+                return None
+
+            return f.read()
+    except OSError:
+        # e.g. missing files, left for validators to report.
+        return None
+
+
+def _run_validator(
+    run: _Run,
+    validator: Validator,
+    report: ValidationReport,
+    contents: bytes | None = None,
+    read_seconds: float = 0.0,
+) -> None:
+    start = time.perf_counter() - read_seconds
+
+    if contents is None:
+        ok = validator.validate_(run.root_dir, report, run.index)
+    elif ok := _assert_path_exists(run.root_dir, validator.path, report, run.index):
+        # shares `contents` rather than copying them.
+        with io.BytesIO(contents) as f:
+            ok = validator.validate_stream(f, report)
+
+    if ok:
+        report.mark_file_as_ok(validator.path)
+
+    if run.profile:
+        elapsed = time.perf_counter() - start
+
+        if run.index is not None:
+            entry = run.index.lookup(validator.path)
+        else:
+            entry = IndexEntry.stat(run.root_dir / validator.path)
+
+        report.record_timing(
+            path=validator.path,
+            type=validator.type,
+            seconds=elapsed,
+            size=0 if entry is None else entry.size,
+        )
+
+
+def _by_path(validators: Iterable[Validator]) -> dict[Path, list[Validator]]:
+    by_path: dict[Path, list[Validator]] = {}
+
+    for validator in validators:
+        by_path.setdefault(validator.path, []).append(validator)
+
+    return by_path
+
+
+def _resolve_matches(
+    matched_validators: list[MatchedValidator],
+    index: DirectoryIndex | None,
+    report: ValidationReport,
+) -> Iterator[Validator]:
+    if len(matched_validators) == 0:
+        return
+
+    assert index is not None
+    matcher = PathMatcher([m.match for m in matched_validators])
+
+    resolved: list[Validator] = []
+
+    for m, paths in zip(matched_validators, matcher.resolve(index), strict=True):
+        m.match.check_count(len(paths), report)
+        resolved.extend(m.validator.model_copy(update={"path": path}) for path in paths)
+
+    yield from chain.from_iterable(_by_path(resolved).values())
+
+
+def _untyped_matched_validator(validator: UntypedValidator) -> dict[str, Any]:
+    untyped_validator = {key: value for key, value in validator.items() if key != "match"}
+    untyped_validator.setdefault("path", str(MATCH_PLACEHOLDER_PATH))
+
+    return {"match": validator["match"], "validator": untyped_validator}
+
+
 def _expand_path(validator: Validator) -> Validator:
+    if "{" not in str(validator.path):
+        return validator
+
     path = list(evaluator.expand(str(validator.path), validator.inner_bindings()))
     assert len(path) == 1, (
         "cannot expand to more than one variant when dealing with paths and a validator's inner bindings"
@@ -118,38 +870,229 @@ def _type_bindings(untyped_bindings: UntypedBindings) -> Bindings:
 
 
 def _expand_untyped_validator(
-    validator: dict[str, Any], bindings: Bindings
+    validator: dict[str, Any], bindings: Bindings, zipped: Zipped = ()
 ) -> Iterator[dict[str, Any]]:
-    expanded_validator: dict[str, Iterator[str]] = {
-        key: _expand_any(value, bindings) for key, value in validator.items()
-    }
+    # a binding used more than once, or zipped with others, is enumerated once and substituted
+    # consistently everywhere, rather than once per use. bindings only used by nested validators
+    # are left for them to pin, so that they expand into more nested validators.
+    own_references = _referenced_bindings(
+        {key: value for key, value in validator.items() if key not in _NESTED_VALIDATOR_FIELDS}
+    )
+    references = _referenced_bindings(validator)
+    idents = [
+        ident
+        for ident, count in references.items()
+        if ident in own_references
+        and ident in bindings
+        and bindings[ident].count() > 1
+        and (count > 1 or any(ident in group for group in zipped))
+    ]
 
-    return map(
-        dict,
-        product(*[[(key, value) for value in it] for key, it in expanded_validator.items()]),
+    if len(idents) == 0:
+        return _expand_fields(validator, bindings, zipped)
+
+    units = _binding_units(idents, zipped)
+
+    return chain.from_iterable(
+        _expand_fields(validator, pinned, zipped) for pinned in _pin_bindings(units, bindings)
     )
 
 
+def _expand_fields(
+    validator: dict[str, Any], bindings: Bindings, zipped: Zipped
+) -> Iterator[dict[str, Any]]:
+    items = list(validator.items())
+    # fields with few variants are expanded once, huge ones are re-expanded for every
+    # variant of the preceding fields instead of being materialized.
+    variants = [
+        list(islice(_expand_field(key, value, bindings, zipped), _MAX_MATERIALIZED_VARIANTS + 1))
+        for key, value in items
+    ]
+
+    if all(len(v) <= _MAX_MATERIALIZED_VARIANTS for v in variants):
+        return map(
+            dict,
+            product(
+                *[
+                    [(key, value) for value in v]
+                    for (key, _), v in zip(items, variants, strict=True)
+                ]
+            ),
+        )
+
+    variant: dict[str, Any] = {}
+
+    def expand_from(i: int) -> Iterator[dict[str, Any]]:
+        if i == len(items):
+            yield dict(variant)
+            return
+
+        key, value = items[i]
+
+        if len(variants[i]) <= _MAX_MATERIALIZED_VARIANTS:
+            expanded_values: Iterable[Any] = variants[i]
+        else:
+            expanded_values = _expand_field(key, value, bindings, zipped)
+
+        for expanded_value in expanded_values:
+            variant[key] = expanded_value
+            yield from expand_from(i + 1)
+
+    return expand_from(0)
+
+
+def _expand_field(key: str, value: Any, bindings: Bindings, zipped: Zipped) -> Iterator[Any]:
+    # nested validators expand into more validators, rather than into more parents.
+    if key in _NESTED_VALIDATOR_FIELDS and isinstance(value, list):
+        return iter(
+            [
+                list(
+                    chain.from_iterable(
+                        _expand_untyped_validator(v, member_bindings, zipped)
+                        for v, member_bindings in _filter_validators_via_evaluation(
+                            value, bindings, zipped
+                        )
+                    )
+                )
+            ]
+        )
+
+    return _expand_any(value, bindings)
+
+
 def _expand_any(value: Any, bindings: Bindings) -> Iterator[Any]:
     if isinstance(value, str):
         return evaluator.expand(value, bindings, leave_unbound_vars_in=True)
 
-    # TODO: this is a hack, figure out a way to easily evaluate a potential binding in a nested object
-    yaml_ = yaml.safe_dump(value)
-    yamls = list(_expand_any(yaml_, bindings))
-    assert len(yamls) == 1, "cannot expand to more than one variant when dealing with nested object"
-    return iter([yaml.safe_load(StringIO(yamls[0]))])
+    return iter(_expand_nested(value, bindings))
+
+
+def _expand_nested(value: Any, bindings: Bindings) -> list[Any]:
+    # Subtrees that do not change are returned as-is, so that variants share them.
+    if isinstance(value, str):
+        if "{" not in value and "}" not in value:
+            return [value]
+
+        variants = list(evaluator.expand(value, bindings, leave_unbound_vars_in=True))
+
+        if variants == [value]:
+            return [value]
+
+        return variants
+
+    if isinstance(value, dict):
+        items = [
+            list(product(_expand_nested(k, bindings), _expand_nested(v, bindings)))
+            for k, v in value.items()
+        ]
+
+        if all(
+            len(variants) == 1 and variants[0][0] is k and variants[0][1] is v
+            for variants, (k, v) in zip(items, value.items(), strict=True)
+        ):
+            return [value]
+
+        return [dict(variant) for variant in product(*items)]
+
+    if isinstance(value, list):
+        elements = [_expand_nested(v, bindings) for v in value]
+
+        if all(
+            len(variants) == 1 and variants[0] is v
+            for variants, v in zip(elements, value, strict=True)
+        ):
+            return [value]
+
+        return [list(variant) for variant in product(*elements)]
+
+    return [value]
 
 
 def _filter_validators_via_evaluation(
-    validators: list[UntypedValidator], bindings: Bindings
-) -> Iterator[UntypedValidator]:
+    validators: list[UntypedValidator], bindings: Bindings, zipped: Zipped = ()
+) -> Iterator[tuple[UntypedValidator, Bindings]]:
+    """Yields validators whose `if` holds, along with the bindings it holds for.
+
+    `if` is an expression, or a list of expressions that must all hold. Bindings referenced
+    by conditions are pinned to each of their values in turn, in order of appearance, and
+    conditions are checked as soon as their binding is pinned: a false one prunes every
+    combination of the bindings that follow.
+    """
+
     for v in validators:
-        if "if" in v:
-            if_ = v["if"]
-            del v["if"]
+        if "if" not in v:
+            yield v, bindings
+            continue
 
-            if evaluator.evaluate(if_, bindings) is True:
-                yield v
-        else:
-            yield v
+        validator = {key: value for key, value in v.items() if key != "if"}
+        conditions = v["if"] if isinstance(v["if"], list) else [v["if"]]
+        expressions = [parse_expression(c) for c in conditions]
+
+        by_ident: dict[str, list[Expression]] = {}
+
+        for expression in expressions:
+            by_ident.setdefault(expression.left.ident, []).append(expression)
+
+        units = _binding_units(by_ident, zipped)
+        # pinning bindings that the validator does not use would only yield duplicates.
+        used = _referenced_bindings(validator)
+        seen: set[tuple[str, ...]] = set()
+
+        for pinned in _pin_bindings(units, bindings, by_ident):
+            key = tuple(str(pinned[ident]) for unit in units for ident in unit if ident in used)
+
+            if key not in seen:
+                seen.add(key)
+                yield validator, pinned
+
+
+def _binding_units(idents: Iterable[str], zipped: Zipped) -> list[tuple[str, ...]]:
+    # bindings zipped together are pinned together.
+    units: list[tuple[str, ...]] = []
+
+    for ident in idents:
+        unit = next((group for group in zipped if ident in group), (ident,))
+
+        if unit not in units:
+            units.append(unit)
+
+    return units
+
+
+def _pin_bindings(
+    units: list[tuple[str, ...]],
+    bindings: Bindings,
+    conditions: dict[str, list[Expression]] | None = None,
+) -> Iterator[Bindings]:
+    if len(units) == 0:
+        yield bindings
+        return
+
+    unit, rest = units[0], units[1:]
+    expressions = [] if conditions is None else [e for i in unit for e in conditions.get(i, [])]
+
+    for values in zip(*(Binding(ident).eval(bindings).singletons() for ident in unit), strict=True):
+        pinned = {**bindings, **dict(zip(unit, values, strict=True))}
+
+        if all(e.eval(pinned) for e in expressions):
+            yield from _pin_bindings(rest, pinned, conditions)
+
+
+def _referenced_bindings(value: Any) -> Counter[str]:
+    if isinstance(value, str):
+        if "{" not in value:
+            return Counter()
+
+        return Counter(
+            part.value.ident
+            for part in compile_template(value)
+            if isinstance(part, Expansion) and isinstance(part.value, Binding)
+        )
+
+    if isinstance(value, dict):
+        return sum(map(_referenced_bindings, [*value.keys(), *value.values()]), Counter())
+
+    if isinstance(value, list):
+        return sum(map(_referenced_bindings, value), Counter())
+
+    return Counter()
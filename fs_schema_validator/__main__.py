@@ -1,15 +1,24 @@
 #!/usr/bin/env python
 
+import json
 import sys
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
 
 import click
 import pydantic
 
-from fs_schema_validator import Schema
+from fs_schema_validator import LazySchema, LiveValidation, Schema
+from fs_schema_validator.cache import ResultCache
 from fs_schema_validator.evaluator.parser import ParseError, parse_assignment
 from fs_schema_validator.evaluator.values import Assignment
+from fs_schema_validator.index import DirectoryIndex
+from fs_schema_validator.output import FORMATS, Output
+from fs_schema_validator.report import ValidationReport
+from fs_schema_validator.watch import open_watcher
 
 
 class BindingParamType(click.ParamType):
@@ -22,6 +31,10 @@ class BindingParamType(click.ParamType):
             self.fail(f"binding cannot be parsed: {e}", param, ctx)
 
 
+# lazy schemas do not know their size upfront, process pools still need batches to scale.
+LAZY_CHUNKSIZE = 32
+
+
 @click.command()
 @click.option(
     "--root-dir",
@@ -38,62 +51,312 @@ class BindingParamType(click.ParamType):
     default=False,
 )
 @click.option("--binding", "-b", multiple=True, type=BindingParamType(), default=[])
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    envvar="VALIDATION_JOBS",
+    help="Number of parallel workers used to run validators. Defaults to 1 (sequential).",
+)
+@click.option(
+    "--threads",
+    is_flag=True,
+    default=False,
+    help="Use a thread pool instead of a process pool when running with --jobs > 1.",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    default=False,
+    help="Expand validators on demand instead of upfront, keeping memory usage low on huge schemas.",
+)
+@click.option(
+    "--scan",
+    is_flag=True,
+    default=False,
+    help="Walk the root dir once upfront instead of checking every path with a syscall.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    default=None,
+    envvar="VALIDATION_CACHE_DIR",
+    help="Directory where results are cached, skipping files that did not change since.",
+)
+@click.option(
+    "--hash-contents",
+    is_flag=True,
+    default=False,
+    help="Detect changes to cached files by hashing their contents instead of their mtime.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Time every validator, printing aggregates per validator type and the slowest files.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write timings of every validator as JSON to this file. Implies --profile.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(list(FORMATS)),
+    default="text",
+    help="How results are written to stdout, as soon as each validator completes.",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    default=False,
+    help="Stop at the first file failing validation.",
+)
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="VALIDATION_MAX_ERRORS",
+    help="Stop once this many errors were found, cancelling pending validators.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running, re-validating files as they change. Stop with Ctrl-C.",
+)
+@click.option(
+    "--watch-interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    help="Seconds changes need to settle before re-validating, or between polls when inotify is not available.",
+)
 @click.argument(
     "schema_path",
     type=click.Path(exists=True, readable=True, dir_okay=False, path_type=Path),
     envvar="VALIDATION_SCHEMA_PATH",
 )
-def validate(schema_path: Path, root_dir: Path, verbose: bool, binding: list[Assignment]) -> None:
+def validate(  # noqa: PLR0917
+    schema_path: Path,
+    root_dir: Path,
+    verbose: bool,
+    binding: list[Assignment],
+    jobs: int,
+    threads: bool,
+    lazy: bool,
+    scan: bool,
+    cache_dir: Path | None,
+    hash_contents: bool,
+    profile: bool,
+    profile_output: Path | None,
+    output_format: str,
+    fail_fast: bool,
+    max_errors: int | None,
+    watch: bool,
+    watch_interval: float,
+) -> None:
     """Validate a schema against a directory
 
     SCHEMA is a path to a YAML file.
     """
 
+    # keeps stdout parseable with machine readable formats.
+    info = partial(click.secho, err=output_format != "text")
+
+    if watch and (lazy or fail_fast or max_errors is not None):
+        raise click.UsageError(
+            "--watch cannot be combined with --lazy, --fail-fast or --max-errors"
+        )
+
     if verbose:
-        click.echo(f"Schema path: {schema_path}")
-        click.echo(f"Root dir: {root_dir}")
-        click.echo()
+        info(f"Schema path: {schema_path}")
+        info(f"Root dir: {root_dir}")
+        info()
 
     extra_bindings = dict(binding)
 
     if verbose and len(extra_bindings) > 0:
-        click.secho("⚠️  Overriding the following bindings:", fg="yellow")
+        info("⚠️  Overriding the following bindings:", fg="yellow")
 
         for k, v in extra_bindings.items():
-            click.echo(f"  {k} = {v}")
+            info(f"  {k} = {v}")
+
+        info()
 
-        click.echo()
+    schema: Schema | LazySchema
 
     with schema_path.open() as f:
         try:
-            schema = Schema.from_yaml(f, extra_bindings)
-        except (pydantic.ValidationError, UnicodeDecodeError) as e:
-            click.secho("❗️ The provided schema is invalid!", fg="red")
-            click.echo("")
-            click.secho(e, fg="red")
-            sys.exit(127)
+            if lazy:
+                schema = LazySchema.from_yaml(f, extra_bindings)
+            else:
+                schema = Schema.from_yaml(f, extra_bindings)
+        except ValueError as e:
+            _exit_with_invalid_schema(e, info)
+
+    if verbose and isinstance(schema, Schema) and schema.duplicates > 0:
+        info(f"Removed {schema.duplicates} duplicate validators.")
+        info()
+
+    index = DirectoryIndex.scan(root_dir) if scan else None
+
+    if verbose and index is not None:
+        info(f"Indexed {len(index)} paths.")
+        info()
+
+    cache = None if cache_dir is None else ResultCache.open(cache_dir, hash_contents)
+    profile = profile or profile_output is not None
+
+    executor: Executor | None = None
+    chunksize = 1
+
+    if jobs > 1:
+        if threads:
+            executor = ThreadPoolExecutor(max_workers=jobs)
+        else:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+
+        if isinstance(schema, LazySchema):
+            chunksize = LAZY_CHUNKSIZE
+        else:
+            chunksize = max(1, len(schema.validators) // (jobs * 4))
+
+    output = FORMATS[output_format]()
+
+    if watch:
+        assert isinstance(schema, Schema)
+
+        try:
+            _watch(schema, root_dir, output, executor, chunksize, cache, watch_interval, info)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+            if cache is not None:
+                cache.close()
+
+    # only timings are kept, results are written as they come.
+    profile_report = ValidationReport()
+    inspected = 0
+    errors = 0
+
+    output.begin()
+
+    try:
+        for report in schema.iter_validate(
+            root_dir,
+            executor=executor,
+            chunksize=chunksize,
+            index=index,
+            cache=cache,
+            profile=profile,
+            max_errors=max_errors,
+        ):
+            output.write(report)
+            inspected += report.count()
+            errors += report.error_count()
+            profile_report.timings.extend(report.timings)
 
-    report = schema.validate_(root_dir)
+            if errors > 0 and fail_fast:
+                break
+    except pydantic.ValidationError as e:
+        # lazy schemas only type their validators once they are reached.
+        _exit_with_invalid_schema(e, info)
+    finally:
+        output.end()
+
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+        if cache is not None:
+            cache.close()
+
+    if verbose and cache is not None:
+        info(f"Cache hits: {cache.hits}, misses: {cache.misses}.")
 
     if verbose:
-        click.echo(f"Inspected {report.count()} files.")
-        click.echo()
+        info(f"Inspected {inspected} files.")
+
+    if max_errors is not None and errors >= max_errors:
+        info(f"⚠️  Stopped after {errors} errors, remaining files were not validated.", fg="yellow")
+
+    if profile:
+        info()
+        _print_profile(profile_report, info)
+
+    if profile_output is not None:
+        timings = [t.model_dump(mode="json") for t in profile_report.timings]
+        profile_output.write_text(json.dumps({"timings": timings}, indent=2) + "\n")
+
+    if errors > 0:
+        sys.exit(1)
+
+
+def _watch(  # noqa: PLR0917
+    schema: Schema,
+    root_dir: Path,
+    output: Output,
+    executor: Executor | None,
+    chunksize: int,
+    cache: ResultCache | None,
+    interval: float,
+    info: Callable[..., None],
+) -> NoReturn:
+    live = LiveValidation(schema, root_dir, executor, chunksize, cache)
+
+    output.begin()
+
+    # watching starts first, so that files changing during a pass are picked up by the next.
+    with open_watcher(root_dir, interval) as watcher:
+        try:
+            output.write(live.validate_all())
+
+            while True:
+                output.flush()
+
+                failed = sum(1 for _ in live.report.grouped_by_path())
+                info(f"👀 {failed} files failing, watching for changes...", fg="blue")
+
+                output.write(live.revalidate(watcher.wait()))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            output.end()
+
+    sys.exit(0 if live.report.okay() else 1)
+
+
+PROFILE_SLOWEST = 10
+
+
+def _print_profile(report: ValidationReport, info: Callable[..., None]) -> None:
+    info(
+        f"{'type':<8} {'count':>8} {'total':>10} {'p50':>10} {'p95':>10} {'max':>10} {'MiB/s':>10}"
+    )
 
-    for valid_path in sorted(report.valid_paths):
-        click.secho(f"✅ {valid_path}", fg="green")
+    for type, stats in report.timing_stats().items():
+        info(
+            f"{type:<8} {stats.count:>8} {stats.seconds:>9.3f}s {stats.p50:>9.4f}s"
+            f" {stats.p95:>9.4f}s {stats.max:>9.4f}s {stats.throughput() / 2**20:>10.1f}"
+        )
 
-    if report.okay():
-        return
+    info()
+    info(f"Slowest {PROFILE_SLOWEST} files:")
 
-    click.echo()
+    for timing in report.slowest(PROFILE_SLOWEST):
+        info(f"  {timing.seconds:>9.4f}s  {timing.type:<8} {timing.path}")
 
-    for path, reasons in report.grouped_by_path():
-        click.secho(f"❗️ {path}", fg="red")
+    info()
 
-        for reason in reasons:
-            click.secho(f"     - {reason}")
 
-    sys.exit(1)
+def _exit_with_invalid_schema(e: Exception, info: Callable[..., None]) -> NoReturn:
+    info("❗️ The provided schema is invalid!", fg="red")
+    info()
+    info(e, fg="red")
+    sys.exit(127)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from fs_schema_validator.index import DirectoryIndex, IndexEntry
+from fs_schema_validator.report import ValidationReport
+
+__all__ = [
+    "CACHE_FILENAME",
+    "ResultCache",
+]
+
+CACHE_FILENAME = "results.sqlite3"
+
+# bumped whenever validators change behaviour, invalidating previously cached results.
+_CACHE_VERSION = 2
+
+
+class ResultCache:
+    """Reports of single validators persisted in SQLite, to skip files that did not change.
+
+    Entries are keyed by the validator definition, path included, and the size and mtime of
+    the file, or its content hash when `hash_contents` is set.
+    """
+
+    def __init__(self, path: Path, hash_contents: bool = False) -> None:
+        self.hash_contents = hash_contents
+        self.hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, report TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def open(cache_dir: Path, hash_contents: bool = False) -> ResultCache:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        return ResultCache(cache_dir / CACHE_FILENAME, hash_contents)
+
+    def key(
+        self, root_dir: Path, path: Path, definition: str, index: DirectoryIndex | None = None
+    ) -> str | None:
+        if index is not None:
+            entry = index.lookup(path)
+        else:
+            entry = IndexEntry.stat(root_dir / path)
+
+        # missing files are cheap to report and are never cached.
+        if entry is None:
+            return None
+
+        h = hashlib.sha256(f"{_CACHE_VERSION}\0{definition}\0{entry.size}\0".encode())
+
+        if self.hash_contents and entry.is_file():
+            with (root_dir / path).open("rb") as f:
+                h.update(hashlib.file_digest(f, "sha256").digest())
+        else:
+            h.update(str(entry.mtime_ns).encode())
+
+        return h.hexdigest()
+
+    def get(self, key: str) -> ValidationReport | None:
+        row = self._db.execute("SELECT report FROM results WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return ValidationReport.from_json(row[0])
+
+    def put(self, key: str, report: ValidationReport) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, report) VALUES (?, ?)",
+            (key, report.to_json()),
+        )
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -1,7 +1,7 @@
 import itertools
 from collections.abc import Iterator
 
-from .parser import parse_expression, parse_template
+from .parser import compile_template, parse_expression
 from .values import Bindings, EvaluationResult
 
 
@@ -11,7 +11,7 @@ def expand(
     if bindings is None:
         bindings = {}
 
-    values = parse_template(s)
+    values = compile_template(s)
 
     return (
         "".join(it)
@@ -1,7 +1,9 @@
+from functools import lru_cache
+
 from parsita import ParseError, TextParsers, lit, opt, reg, rep1, rep1sep
-from pydantic import TypeAdapter
 from sortedcontainers import SortedSet
 
+from .scanner import scan_template
 from .values import (
     Assignment,
     Binding,
@@ -16,10 +18,17 @@ from .values import (
 )
 
 __all__ = [
+    "CompiledTemplate",
     "ParseError",
+    "compile_template",
     "parse_template",
+    "parse_template_with_grammar",
 ]
 
+TEMPLATE_CACHE_SIZE = 4096
+
+CompiledTemplate = tuple[String | Expansion, ...]
+
 
 # TODO: introduce enum variants between "" to include unacceptable characters (|${}) due to parsing.
 class TemplateParsers(TextParsers):  # type: ignore[misc]
@@ -46,13 +55,29 @@ class TemplateParsers(TextParsers):  # type: ignore[misc]
     assignment = (symbol << "=" & (range | enum)) > (lambda t: (t[0], t[1]))
 
 
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(s: str) -> CompiledTemplate:
+    # values are frozen, so the same tuple can be safely shared by every caller.
+    template = scan_template(s)
+
+    if template is None:
+        template = parse_template_with_grammar(s)
+
+    return tuple(template)
+
+
 def parse_template(s: str) -> Template:
-    return TypeAdapter(Template).validate_python(TemplateParsers.template.parse(s).or_die())
+    return Template(list(compile_template(s)))
+
+
+def parse_template_with_grammar(s: str) -> Template:
+    return Template(TemplateParsers.template.parse(s).or_die())
 
 
 def parse_expression(s: str) -> Expression:
-    return TypeAdapter(Expression).validate_python(TemplateParsers.expression.parse(s).or_die())
+    expression: Expression = TemplateParsers.expression.parse(s).or_die()
+    return expression
 
 
 def parse_assignment(s: str) -> Assignment:
-    return TypeAdapter(Assignment).validate_python(TemplateParsers.assignment.parse(s).or_die())
+    return Assignment(TemplateParsers.assignment.parse(s).or_die())
@@ -0,0 +1,123 @@
+import re
+
+from sortedcontainers import SortedSet
+
+from .values import Binding, Enum, Expansion, Range, String, Template
+
+__all__ = [
+    "scan_template",
+]
+
+# NOTE: these mirror `TemplateParsers.symbol` and `TemplateParsers.range`, keep them in sync.
+_SYMBOL = re.compile(r"[a-zA-Z][a-zA-Z-_0-9]+")
+_RANGE = re.compile(r"([-+]?\d+)\.\.([-+]?\d+)")
+_UNSUPPORTED_IN_EXPANSION = re.compile(r"[{\s]")
+
+
+def scan_template(s: str) -> Template | None:
+    """Single pass scanner producing the same values as `TemplateParsers.template`.
+
+    Returns `None` whenever the template falls outside of what the scanner handles
+    (whitespace inside an expansion or malformed input), in which case the parsita grammar
+    must be used to obtain the result or the proper `ParseError`.
+    """
+
+    # parsita skips leading whitespace before every token, hence the `lstrip`.
+    if "{" not in s and "}" not in s:
+        return Template([String(s.lstrip())])
+
+    values: list[String | Expansion] = []
+    i, n = 0, len(s)
+
+    while True:
+        i = _skip_whitespace(s, i)
+
+        if i == n:
+            break
+
+        if s[i] == "}":
+            return None
+
+        if s[i] != "{":
+            end = _next_brace(s, i)
+            values.append(String(s[i:end]))
+            i = end
+            continue
+
+        if s.startswith("{{", i):
+            start = _skip_whitespace(s, i + 2)
+            end = _next_brace(s, start)
+
+            if end == start or not s.startswith("}}", end):
+                return None
+
+            values.append(String(f"{{{s[start:end]}}}"))
+            i = end + 2
+            continue
+
+        end = s.find("}", i + 1)
+        if end == -1:
+            return None
+
+        expansion = _scan_expansion(s[i + 1 : end])
+        if expansion is None:
+            return None
+
+        values.append(expansion)
+        i = end + 1
+
+    if len(values) == 0:
+        return Template([String("")])
+
+    return Template(values)
+
+
+def _scan_expansion(body: str) -> Expansion | None:
+    if _UNSUPPORTED_IN_EXPANSION.search(body) is not None:
+        return None
+
+    value: Binding | Range | Enum
+
+    if body.startswith("$"):
+        if (m := _SYMBOL.match(body, 1)) is None:
+            return None
+
+        value = Binding(m.group())
+        rest = body[m.end() :]
+    elif (m := _RANGE.match(body)) is not None:
+        value = Range(int(m[1]), int(m[2]))
+        rest = body[m.end() :]
+    else:
+        head, sep, format = body.partition(":")
+
+        if "$" in head:
+            return None
+
+        value = Enum(SortedSet(head.split("|")))
+        rest = sep + format
+
+    if len(rest) == 0:
+        return Expansion(value)
+
+    if rest[0] != ":" or len(rest) == 1:
+        return None
+
+    return Expansion(value, format=rest[1:])
+
+
+def _skip_whitespace(s: str, i: int) -> int:
+    while i < len(s) and s[i].isspace():
+        i += 1
+
+    return i
+
+
+def _next_brace(s: str, i: int) -> int:
+    end = len(s)
+
+    for brace in "{}":
+        found = s.find(brace, i)
+        if found != -1:
+            end = min(end, found)
+
+    return end
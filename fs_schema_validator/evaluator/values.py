@@ -1,15 +1,14 @@
 import enum
 from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import Any, NewType
 
-from pydantic import ConfigDict, field_validator
-from pydantic.dataclasses import dataclass
 from sortedcontainers import SortedSet
 
 from .errors import CoercionError, UnboundSymbolError
 
 
-@dataclass(frozen=True, config=ConfigDict(validate_assignment=True))
+@dataclass(frozen=True, slots=True)
 class String:
     string: str
 
@@ -30,8 +29,14 @@ class String:
     def coerce_to_string(self) -> "String":
         return self
 
+    def singletons(self) -> Iterator["String"]:
+        return iter([self])
 
-@dataclass(frozen=True, config=ConfigDict(validate_assignment=True))
+    def count(self) -> int:
+        return 1
+
+
+@dataclass(frozen=True, slots=True)
 class Binding:
     ident: str
 
@@ -56,17 +61,13 @@ class Binding:
         return f"${self.ident}"
 
 
-@dataclass(frozen=True, config=ConfigDict(validate_assignment=True, arbitrary_types_allowed=True))
+@dataclass(frozen=True, slots=True)
 class Enum:
     variants: SortedSet
 
-    @field_validator("variants", mode="before")
-    @classmethod
-    def coerce_into_sorted_set(cls, v: Any) -> Any:
-        if isinstance(v, set):
-            return SortedSet(v)
-
-        return v
+    def __post_init__(self) -> None:
+        if not isinstance(self.variants, SortedSet):
+            object.__setattr__(self, "variants", SortedSet(self.variants))
 
     def expand(
         self,
@@ -85,8 +86,14 @@ class Enum:
 
         raise CoercionError(f"cannot coerce enum {{{self}}} into String: variants > 1")
 
+    def singletons(self) -> Iterator["Enum"]:
+        return (Enum(SortedSet([v])) for v in self.variants)
+
+    def count(self) -> int:
+        return len(self.variants)
 
-@dataclass(frozen=True, config=ConfigDict(validate_assignment=True))
+
+@dataclass(frozen=True, slots=True)
 class Range:
     start: int
     end: int
@@ -103,10 +110,20 @@ class Range:
         return f"{self.start}..{self.end}"
 
     def coerce_to_string(self) -> String:
+        if self.start == self.end:
+            return String(f"{self.start}")
+
         raise CoercionError(f"cannot coerce range {{{self}}} into String")
 
+    def singletons(self) -> Iterator["Range"]:
+        # ranges of a single value keep formatting their value as a number.
+        return (Range(n, n) for n in range(self.start, self.end + 1))
+
+    def count(self) -> int:
+        return max(0, self.end - self.start + 1)
+
 
-@dataclass(frozen=True, config=ConfigDict(validate_assignment=True))
+@dataclass(frozen=True, slots=True)
 class Expansion:
     value: Binding | Range | Enum
     format: str | None = None
@@ -150,7 +167,7 @@ class Operator(enum.Enum):
     NEQ = "!="
 
 
-@dataclass(frozen=True, config=ConfigDict(validate_assignment=True))
+@dataclass(frozen=True, slots=True)
 class BooleanExpr:
     left: Binding
     op: Operator
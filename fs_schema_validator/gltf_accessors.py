@@ -0,0 +1,134 @@
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from fs_schema_validator.gltf_structure import COMPONENT_COUNTS, COMPONENT_SIZES
+
+__all__ = [
+    "check_accessors",
+]
+
+_DTYPES: dict[int, np.dtype[Any]] = {
+    5120: np.dtype("<i1"),
+    5121: np.dtype("<u1"),
+    5122: np.dtype("<i2"),
+    5123: np.dtype("<u2"),
+    5125: np.dtype("<u4"),
+    5126: np.dtype("<f4"),
+}
+
+_FLOAT = 5126
+
+
+def check_accessors(
+    document: dict[str, Any],
+    data: memoryview,
+    indices: bool = False,
+    finite: bool = False,
+    min_max: bool = False,
+) -> list[str]:
+    """Checks the contents of accessors stored in the BIN chunk of a GLB.
+
+    Accessors are read as zero-copy views over `data`, so that checks run vectorized over
+    whole accessors. Structure and bounds must have been checked beforehand. Sparse accessors
+    and accessors of buffers other than the BIN chunk are skipped.
+    """
+
+    problems = []
+    accessors = document.get("accessors", [])
+    arrays: dict[int, npt.NDArray[Any] | None] = {}
+
+    def array(i: int) -> npt.NDArray[Any] | None:
+        if i not in arrays:
+            arrays[i] = _accessor_array(document, accessors[i], data)
+
+        return arrays[i]
+
+    for i, accessor in enumerate(accessors):
+        a = array(i)
+
+        if a is None or a.size == 0:
+            continue
+
+        if finite and accessor["componentType"] == _FLOAT:
+            non_finite = a.size - np.count_nonzero(np.isfinite(a))
+
+            if non_finite > 0:
+                problems.append(f"accessors[{i}] contains {non_finite} non-finite values")
+
+        if min_max:
+            for key, actual in (("min", a.min(axis=0)), ("max", a.max(axis=0))):
+                declared = accessor.get(key)
+
+                if declared is None:
+                    continue
+
+                if (
+                    not isinstance(declared, list)
+                    or len(declared) != a.shape[1]
+                    or not all(isinstance(v, int | float) for v in declared)
+                ):
+                    problems.append(f"accessors[{i}].{key} is not an array of {a.shape[1]} numbers")
+                elif not np.allclose(actual, declared, rtol=1e-5, atol=1e-6, equal_nan=True):
+                    problems.append(
+                        f"accessors[{i}].{key} is {declared} but the data has {actual.tolist()}"
+                    )
+
+    if indices:
+        for i, mesh in enumerate(document.get("meshes", [])):
+            primitives = mesh.get("primitives", [])
+
+            # the structure check tolerates malformed optional properties, and skips them.
+            for j, primitive in enumerate(primitives if isinstance(primitives, list) else []):
+                attributes = primitive.get("attributes", {})
+
+                if "indices" not in primitive or not isinstance(attributes, dict):
+                    continue
+
+                # accessors without a buffer view are not bounds checked, e.g. for their count.
+                counts = [accessors[a].get("count") for a in attributes.values()]
+                values = array(primitive["indices"])
+
+                if (
+                    len(counts) == 0
+                    or not all(isinstance(count, int) for count in counts)
+                    or values is None
+                    or values.size == 0
+                ):
+                    continue
+
+                vertices = min(counts)
+                highest = int(values.max())
+
+                if highest >= vertices:
+                    problems.append(
+                        f"meshes[{i}].primitives[{j}].indices refers to vertex {highest} but attributes have {vertices} vertices"
+                    )
+
+    return problems
+
+
+def _accessor_array(
+    document: dict[str, Any], accessor: dict[str, Any], data: memoryview
+) -> npt.NDArray[Any] | None:
+    if "bufferView" not in accessor or "sparse" in accessor:
+        return None
+
+    view = document["bufferViews"][accessor["bufferView"]]
+    buffer = document["buffers"][view["buffer"]]
+
+    if view["buffer"] != 0 or "uri" in buffer:
+        return None
+
+    dtype = _DTYPES[accessor["componentType"]]
+    components = COMPONENT_COUNTS[accessor["type"]]
+    element_size = components * COMPONENT_SIZES[accessor["componentType"]]
+
+    return np.ndarray(
+        shape=(accessor["count"], components),
+        dtype=dtype,
+        buffer=data,
+        offset=view.get("byteOffset", 0) + accessor.get("byteOffset", 0),
+        strides=(view.get("byteStride", element_size), dtype.itemsize),
+    )
@@ -0,0 +1,335 @@
+import io
+import json
+import os
+import struct
+from collections.abc import Callable
+from typing import IO, Any, NamedTuple, TypeGuard
+
+__all__ = [
+    "GlbChunks",
+    "GlbError",
+    "check_structure",
+    "read_glb",
+    "stream_size",
+]
+
+_GLB_MAGIC = b"glTF"
+_GLB_HEADER = struct.Struct("<4sII")
+_CHUNK_HEADER = struct.Struct("<II")
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+
+COMPONENT_SIZES = {5120: 1, 5121: 1, 5122: 2, 5123: 2, 5125: 4, 5126: 4}
+COMPONENT_COUNTS = {
+    "SCALAR": 1,
+    "VEC2": 2,
+    "VEC3": 3,
+    "VEC4": 4,
+    "MAT2": 4,
+    "MAT3": 9,
+    "MAT4": 16,
+}
+
+
+class GlbError(ValueError):
+    pass
+
+
+class GlbChunks(NamedTuple):
+    document: Any
+    # offset of the BIN chunk data from the start of the file.
+    bin_offset: int | None
+    bin_length: int | None
+
+
+def read_glb(f: IO[bytes], size: int | None = None) -> GlbChunks:
+    """Reads the header and JSON chunk of a GLB, leaving the BIN chunk unread.
+
+    Chunk lengths are only checked against the actual file length when `size` is known.
+    """
+
+    header = f.read(_GLB_HEADER.size)
+
+    if len(header) < _GLB_HEADER.size:
+        raise GlbError("truncated header")
+
+    magic, version, length = _GLB_HEADER.unpack(header)
+
+    if magic != _GLB_MAGIC:
+        raise GlbError("not a glb file")
+
+    if version != 2:
+        raise GlbError(f"unsupported version {version}")
+
+    if size is not None and length != size:
+        raise GlbError(f"header declares {length} bytes but the file is {size} bytes long")
+
+    json_length, json_type = _read_chunk_header(f)
+
+    if json_type != _CHUNK_JSON:
+        raise GlbError("first chunk is not a JSON chunk")
+
+    offset = _GLB_HEADER.size + _CHUNK_HEADER.size + json_length
+
+    if offset > length:
+        raise GlbError("JSON chunk exceeds the declared length")
+
+    data = f.read(json_length)
+
+    if len(data) < json_length:
+        raise GlbError("truncated JSON chunk")
+
+    try:
+        document = json.loads(data)
+    except ValueError as ex:
+        raise GlbError(f"invalid JSON chunk: {ex}") from ex
+
+    if offset == length:
+        return GlbChunks(document, bin_offset=None, bin_length=None)
+
+    bin_length, bin_type = _read_chunk_header(f)
+
+    if bin_type != _CHUNK_BIN:
+        raise GlbError("second chunk is not a BIN chunk")
+
+    bin_offset = offset + _CHUNK_HEADER.size
+
+    if bin_offset + bin_length > length:
+        raise GlbError("BIN chunk exceeds the declared length")
+
+    return GlbChunks(document, bin_offset, bin_length)
+
+
+def stream_size(f: IO[bytes]) -> int | None:
+    if isinstance(f, io.BytesIO):
+        # e.g. contents shared between validators of the same file, `getvalue` does not copy them.
+        return len(f.getvalue())
+
+    try:
+        return os.fstat(f.fileno()).st_size
+    except OSError:
+        # e.g. members of an archive.
+        return None
+
+
+def check_structure(
+    document: Any, bin_length: int | None = None, check_bounds: bool = False
+) -> list[str]:
+    """Checks that indices between top level arrays of a glTF document are consistent.
+
+    With `check_bounds`, buffer views and accessors must also fit in their buffers, the first
+    buffer of a GLB without an `uri` being its BIN chunk.
+    """
+
+    if not isinstance(document, dict):
+        return ["root is not an object"]
+
+    problems: list[str] = []
+    arrays = {
+        key: _array(document, key, problems)
+        for key in (
+            "accessors",
+            "bufferViews",
+            "buffers",
+            "cameras",
+            "images",
+            "materials",
+            "meshes",
+            "nodes",
+            "samplers",
+            "scenes",
+            "skins",
+            "textures",
+        )
+    }
+
+    for key, array in arrays.items():
+        for i, element in enumerate(array):
+            if not isinstance(element, dict):
+                problems.append(f"{key}[{i}] is not an object")
+
+    def check_index(where: str, value: Any, target: str) -> None:
+        if not _is_index(value) or value >= len(arrays[target]):
+            problems.append(f"{where} is not a valid index into {target} (got {value!r})")
+
+    asset = document.get("asset")
+
+    if not isinstance(asset, dict) or not isinstance(asset.get("version"), str):
+        problems.append("asset.version is missing")
+
+    if len(arrays["nodes"]) == 0:
+        problems.append("file does not contain nodes")
+
+    if "scene" in document:
+        check_index("scene", document["scene"], "scenes")
+
+    for i, scene in _objects(arrays, "scenes"):
+        for j, node in enumerate(_list(scene.get("nodes"))):
+            check_index(f"scenes[{i}].nodes[{j}]", node, "nodes")
+
+    for i, node in _objects(arrays, "nodes"):
+        for j, child in enumerate(_list(node.get("children"))):
+            check_index(f"nodes[{i}].children[{j}]", child, "nodes")
+
+        for key, target in (("mesh", "meshes"), ("skin", "skins"), ("camera", "cameras")):
+            if key in node:
+                check_index(f"nodes[{i}].{key}", node[key], target)
+
+    for i, mesh in _objects(arrays, "meshes"):
+        for j, primitive in enumerate(_list(mesh.get("primitives"))):
+            where = f"meshes[{i}].primitives[{j}]"
+
+            if not isinstance(primitive, dict):
+                problems.append(f"{where} is not an object")
+                continue
+
+            attributes = [("attributes", primitive.get("attributes"))] + [
+                (f"targets[{k}]", target)
+                for k, target in enumerate(_list(primitive.get("targets")))
+            ]
+
+            for name, accessors in attributes:
+                for attribute, accessor in _dict(accessors).items():
+                    check_index(f"{where}.{name}.{attribute}", accessor, "accessors")
+
+            if "indices" in primitive:
+                check_index(f"{where}.indices", primitive["indices"], "accessors")
+
+            if "material" in primitive:
+                check_index(f"{where}.material", primitive["material"], "materials")
+
+    for i, skin in _objects(arrays, "skins"):
+        for j, joint in enumerate(_list(skin.get("joints"))):
+            check_index(f"skins[{i}].joints[{j}]", joint, "nodes")
+
+        if "inverseBindMatrices" in skin:
+            check_index(f"skins[{i}].inverseBindMatrices", skin["inverseBindMatrices"], "accessors")
+
+    for i, texture in _objects(arrays, "textures"):
+        for key, target in (("source", "images"), ("sampler", "samplers")):
+            if key in texture:
+                check_index(f"textures[{i}].{key}", texture[key], target)
+
+    for key in ("accessors", "images"):
+        for i, obj in _objects(arrays, key):
+            if "bufferView" in obj:
+                check_index(f"{key}[{i}].bufferView", obj["bufferView"], "bufferViews")
+
+    for i, view in _objects(arrays, "bufferViews"):
+        check_index(f"bufferViews[{i}].buffer", view.get("buffer"), "buffers")
+
+    if check_bounds and len(problems) == 0:
+        _check_bounds(arrays, bin_length, problems.append)
+
+    return problems
+
+
+def _check_bounds(
+    arrays: dict[str, list[Any]], bin_length: int | None, report: Callable[[str], None]
+) -> None:
+    buffers = arrays["buffers"]
+    views = arrays["bufferViews"]
+
+    for i, buffer in _objects(arrays, "buffers"):
+        length = buffer.get("byteLength")
+
+        if not _is_index(length):
+            report(f"buffers[{i}].byteLength is not a valid length (got {length!r})")
+        elif i == 0 and "uri" not in buffer:
+            if bin_length is None:
+                report("buffers[0] has no uri and there is no BIN chunk")
+            # the BIN chunk is padded to 4 bytes.
+            elif not bin_length - 3 <= length <= bin_length:
+                report(f"buffers[0].byteLength is {length} but the BIN chunk is {bin_length} bytes")
+
+    for i, view in _objects(arrays, "bufferViews"):
+        offset = view.get("byteOffset", 0)
+        length = view.get("byteLength")
+
+        if not _is_index(offset) or not _is_index(length):
+            report(f"bufferViews[{i}] has an invalid byteOffset or byteLength")
+            continue
+
+        buffer = buffers[view["buffer"]]
+        buffer_length = buffer.get("byteLength") if isinstance(buffer, dict) else None
+
+        if _is_index(buffer_length) and offset + length > buffer_length:
+            report(
+                f"bufferViews[{i}] ends at byte {offset + length} past buffers[{view['buffer']}] ({buffer_length} bytes)"
+            )
+
+    for i, accessor in _objects(arrays, "accessors"):
+        if "bufferView" not in accessor:
+            continue
+
+        components = _lookup(COMPONENT_COUNTS, accessor.get("type"))
+        component_size = _lookup(COMPONENT_SIZES, accessor.get("componentType"))
+        offset = accessor.get("byteOffset", 0)
+        count = accessor.get("count")
+
+        if components is None or component_size is None:
+            report(f"accessors[{i}] has an invalid type or componentType")
+            continue
+
+        if not _is_index(offset) or not _is_index(count):
+            report(f"accessors[{i}] has an invalid byteOffset or count")
+            continue
+
+        view = views[accessor["bufferView"]]
+
+        if count == 0 or not isinstance(view, dict) or not _is_index(view.get("byteLength")):
+            continue
+
+        element_size = components * component_size
+        stride = view.get("byteStride", element_size)
+
+        if not _is_index(stride):
+            continue
+
+        end = offset + stride * (count - 1) + element_size
+
+        if end > view["byteLength"]:
+            report(
+                f"accessors[{i}] ends at byte {end} past bufferViews[{accessor['bufferView']}] ({view['byteLength']} bytes)"
+            )
+
+
+def _read_chunk_header(f: IO[bytes]) -> tuple[int, int]:
+    header = f.read(_CHUNK_HEADER.size)
+
+    if len(header) < _CHUNK_HEADER.size:
+        raise GlbError("truncated chunk header")
+
+    length, chunk_type = _CHUNK_HEADER.unpack(header)
+
+    return length, chunk_type
+
+
+def _array(document: dict[str, Any], key: str, problems: list[str]) -> list[Any]:
+    value = document.get(key, [])
+
+    if not isinstance(value, list):
+        problems.append(f"{key} is not an array")
+        return []
+
+    return value
+
+
+def _objects(arrays: dict[str, list[Any]], key: str) -> list[tuple[int, dict[str, Any]]]:
+    return [(i, obj) for i, obj in enumerate(arrays[key]) if isinstance(obj, dict)]
+
+
+def _list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _lookup(table: dict[Any, int], key: Any) -> int | None:
+    return table.get(key) if isinstance(key, str | int) else None
+
+
+def _is_index(value: Any) -> TypeGuard[int]:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import stat
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+__all__ = [
+    "DirectoryIndex",
+    "IndexEntry",
+]
+
+
+class IndexEntry(NamedTuple):
+    mode: int
+    size: int
+    mtime_ns: int
+
+    @staticmethod
+    def from_stat(st: os.stat_result) -> IndexEntry:
+        return IndexEntry(mode=st.st_mode, size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+    @staticmethod
+    def stat(path: Path) -> IndexEntry | None:
+        try:
+            return IndexEntry.from_stat(path.stat())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def is_file(self) -> bool:
+        return stat.S_ISREG(self.mode)
+
+    def is_dir(self) -> bool:
+        return stat.S_ISDIR(self.mode)
+
+
+class DirectoryIndex:
+    """Metadata of everything under `root_dir`, gathered by walking it once with `os.scandir`.
+
+    Lookups for paths that are not indexed (created after the scan, or below a symlinked
+    directory, which is not followed) fall back to a `stat` syscall.
+    """
+
+    def __init__(self, root_dir: Path, entries: dict[str, IndexEntry]) -> None:
+        self.root_dir = root_dir
+        self.entries = entries
+
+    @staticmethod
+    def scan(root_dir: Path) -> DirectoryIndex:
+        entries: dict[str, IndexEntry] = {}
+        pending = [""]
+
+        while pending:
+            prefix = pending.pop()
+
+            with os.scandir(root_dir / prefix) as it:
+                for entry in it:
+                    path = f"{prefix}{entry.name}"
+
+                    try:
+                        entries[path] = IndexEntry.from_stat(entry.stat())
+                    except OSError:
+                        # dangling symlinks do not exist as far as validators are concerned.
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(f"{path}/")
+
+        return DirectoryIndex(root_dir, entries)
+
+    def restrict(self, paths: Iterable[Path]) -> DirectoryIndex:
+        entries = {}
+
+        for path in paths:
+            key = path.as_posix()
+
+            if (entry := self.entries.get(key)) is not None:
+                entries[key] = entry
+
+        return DirectoryIndex(self.root_dir, entries)
+
+    def lookup(self, path: Path) -> IndexEntry | None:
+        entry = self.entries.get(path.as_posix())
+
+        if entry is not None:
+            return entry
+
+        return IndexEntry.stat(self.root_dir / path)
+
+    def exists(self, path: Path) -> bool:
+        return self.lookup(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,213 @@
+import re
+from collections.abc import Iterator
+from typing import TextIO
+
+__all__ = [
+    "JsonContainerReader",
+    "JsonSyntaxError",
+]
+
+_STRING_PATTERN = r'"(?:[^"\\]++|\\.)*+"'
+_SCALAR_PATTERN = r'[^,:\[\]{}"\s]++'
+_FLAT_PATTERN = (
+    rf'(?:\[(?:[^\[\]{{}}"]++|{_STRING_PATTERN})*+\]|\{{(?:[^\[\]{{}}"]++|{_STRING_PATTERN})*+\}})'
+)
+_SHALLOW_PATTERN = (
+    rf'(?:[\[{{](?:[^\[\]{{}}"]++|{_STRING_PATTERN}|{_FLAT_PATTERN})*+[\]}}]'
+    rf"|{_STRING_PATTERN}|{_SCALAR_PATTERN})"
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(_STRING_PATTERN, re.DOTALL)
+_SCALAR = re.compile(_SCALAR_PATTERN)
+# a lone `"` is an unterminated string: more input is needed before scanning further.
+_TOKEN = re.compile(rf'{_STRING_PATTERN}|["\[\]{{}}]', re.DOTALL)
+# fast paths matching a complete member nested at most two levels deep, and its delimiter.
+# brackets are not required to pair up, pydantic reports invalid members when validating them.
+_ITEM = re.compile(rf"[ \t\n\r]*({_SHALLOW_PATTERN})[ \t\n\r]*([,\]])", re.DOTALL)
+_ENTRY = re.compile(
+    rf"[ \t\n\r]*({_STRING_PATTERN})[ \t\n\r]*:[ \t\n\r]*({_SHALLOW_PATTERN})[ \t\n\r]*([,}}])",
+    re.DOTALL,
+)
+
+
+class JsonSyntaxError(ValueError):
+    pass
+
+
+class JsonContainerReader:
+    """Splits a top level JSON array or object into the raw text of its members.
+
+    Only the member being scanned is kept in memory, members themselves are not decoded.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = 1 << 20) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._consumed = 0
+        self._eof = False
+
+    def open_container(self) -> str | None:
+        c = self._peek()
+
+        if c in ("[", "{"):
+            self._pos += 1
+            return c
+
+        return None
+
+    def items(self) -> Iterator[str]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            while (m := _ITEM.match(self._buf, self._pos)) is not None:
+                self._pos = m.end()
+                yield m[1]
+
+                if m[2] == "]":
+                    return
+
+            yield self._value()
+
+            if self._expect(",]") == "]":
+                return
+
+    def entries(self) -> Iterator[tuple[str, str]]:
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            while (m := _ENTRY.match(self._buf, self._pos)) is not None:
+                self._pos = m.end()
+                yield m[1], m[2]
+
+                if m[3] == "}":
+                    return
+
+            if self._peek() != '"':
+                raise JsonSyntaxError(f"expected a string key at offset {self._offset()}")
+
+            key = self._value()
+            self._expect(":")
+
+            yield key, self._value()
+
+            if self._expect(",}") == "}":
+                return
+
+    def rest(self) -> str:
+        while self._fill():
+            pass
+
+        return self._buf[self._pos :]
+
+    def finish(self) -> None:
+        if self._peek() != "":
+            raise JsonSyntaxError(f"trailing characters at offset {self._offset()}")
+
+    def _value(self) -> str:
+        c = self._peek()
+
+        if c == "":
+            raise JsonSyntaxError("unexpected end of input")
+
+        # members are complete at this point, drop them before buffering the next one.
+        if self._pos >= self._chunk_size:
+            self._consumed += self._pos
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+
+        start = self._pos
+
+        if c in "[{":
+            end = self._container_end(start)
+        elif c == '"':
+            while (m := _STRING.match(self._buf, start)) is None:
+                if not self._fill():
+                    raise JsonSyntaxError(f"unterminated string at offset {self._offset()}")
+
+            end = m.end()
+        else:
+            m = _SCALAR.match(self._buf, start)
+
+            while m is not None and m.end() == len(self._buf) and self._fill():
+                m = _SCALAR.match(self._buf, start)
+
+            if m is None:
+                raise JsonSyntaxError(f"unexpected character {c!r} at offset {self._offset()}")
+
+            end = m.end()
+
+        self._pos = end
+        return self._buf[start:end]
+
+    def _container_end(self, start: int) -> int:
+        depth = 0
+        scan = start
+
+        while True:
+            for m in _TOKEN.finditer(self._buf, scan):
+                lexeme = m.group()
+
+                if lexeme == '"':
+                    scan = m.start()
+                    break
+
+                if lexeme in "[{":
+                    depth += 1
+                elif lexeme in "]}":
+                    depth -= 1
+
+                    if depth == 0:
+                        return m.end()
+
+                scan = m.end()
+            else:
+                scan = len(self._buf)
+
+            if not self._fill():
+                raise JsonSyntaxError("unexpected end of input")
+
+    def _peek(self) -> str:
+        while True:
+            m = _WHITESPACE.match(self._buf, self._pos)
+            assert m is not None
+            self._pos = m.end()
+
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        c = self._peek()
+
+        if c == "" or c not in chars:
+            expected = " or ".join(f"`{char}`" for char in chars)
+            raise JsonSyntaxError(f"expected {expected} at offset {self._offset()}")
+
+        self._pos += 1
+        return c
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        # reads grow with the buffered member, keeping the buffering of huge members linear.
+        chunk = self._f.read(max(self._chunk_size, len(self._buf) - self._pos))
+
+        if len(chunk) == 0:
+            self._eof = True
+            return False
+
+        self._buf += chunk
+        return True
+
+    def _offset(self) -> int:
+        return self._consumed + self._pos
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from pathlib import Path
+
+from pydantic import BaseModel, NonNegativeInt, model_validator
+
+from fs_schema_validator import evaluator
+from fs_schema_validator.evaluator.values import Bindings
+from fs_schema_validator.index import DirectoryIndex
+from fs_schema_validator.report import ValidationReport
+
+__all__ = [
+    "PathMatch",
+    "PathMatcher",
+    "glob_to_regex",
+]
+
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+class PathMatch(BaseModel, extra="forbid"):
+    glob: str | None = None
+    regex: str | None = None
+    min: NonNegativeInt = 0
+    max: NonNegativeInt | None = None
+
+    @model_validator(mode="after")
+    def check_single_pattern(self) -> PathMatch:
+        if (self.glob is None) == (self.regex is None):
+            raise ValueError("exactly one of `glob` and `regex` must be specified")
+
+        if self.max is not None and self.max < self.min:
+            raise ValueError("`max` cannot be lower than `min`")
+
+        try:
+            re.compile(self.to_regex())
+        except re.error as e:
+            raise ValueError(f"invalid {'glob' if self.glob is not None else 'regex'}: {e}") from e
+
+        return self
+
+    def pattern(self) -> str:
+        pattern = self.glob if self.glob is not None else self.regex
+        assert pattern is not None
+
+        return pattern
+
+    def to_regex(self) -> str:
+        if self.glob is not None:
+            return glob_to_regex(self.glob)
+
+        return self.pattern()
+
+    def expand(self, bindings: Bindings) -> PathMatch:
+        pattern = list(evaluator.expand(self.pattern(), bindings))
+        assert len(pattern) == 1, (
+            "cannot expand to more than one variant when dealing with match patterns and a validator's inner bindings"
+        )
+
+        if self.glob is not None:
+            return self.model_copy(update={"glob": pattern[0]})
+
+        return self.model_copy(update={"regex": pattern[0]})
+
+    def check_count(self, count: int, report: ValidationReport) -> None:
+        if count < self.min:
+            report.append(
+                path=Path(self.pattern()),
+                reason=f"matched {count} files, expected at least {self.min}",
+            )
+        elif self.max is not None and count > self.max:
+            report.append(
+                path=Path(self.pattern()),
+                reason=f"matched {count} files, expected at most {self.max}",
+            )
+
+
+class PathMatcher:
+    """Resolves many `match` patterns against a directory index in a single pass.
+
+    Patterns are combined into one alternation so that paths matching none of them, usually
+    the vast majority, cost a single regex match.
+    """
+
+    def __init__(self, matches: Sequence[PathMatch]) -> None:
+        self.patterns = [re.compile(m.to_regex()) for m in matches]
+
+        # capturing groups would be renumbered in the alternation, breaking backreferences,
+        # and global inline flags are only allowed at the start of a regex.
+        combinable = [
+            i
+            for i, p in enumerate(self.patterns)
+            if p.groups == 0 and _GLOBAL_FLAGS.match(p.pattern) is None
+        ]
+        self.combined = re.compile(
+            "|".join(f"(?:{self.patterns[i].pattern})" for i in combinable) or r"(?!)"
+        )
+        self.uncombined = [i for i in range(len(self.patterns)) if i not in set(combinable)]
+
+    def resolve(self, index: DirectoryIndex) -> list[list[Path]]:
+        matched: list[list[Path]] = [[] for _ in self.patterns]
+
+        for key in sorted(index):
+            if not index.entries[key].is_file():
+                continue
+
+            if self.combined.fullmatch(key) is not None:
+                candidates: Sequence[int] = range(len(self.patterns))
+            elif len(self.uncombined) > 0:
+                candidates = self.uncombined
+            else:
+                continue
+
+            for i in candidates:
+                if self.patterns[i].fullmatch(key) is not None:
+                    matched[i].append(Path(key))
+
+        return matched
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translates a glob to a regex matching posix paths relative to the root dir.
+
+    `*`, `?` and `[...]` never match `/`, while a `**` segment matches any number of
+    directories.
+    """
+
+    segments = glob.split("/")
+    parts = []
+
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+
+        if segment == "**":
+            parts.append(".+" if last else "(?:[^/]+/)*")
+            continue
+
+        parts.append(_translate_segment(segment))
+
+        if not last:
+            parts.append("/")
+
+    return "".join(parts)
+
+
+def _translate_segment(segment: str) -> str:
+    parts = []
+    i = 0
+
+    while i < len(segment):
+        c = segment[i]
+        i += 1
+
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[" and (end := segment.find("]", _class_body_start(segment, i))) != -1:
+            body = segment[i:end]
+            i = end + 1
+
+            body = body.replace("\\", "\\\\").replace("[", "\\[").replace("]", "\\]")
+
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+
+            parts.append(f"(?!/)[{body}]")
+        else:
+            parts.append(re.escape(c))
+
+    return "".join(parts)
+
+
+def _class_body_start(segment: str, i: int) -> int:
+    # like fnmatch, a `]` right after `[` or `[!` is part of the class rather than its end.
+    if segment.startswith("!", i):
+        i += 1
+
+    if segment.startswith("]", i):
+        i += 1
+
+    return i
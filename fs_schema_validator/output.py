@@ -0,0 +1,155 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, Protocol
+from xml.sax.saxutils import escape, quoteattr
+
+import click
+
+from fs_schema_validator.report import ValidationReport
+
+__all__ = [
+    "FORMATS",
+    "JsonlOutput",
+    "JunitOutput",
+    "Output",
+    "TextOutput",
+]
+
+
+class Output(Protocol):
+    """Renders reports incrementally, as validators complete."""
+
+    def begin(self) -> None: ...
+
+    def write(self, report: ValidationReport) -> None: ...
+
+    def flush(self) -> None:
+        """Writes results held back to be merged with the next report."""
+
+    def end(self) -> None: ...
+
+
+class TextOutput:
+    def __init__(self, file: IO[str] | None = None) -> None:
+        self.file = file
+
+    def begin(self) -> None:
+        pass
+
+    def write(self, report: ValidationReport) -> None:
+        for valid_path in report.valid_paths:
+            click.secho(f"✅ {valid_path}", fg="green", file=self.file)
+
+        for path, reasons in report.grouped_by_path():
+            click.secho(f"❗️ {path}", fg="red", file=self.file)
+
+            for reason in reasons:
+                click.secho(f"     - {reason}", file=self.file)
+
+    def flush(self) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+class JsonlOutput:
+    """One JSON object per line and path, e.g. `{"path": "a.png", "errors": []}`.
+
+    Results of the validators of a path are merged as long as they come one after the other,
+    as they do for the grouped validators of a `Schema`.
+    """
+
+    def __init__(self, file: IO[str] | None = None) -> None:
+        self.file = file
+        self.paths = _MergedPaths(self._write_path)
+
+    def begin(self) -> None:
+        pass
+
+    def write(self, report: ValidationReport) -> None:
+        self.paths.add(report)
+
+    def flush(self) -> None:
+        self.paths.flush()
+
+    def end(self) -> None:
+        self.paths.flush()
+
+    def _write_path(self, path: Path, reasons: list[str]) -> None:
+        click.echo(json.dumps({"path": str(path), "errors": reasons}), file=self.file)
+
+
+class JunitOutput:
+    """A JUnit XML test suite with one test case per path.
+
+    Totals are unknown until the end and left for consumers to count, as the suite is written
+    as results come. A path fails as soon as one of its validators reported an error, results
+    being merged like in `JsonlOutput`.
+    """
+
+    def __init__(self, file: IO[str] | None = None) -> None:
+        self.file = file
+        self.paths = _MergedPaths(self._write_path)
+
+    def begin(self) -> None:
+        click.echo('<?xml version="1.0" encoding="UTF-8"?>', file=self.file)
+        click.echo('<testsuite name="fs-schema-validator">', file=self.file)
+
+    def write(self, report: ValidationReport) -> None:
+        self.paths.add(report)
+
+    def flush(self) -> None:
+        self.paths.flush()
+
+    def end(self) -> None:
+        self.paths.flush()
+        click.echo("</testsuite>", file=self.file)
+
+    def _write_path(self, path: Path, reasons: list[str]) -> None:
+        if len(reasons) == 0:
+            click.echo(f"  <testcase name={quoteattr(str(path))} />", file=self.file)
+            return
+
+        click.echo(f"  <testcase name={quoteattr(str(path))}>", file=self.file)
+        click.echo(
+            f"    <failure message={quoteattr(reasons[0])}>"
+            f"{escape(chr(10).join(reasons))}</failure>",
+            file=self.file,
+        )
+        click.echo("  </testcase>", file=self.file)
+
+
+class _MergedPaths:
+    """Merges the results of a path across consecutive reports, until another path comes."""
+
+    def __init__(self, write: Callable[[Path, list[str]], None]) -> None:
+        self.write = write
+        self.pending: tuple[Path, list[str]] | None = None
+
+    def add(self, report: ValidationReport) -> None:
+        # e.g. empty files are both marked as ok and reported as empty by `file` validators.
+        results: dict[Path, list[str]] = {path: [] for path in report.valid_paths}
+
+        for path, reasons in report.grouped_by_path():
+            results.setdefault(path, []).extend(reasons)
+
+        for path, reasons in results.items():
+            if self.pending is not None and self.pending[0] == path:
+                self.pending[1].extend(reasons)
+            else:
+                self.flush()
+                self.pending = (path, reasons)
+
+    def flush(self) -> None:
+        if self.pending is not None:
+            self.write(*self.pending)
+            self.pending = None
+
+
+FORMATS: dict[str, Callable[[], Output]] = {
+    "text": TextOutput,
+    "jsonl": JsonlOutput,
+    "junit": JunitOutput,
+}
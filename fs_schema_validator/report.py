@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Iterator
+import json
+import math
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
 
 
 class ValidationError(BaseModel):
@@ -14,35 +19,253 @@ class ValidationError(BaseModel):
     reason: str
 
 
-class ValidationReport(BaseModel):
-    errors: list[ValidationError] = Field(default_factory=list)
-    valid_paths: list[Path] = Field(default_factory=list)
+class ValidatorTiming(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    path: Path
+    type: str
+    seconds: float
+    # on-disk size of the validated file, validators may read less of it.
+    size: int
+
+
+class TimingStats(BaseModel):
+    count: int
+    seconds: float
+    p50: float
+    p95: float
+    max: float
+    size: int
+
+    def throughput(self) -> float:
+        """Bytes per second."""
+
+        return self.size / self.seconds if self.seconds > 0 else math.inf
+
+
+class ValidationReport:
+    """Results of a validation run, stored column-wise.
+
+    Paths and reasons are interned into tables and results only hold their ids, so that reports
+    of millions of files stay compact and cheap to merge. `errors` and `valid_paths` are built
+    on access.
+    """
+
+    __slots__ = (
+        "_error_paths",
+        "_error_reasons",
+        "_path_ids",
+        "_paths",
+        "_reason_ids",
+        "_reasons",
+        "_valid_paths",
+        "timings",
+    )
+
+    def __init__(
+        self,
+        errors: Iterable[ValidationError] = (),
+        valid_paths: Iterable[Path] = (),
+        timings: Iterable[ValidatorTiming] = (),
+    ) -> None:
+        self._paths: list[Path] = []
+        # keyed by string, hashing a `Path` is several times slower and not cached.
+        self._path_ids: dict[str, int] = {}
+        self._reasons: list[str] = []
+        self._reason_ids: dict[str, int] = {}
+        self._error_paths = array("I")
+        self._error_reasons = array("I")
+        self._valid_paths = array("I")
+        self.timings: list[ValidatorTiming] = list(timings)
+
+        for error in errors:
+            self.append(error.path, error.reason)
+
+        for path in valid_paths:
+            self.mark_file_as_ok(path)
+
+    @property
+    def errors(self) -> list[ValidationError]:
+        return [
+            ValidationError(path=self._paths[p], reason=self._reasons[r])
+            for p, r in zip(self._error_paths, self._error_reasons, strict=True)
+        ]
+
+    @property
+    def valid_paths(self) -> list[Path]:
+        return [self._paths[p] for p in self._valid_paths]
 
     def append(self, path: Path, reason: str) -> None:
-        self.errors.append(ValidationError(path=path, reason=reason))
+        self._error_paths.append(self._path_id(path))
+        self._error_reasons.append(self._reason_id(reason))
 
     def append_missing_file(self, path: Path) -> None:
         self.append(path=path, reason="does not exist")
 
     def grouped_by_path(self) -> Iterator[tuple[Path, list[str]]]:
-        sorted_by_path = sorted(self.errors, key=lambda e: e.path)
+        # sorting is stable, reasons of a path keep the order they were reported in.
+        order = sorted(
+            range(len(self._error_paths)), key=lambda i: self._paths[self._error_paths[i]]
+        )
 
         return (
-            (path, [e.reason for e in errors])
-            for path, errors in itertools.groupby(sorted_by_path, lambda e: e.path)
+            (self._paths[path], [self._reasons[self._error_reasons[i]] for i in errors])
+            for path, errors in itertools.groupby(order, lambda i: self._error_paths[i])
         )
 
     def mark_file_as_ok(self, path: Path) -> None:
-        self.valid_paths.append(path)
+        self._valid_paths.append(self._path_id(path))
+
+    def record_timing(self, path: Path, type: str, seconds: float, size: int) -> None:
+        self.timings.append(ValidatorTiming(path=path, type=type, seconds=seconds, size=size))
+
+    def timing_stats(self) -> dict[str, TimingStats]:
+        by_type: dict[str, list[ValidatorTiming]] = defaultdict(list)
+
+        for timing in self.timings:
+            by_type[timing.type].append(timing)
+
+        return {type: _timing_stats(timings) for type, timings in sorted(by_type.items())}
+
+    def slowest(self, n: int) -> list[ValidatorTiming]:
+        return sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:n]
 
     def count(self) -> int:
-        return len(self.errors) + len(self.valid_paths)
+        return len(self._error_paths) + len(self._valid_paths)
+
+    def error_count(self) -> int:
+        return len(self._error_paths)
 
     def okay(self) -> bool:
-        return len(self.errors) == 0
+        return len(self._error_paths) == 0
+
+    def extend(self, other: ValidationReport) -> None:
+        paths = [self._path_id(path) for path in other._paths]
+        reasons = [self._reason_id(reason) for reason in other._reasons]
+
+        self._error_paths.extend(paths[p] for p in other._error_paths)
+        self._error_reasons.extend(reasons[r] for r in other._error_reasons)
+        self._valid_paths.extend(paths[p] for p in other._valid_paths)
+        self.timings.extend(other.timings)
+
+    def discard(self, paths: Iterable[Path]) -> None:
+        """Removes every result of `paths`, and of members of archives among them."""
+
+        keys = {str(path) for path in paths}
+        removed = {
+            i
+            for i, path in enumerate(self._paths)
+            if str(path) in keys or any(str(parent) in keys for parent in path.parents)
+        }
+
+        if len(removed) == 0:
+            return
+
+        kept = [i for i, p in enumerate(self._error_paths) if p not in removed]
+        self._error_paths = array("I", [self._error_paths[i] for i in kept])
+        self._error_reasons = array("I", [self._error_reasons[i] for i in kept])
+        self._valid_paths = array("I", [p for p in self._valid_paths if p not in removed])
+        self.timings = [t for t in self.timings if self._path_ids.get(str(t.path)) not in removed]
 
     def merge(self, other: ValidationReport) -> ValidationReport:
-        return ValidationReport(
-            errors=self.errors + other.errors,
-            valid_paths=self.valid_paths + other.valid_paths,
+        merged = ValidationReport()
+        merged.extend(self)
+        merged.extend(other)
+
+        return merged
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "paths": [str(path) for path in self._paths],
+                "reasons": self._reasons,
+                "error_paths": self._error_paths.tolist(),
+                "error_reasons": self._error_reasons.tolist(),
+                "valid_paths": self._valid_paths.tolist(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> ValidationReport:
+        columns = json.loads(data)
+        report = cls()
+        report._set_tables([Path(path) for path in columns["paths"]], columns["reasons"])
+        report._error_paths.extend(columns["error_paths"])
+        report._error_reasons.extend(columns["error_reasons"])
+        report._valid_paths.extend(columns["valid_paths"])
+
+        return report
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidationReport):
+            return NotImplemented
+
+        return (
+            self.errors == other.errors
+            and self.valid_paths == other.valid_paths
+            and self.timings == other.timings
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ValidationReport(errors={self.errors!r}, valid_paths={self.valid_paths!r})"
+
+    # lookup tables are rebuilt rather than pickled, halving what workers send back.
+    def __getstate__(self) -> tuple[Any, ...]:
+        return (
+            self._paths,
+            self._reasons,
+            self._error_paths,
+            self._error_reasons,
+            self._valid_paths,
+            self.timings,
+        )
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        paths, reasons, self._error_paths, self._error_reasons, self._valid_paths, self.timings = (
+            state
         )
+        self._set_tables(paths, reasons)
+
+    def _set_tables(self, paths: list[Path], reasons: list[str]) -> None:
+        self._paths = paths
+        self._path_ids = {str(path): i for i, path in enumerate(paths)}
+        self._reasons = reasons
+        self._reason_ids = {reason: i for i, reason in enumerate(reasons)}
+
+    def _path_id(self, path: Path) -> int:
+        id = self._path_ids.setdefault(str(path), len(self._paths))
+
+        if id == len(self._paths):
+            self._paths.append(path)
+
+        return id
+
+    def _reason_id(self, reason: str) -> int:
+        id = self._reason_ids.setdefault(reason, len(self._reasons))
+
+        if id == len(self._reasons):
+            self._reasons.append(reason)
+
+        return id
+
+
+def _timing_stats(timings: list[ValidatorTiming]) -> TimingStats:
+    seconds = sorted(t.seconds for t in timings)
+
+    return TimingStats(
+        count=len(seconds),
+        seconds=sum(seconds),
+        p50=_percentile(seconds, 50),
+        p95=_percentile(seconds, 95),
+        max=seconds[-1],
+        size=sum(t.size for t in timings),
+    )
+
+
+def _percentile(sorted_values: list[float], percent: int) -> float:
+    # nearest-rank method.
+    rank = math.ceil(percent / 100 * len(sorted_values))
+
+    return sorted_values[max(rank, 1) - 1]
@@ -1,9 +1,10 @@
 from pathlib import Path
-from typing import Literal
+from typing import IO, Literal
 
 from pydantic import BaseModel
 
 from fs_schema_validator.evaluator.values import Bindings
+from fs_schema_validator.index import DirectoryIndex
 from fs_schema_validator.report import ValidationReport
 from fs_schema_validator.utils import _assert_path_exists
 
@@ -16,14 +17,28 @@ class FileSchema(BaseModel):
     def inner_bindings(self) -> Bindings:
         return {}
 
-    def validate_(self, root_dir: Path, report: ValidationReport) -> bool:
-        if not _assert_path_exists(root_dir, self.path, report):
+    def reads_whole_file(self) -> bool:
+        return False
+
+    def validate_(
+        self, root_dir: Path, report: ValidationReport, index: DirectoryIndex | None = None
+    ) -> bool:
+        if not _assert_path_exists(root_dir, self.path, report, index):
             return False
 
-        if not self.allow_empty and self._file_size(root_dir) == 0:
+        if not self.allow_empty and self._file_size(root_dir, index) == 0:
+            report.append(path=self.path, reason="cannot be empty")
+
+        return True
+
+    def validate_stream(self, f: IO[bytes], report: ValidationReport) -> bool:
+        if not self.allow_empty and len(f.read(1)) == 0:
             report.append(path=self.path, reason="cannot be empty")
 
         return True
 
-    def _file_size(self, root_dir: Path) -> int:
+    def _file_size(self, root_dir: Path, index: DirectoryIndex | None) -> int:
+        if index is not None and (entry := index.lookup(self.path)) is not None:
+            return entry.size
+
         return (root_dir / self.path).stat().st_size
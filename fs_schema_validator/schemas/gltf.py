@@ -1,11 +1,21 @@
+from __future__ import annotations
+
+import io
+import json
+import mmap
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum, unique
 from pathlib import Path
-from typing import Literal
+from typing import IO, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from pygltflib import GLTF2
 
 from fs_schema_validator.evaluator.values import Bindings, String
+from fs_schema_validator.gltf_accessors import check_accessors
+from fs_schema_validator.gltf_structure import GlbError, check_structure, read_glb, stream_size
+from fs_schema_validator.index import DirectoryIndex
 from fs_schema_validator.report import ValidationReport
 from fs_schema_validator.utils import _assert_path_exists
 
@@ -16,25 +26,68 @@ class GltfFormat(Enum):
     GLB = "glb"
 
 
+@unique
+class GltfDepth(Enum):
+    STRUCTURE = "structure"
+    FULL = "full"
+
+
+@unique
+class GltfCheck(Enum):
+    BOUNDS = "bounds"
+    INDICES = "indices"
+    FINITE = "finite"
+    MIN_MAX = "min_max"
+
+
 class GltfSchema(BaseModel):
     type: Literal["gltf"]
     format: GltfFormat
     path: Path
+    depth: GltfDepth = GltfDepth.FULL
+    checks: list[GltfCheck] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def check_checks(self) -> GltfSchema:
+        if len(self.checks) > 0 and self.depth is not GltfDepth.STRUCTURE:
+            raise ValueError("`checks` require `depth: structure`")
+
+        if self._reads_accessors() and self.format is not GltfFormat.GLB:
+            raise ValueError("only `bounds` can be checked on gltf files")
+
+        return self
 
     def inner_bindings(self) -> Bindings:
         return {
             "format": String(self.format.value),
         }
 
-    def validate_(self, root_dir: Path, report: ValidationReport) -> bool:
-        if not _assert_path_exists(root_dir, self.path, report):
+    def reads_whole_file(self) -> bool:
+        # structure checks of glb files only read the BIN chunk for accessors.
+        return (
+            self.format is GltfFormat.GLTF
+            or self.depth is GltfDepth.FULL
+            or self._reads_accessors()
+        )
+
+    def validate_(
+        self, root_dir: Path, report: ValidationReport, index: DirectoryIndex | None = None
+    ) -> bool:
+        if not _assert_path_exists(root_dir, self.path, report, index):
             return False
 
+        with (root_dir / self.path).open("rb") as f:
+            return self.validate_stream(f, report)
+
+    def validate_stream(self, f: IO[bytes], report: ValidationReport) -> bool:
+        if self.depth is GltfDepth.STRUCTURE:
+            return self._validate_structure(f, report)
+
         try:
             if self.format == GltfFormat.GLTF:
-                gltf = GLTF2.load_json(root_dir / self.path)
+                gltf = GLTF2.gltf_from_json(f.read().decode())
             elif self.format == GltfFormat.GLB:
-                gltf = GLTF2.load_binary(root_dir / self.path)
+                gltf = GLTF2.load_from_bytes(f.read())
         except Exception as e:
             report.append(path=self.path, reason=f"failed to deserialize: ({type(e)}) {e}")
             return False
@@ -44,3 +97,74 @@ class GltfSchema(BaseModel):
             return False
 
         return True
+
+    def _validate_structure(self, f: IO[bytes], report: ValidationReport) -> bool:
+        bin_offset = bin_length = None
+        size = stream_size(f)
+
+        try:
+            if self.format == GltfFormat.GLTF:
+                document = json.loads(f.read())
+            elif self.format == GltfFormat.GLB:
+                document, bin_offset, bin_length = read_glb(f, size)
+        except ValueError as e:
+            report.append(path=self.path, reason=f"failed to deserialize: {e}")
+            return False
+
+        # accessors are only read once they are known to be within bounds.
+        problems = check_structure(
+            document, bin_length, GltfCheck.BOUNDS in self.checks or self._reads_accessors()
+        )
+
+        if len(problems) == 0 and self._reads_accessors() and bin_length is not None:
+            assert bin_offset is not None
+
+            try:
+                with _bin_chunk(f, size, bin_offset, bin_length) as data:
+                    problems = check_accessors(
+                        document,
+                        data,
+                        indices=GltfCheck.INDICES in self.checks,
+                        finite=GltfCheck.FINITE in self.checks,
+                        min_max=GltfCheck.MIN_MAX in self.checks,
+                    )
+            except GlbError as e:
+                problems = [str(e)]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                # e.g. views NumPy cannot map over the chunk, or properties the structure check
+                # tolerates, should accessor checks have missed them.
+                problems = [f"failed to read accessors: ({type(e)}) {e}"]
+
+        for problem in problems:
+            report.append(path=self.path, reason=problem)
+
+        return len(problems) == 0
+
+    def _reads_accessors(self) -> bool:
+        return any(check is not GltfCheck.BOUNDS for check in self.checks)
+
+
+@contextmanager
+def _bin_chunk(f: IO[bytes], size: int | None, offset: int, length: int) -> Iterator[memoryview]:
+    # streams without a file descriptor (e.g. archive members) are positioned at the chunk.
+    if size is None:
+        data = f.read(length)
+
+        # lengths could not be checked against the file length beforehand.
+        if len(data) < length:
+            raise GlbError("truncated BIN chunk")
+
+        yield memoryview(data)
+        return
+
+    if isinstance(f, io.BytesIO):
+        with memoryview(f.getvalue())[offset : offset + length] as view:
+            yield view
+
+        return
+
+    with (
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm)[offset : offset + length] as view,
+    ):
+        yield view
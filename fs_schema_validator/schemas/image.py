@@ -1,6 +1,7 @@
 from enum import Enum, unique
 from pathlib import Path
-from typing import Literal
+from typing import IO, BinaryIO, Literal, cast
+from xml.etree import ElementTree as ET
 
 import pillow_avif  # noqa: F401
 from PIL import Image, UnidentifiedImageError
@@ -8,6 +9,7 @@ from pydantic import BaseModel
 from svglib import svglib
 
 from fs_schema_validator.evaluator.values import Bindings, String
+from fs_schema_validator.index import DirectoryIndex
 from fs_schema_validator.report import ValidationReport
 from fs_schema_validator.utils import _assert_path_exists
 
@@ -25,35 +27,91 @@ class ImageFormat(Enum):
         return self.value.upper()
 
 
+@unique
+class ImageDepth(Enum):
+    HEADER = "header"
+    # the image is opened, without decoding its pixel data.
+    OPEN = "open"
+    DECODE = "decode"
+
+
 class ImageSchema(BaseModel):
     type: Literal["image"]
     format: ImageFormat
     path: Path
+    depth: ImageDepth = ImageDepth.OPEN
 
     def inner_bindings(self) -> Bindings:
         return {
             "format": String(self.format.value),
         }
 
-    def validate_(self, root_dir: Path, report: ValidationReport) -> bool:
-        if not _assert_path_exists(root_dir, self.path, report):
+    def reads_whole_file(self) -> bool:
+        if self.format is ImageFormat.SVG:
+            return self.depth is not ImageDepth.HEADER
+
+        return self.depth is ImageDepth.DECODE
+
+    def validate_(
+        self, root_dir: Path, report: ValidationReport, index: DirectoryIndex | None = None
+    ) -> bool:
+        if not _assert_path_exists(root_dir, self.path, report, index):
             return False
 
+        with (root_dir / self.path).open("rb") as f:
+            return self.validate_stream(f, report)
+
+    def validate_stream(self, f: IO[bytes], report: ValidationReport) -> bool:
         if self.format is ImageFormat.SVG:
-            return self._validate_svg(root_dir, report)
+            if self.depth is ImageDepth.HEADER:
+                return self._sniff_svg(f, report)
+
+            return self._validate_svg(f, report)
 
-        return self._validate_raster(root_dir, report)
+        if self.depth is ImageDepth.HEADER:
+            return self._sniff_raster(f, report)
 
-    def _validate_svg(self, root_dir: Path, report: ValidationReport) -> bool:
-        if svglib.load_svg_file(root_dir / self.path) is None:
+        return self._validate_raster(f, report, load=self.depth is ImageDepth.DECODE)
+
+    def _sniff_svg(self, f: IO[bytes], report: ValidationReport) -> bool:
+        # Only the first start event is consumed, entities in the document body are never expanded.
+        try:
+            _, root = next(ET.iterparse(f, events=("start",)))  # noqa: S314
+        except (ET.ParseError, StopIteration):
+            root = None
+
+        if root is None or root.tag.rpartition("}")[2] != "svg":
             report.append(path=self.path, reason="file does not contain a valid svg")
             return False
 
         return True
 
-    def _validate_raster(self, root_dir: Path, report: ValidationReport) -> bool:
+    def _validate_svg(self, f: IO[bytes], report: ValidationReport) -> bool:
+        if svglib.load_svg_file(cast("BinaryIO", f)) is None:
+            report.append(path=self.path, reason="file does not contain a valid svg")
+            return False
+
+        return True
+
+    def _sniff_raster(self, f: IO[bytes], report: ValidationReport) -> bool:
+        format = _sniff_raster_format(f.read(_SNIFF_SIZE))
+
+        if format is None:
+            report.append(path=self.path, reason="file does not contain a valid image")
+            return False
+
+        if format != self.format.value:
+            report.append(
+                path=self.path,
+                reason=f"image is not in {self.format.value} format (got {format})",
+            )
+            return False
+
+        return True
+
+    def _validate_raster(self, f: IO[bytes], report: ValidationReport, load: bool) -> bool:
         try:
-            with Image.open(root_dir / self.path) as im:
+            with Image.open(f) as im:
                 if im.format is None:
                     report.append(
                         path=self.path,
@@ -67,8 +125,42 @@ class ImageSchema(BaseModel):
                         reason=f"image is not in {self.format.value} format (got {im.format.lower()})",
                     )
                     return False
+
+                if load:
+                    im.load()
         except UnidentifiedImageError:
             report.append(path=self.path, reason="file does not contain a valid image")
             return False
+        except OSError as ex:
+            report.append(path=self.path, reason=f"failed to decode: {ex}")
+            return False
 
         return True
+
+
+_SNIFF_SIZE = 16
+
+
+def _sniff_raster_format(prefix: bytes) -> str | None:
+    if prefix.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+
+    if prefix.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+
+    if prefix.startswith(b"RIFF") and prefix[8:12] == b"WEBP":
+        return "webp"
+
+    if prefix[:4] in (b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+"):
+        return "tiff"
+
+    if prefix[4:8] == b"ftyp" and prefix[8:12] in (b"avif", b"avis"):
+        return "avif"
+
+    if prefix.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+
+    if prefix.startswith(b"BM"):
+        return "bmp"
+
+    return None
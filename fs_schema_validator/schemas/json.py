@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import threading
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Annotated, Literal, Union, cast
+from typing import IO, Annotated, Any, Literal, NamedTuple, TextIO, Union, cast
 
 import pydantic
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PositiveInt,
     StrictBool,
     StrictFloat,
     StrictInt,
     StrictStr,
     TypeAdapter,
+    model_validator,
 )
 
 from fs_schema_validator.evaluator.values import Bindings
+from fs_schema_validator.index import DirectoryIndex
+from fs_schema_validator.json_stream import JsonContainerReader, JsonSyntaxError
 from fs_schema_validator.report import ValidationReport
 from fs_schema_validator.utils import _assert_path_exists
 
@@ -229,37 +238,266 @@ JsonObject.model_rebuild()
 JsonEnum.model_rebuild()
 
 
+class SpecCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class _SpecAdapterCache:
+    """Compiled `TypeAdapter`s keyed by a content hash of the spec that generated them."""
+
+    def __init__(self) -> None:
+        self._adapters: dict[str, TypeAdapter[Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, spec: JsonValue) -> TypeAdapter[Any]:
+        # attribute order matters (it drives error order), so the dump is hashed as-is.
+        key = hashlib.sha256(spec.model_dump_json(by_alias=True).encode()).hexdigest()
+
+        with self._lock:
+            adapter = self._adapters.get(key)
+
+            if adapter is not None:
+                self._hits += 1
+                return adapter
+
+            self._misses += 1
+
+        adapter = TypeAdapter[Any](spec.gen_schema())
+
+        with self._lock:
+            return self._adapters.setdefault(key, adapter)
+
+    def info(self) -> SpecCacheInfo:
+        return SpecCacheInfo(hits=self._hits, misses=self._misses, currsize=len(self._adapters))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_spec_adapters = _SpecAdapterCache()
+
+
+def spec_cache_info() -> SpecCacheInfo:
+    return _spec_adapters.info()
+
+
+def spec_cache_clear() -> None:
+    _spec_adapters.clear()
+
+
 class JsonSchema(BaseModel, extra="forbid"):
     type: Literal["json"]
     path: Path
     spec: JsonValue
+    stream: bool = False
+    max_errors: PositiveInt | None = None
+
+    @model_validator(mode="after")
+    def check_streamable_spec(self) -> JsonSchema:
+        if self.stream and not isinstance(self.spec, JsonArray | JsonDict):
+            raise ValueError("only `array` and `dict` specs can be streamed")
+
+        return self
 
     def inner_bindings(self) -> Bindings:
         return {}
 
-    def validate_(self, root_dir: Path, report: ValidationReport) -> bool:
-        if not _assert_path_exists(root_dir, self.path, report):
+    def reads_whole_file(self) -> bool:
+        # streaming bounds memory, not the bytes read.
+        return True
+
+    def validate_(
+        self, root_dir: Path, report: ValidationReport, index: DirectoryIndex | None = None
+    ) -> bool:
+        if not _assert_path_exists(root_dir, self.path, report, index):
             return False
 
-        schema = TypeAdapter[type](self.spec.gen_schema())
+        with (root_dir / self.path).open("rb") as f:
+            return self.validate_stream(f, report)
+
+    def validate_stream(self, f: IO[bytes], report: ValidationReport) -> bool:
+        errors = _ErrorCollector(self.path, report, self.max_errors)
+
+        if not self.stream:
+            self._validate_document(f.read(), errors)
+            return errors.count == 0
+
+        text = io.TextIOWrapper(f, encoding="utf-8", newline="")
 
         try:
-            schema.validate_json((root_dir / self.path).read_bytes())
+            self._validate_stream(text, errors)
+        except JsonSyntaxError as ex:
+            errors.append(f"root object: Invalid JSON: {ex}")
+        except UnicodeDecodeError as ex:
+            errors.append(f"root object: Invalid JSON: {ex}")
+        finally:
+            # closing is left to the caller.
+            text.detach()
+
+        return errors.count == 0
+
+    def _validate_document(self, data: str | bytes, errors: _ErrorCollector) -> None:
+        try:
+            _spec_adapters.get(self.spec).validate_json(data)
         except pydantic.ValidationError as e:
-            for error in e.errors():
-                json_path = ".".join(
-                    str(span)
-                    for span in error["loc"]
-                    if span != "__root__" and not str(span).startswith("literal[")
+            errors.extend(e)
+
+    def _validate_stream(self, f: TextIO, errors: _ErrorCollector) -> None:
+        reader = JsonContainerReader(f)
+        opener = reader.open_container()
+
+        # not a container (e.g. `null` for a nullable spec), small enough to be read at once.
+        if opener is None:
+            self._validate_document(reader.rest(), errors)
+            return
+
+        if isinstance(self.spec, JsonArray):
+            if opener != "[":
+                errors.append("root object: Input should be a valid array")
+                return
+
+            # items are validated in batches, amortizing the cost of crossing into pydantic-core.
+            batches = _spec_adapters.get(
+                JsonArray.model_validate({"type": "array", "items": self.spec.items})
+            )
+            items = _spec_adapters.get(self.spec.items)
+            batch: list[str] = []
+            batch_size = 0
+            count = 0
+
+            for item in reader.items():
+                batch.append(item)
+                batch_size += len(item)
+                count += 1
+
+                if batch_size >= _STREAM_BATCH_SIZE:
+                    _validate_batch(batches, items, batch, count - len(batch), errors)
+                    batch.clear()
+                    batch_size = 0
+
+                    if errors.full():
+                        return
+
+            _validate_batch(batches, items, batch, count - len(batch), errors)
+            reader.finish()
+
+            if self.spec.min_items is not None and count < self.spec.min_items:
+                errors.append(
+                    f"root object: List should have at least {_items(self.spec.min_items)} after validation, not {count}"
                 )
 
-                if len(json_path) == 0:
-                    reason = f"root object: {error['msg']}"
-                else:
-                    reason = f"`{json_path}`: {error['msg']}"
+            if self.spec.max_items is not None and count > self.spec.max_items:
+                errors.append(
+                    f"root object: List should have at most {_items(self.spec.max_items)} after validation, not {count}"
+                )
+        elif isinstance(self.spec, JsonDict):
+            if opener != "{":
+                errors.append("root object: Input should be a valid dictionary")
+                return
+
+            keys = _spec_adapters.get(self.spec.keys)
+            values = _spec_adapters.get(self.spec.values)
+
+            for raw_key, raw_value in reader.entries():
+                if errors.full():
+                    return
+
+                try:
+                    key = json.loads(raw_key)
+                except json.JSONDecodeError as ex:
+                    # keys are only scanned for their bounds by the reader, e.g. not for escapes.
+                    raise JsonSyntaxError(f"invalid key {raw_key}: {ex.msg}") from ex
+
+                try:
+                    keys.validate_json(raw_key)
+                except pydantic.ValidationError as e:
+                    errors.extend(e, prefix=(key, "[key]"))
+
+                try:
+                    values.validate_json(raw_value)
+                except pydantic.ValidationError as e:
+                    errors.extend(e, prefix=(key,))
+
+            reader.finish()
+
+
+_STREAM_BATCH_SIZE = 1 << 16
+
+
+def _validate_batch(
+    batches: TypeAdapter[Any],
+    items: TypeAdapter[Any],
+    batch: list[str],
+    start: int,
+    errors: _ErrorCollector,
+) -> None:
+    if len(batch) == 0:
+        return
+
+    try:
+        batches.validate_json(f"[{','.join(batch)}]")
+        return
+    except pydantic.ValidationError as e:
+        if not any(error["type"] == "json_invalid" for error in e.errors()):
+            errors.extend(e, index_offset=start)
+            return
+
+    # the reader only scans items for their bounds, e.g. not for misspelled literals. syntax
+    # errors are located by item, rather than by column of the joined batch.
+    for i, item in enumerate(batch):
+        if errors.full():
+            return
 
-                report.append(path=self.path, reason=reason)
+        try:
+            items.validate_json(item)
+        except pydantic.ValidationError as e:
+            errors.extend(e, prefix=(start + i,))
 
-            return False
 
-        return True
+class _ErrorCollector:
+    def __init__(self, path: Path, report: ValidationReport, max_errors: int | None) -> None:
+        self.path = path
+        self.report = report
+        self.max_errors = max_errors
+        self.count = 0
+
+    def full(self) -> bool:
+        return self.max_errors is not None and self.count >= self.max_errors
+
+    def append(self, reason: str) -> None:
+        if self.full():
+            return
+
+        self.report.append(path=self.path, reason=reason)
+        self.count += 1
+
+    def extend(
+        self, e: pydantic.ValidationError, prefix: Sequence[str | int] = (), index_offset: int = 0
+    ) -> None:
+        for error in e.errors():
+            loc = error["loc"]
+
+            if index_offset != 0 and len(loc) > 0 and isinstance(loc[0], int):
+                loc = (loc[0] + index_offset, *loc[1:])
+
+            json_path = ".".join(
+                str(span)
+                for span in (*prefix, *loc)
+                if span != "__root__" and not str(span).startswith("literal[")
+            )
+
+            if len(json_path) == 0:
+                self.append(f"root object: {error['msg']}")
+            else:
+                self.append(f"`{json_path}`: {error['msg']}")
+
+
+def _items(n: int) -> str:
+    return "1 item" if n == 1 else f"{n} items"
@@ -1,32 +1,157 @@
+import io
+import threading
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import Enum, unique
+from functools import partial
 from pathlib import Path
-from typing import Literal
-from zipfile import BadZipFile, ZipFile
+from typing import IO, Annotated, Literal
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PositiveInt
 
+from fs_schema_validator import evaluator
 from fs_schema_validator.evaluator.values import Bindings
+from fs_schema_validator.index import DirectoryIndex
 from fs_schema_validator.report import ValidationReport
+from fs_schema_validator.schemas.file import FileSchema
+from fs_schema_validator.schemas.gltf import GltfSchema
+from fs_schema_validator.schemas.image import ImageSchema
+from fs_schema_validator.schemas.json import JsonSchema
 from fs_schema_validator.utils import _assert_path_exists
 
+MemberValidator = Annotated[
+    JsonSchema | ImageSchema | GltfSchema | FileSchema,
+    Field(discriminator="type"),
+]
+
+
+@unique
+class ZipDepth(Enum):
+    HEADERS = "headers"
+    CRC = "crc"
+
 
 class ZipSchema(BaseModel):
     type: Literal["zip"]
     path: Path
+    depth: ZipDepth = ZipDepth.CRC
+    crc_jobs: PositiveInt = 1
+    members: list[MemberValidator] = Field(default_factory=list)
 
     def inner_bindings(self) -> Bindings:
         return {}
 
-    def validate_(self, root_dir: Path, report: ValidationReport) -> bool:
-        if not _assert_path_exists(root_dir, self.path, report):
+    def reads_whole_file(self) -> bool:
+        return self.depth is ZipDepth.CRC
+
+    def validate_(
+        self, root_dir: Path, report: ValidationReport, index: DirectoryIndex | None = None
+    ) -> bool:
+        if not _assert_path_exists(root_dir, self.path, report, index):
             return False
 
+        with (root_dir / self.path).open("rb") as f:
+            return self.validate_stream(f, report)
+
+    def validate_stream(self, f: IO[bytes], report: ValidationReport) -> bool:
         try:
-            with (root_dir / self.path).open("rb") as f, ZipFile(f) as zip:
-                if zip.testzip() is not None:
-                    report.append(path=self.path, reason="crc checks failed")
-                    return False
+            with ZipFile(f) as zip:
+                if self.depth is ZipDepth.HEADERS:
+                    # opening a member checks its local header, without reading its data.
+                    for info in zip.infolist():
+                        zip.open(info).close()
+                else:
+                    if self.crc_jobs == 1 or (reopen := _reopener(f)) is None:
+                        bad_member = zip.testzip()
+                    else:
+                        bad_member = _parallel_testzip(reopen, zip.infolist(), self.crc_jobs)
+
+                    if bad_member is not None:
+                        report.append(path=self.path, reason="crc checks failed")
+                        return False
+
+                self._validate_members(zip, report)
         except BadZipFile as ex:
             report.append(path=self.path, reason=str(ex))
             return False
 
         return True
+
+    def _validate_members(self, zip: ZipFile, report: ValidationReport) -> None:
+        for unexpanded_member in self.members:
+            name = list(
+                evaluator.expand(str(unexpanded_member.path), unexpanded_member.inner_bindings())
+            )
+            assert len(name) == 1, (
+                "cannot expand to more than one variant when dealing with paths and a validator's inner bindings"
+            )
+
+            # members are reported as if the archive were a directory.
+            member = unexpanded_member.model_copy(update={"path": self.path / name[0]})
+
+            try:
+                info = zip.getinfo(name[0])
+            except KeyError:
+                report.append_missing_file(member.path)
+                continue
+
+            try:
+                with zip.open(info) as f:
+                    if member.validate_stream(f, report):
+                        report.mark_file_as_ok(member.path)
+            except (BadZipFile, zlib.error) as ex:
+                report.append(path=member.path, reason=f"failed to read: {ex}")
+
+
+_CRC_CHUNK_SIZE = 1 << 20
+
+
+def _parallel_testzip(
+    reopen: Callable[[], IO[bytes]], infos: list[ZipInfo], jobs: int
+) -> str | None:
+    # every worker reads through its own file handle, zlib releases the GIL while inflating.
+    # the first bad member stops all workers, a single one is enough to fail the archive.
+    stop = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_testzip, reopen, infos[i::jobs], stop) for i in range(jobs)]
+
+        for future in as_completed(futures):
+            if (bad_member := future.result()) is not None:
+                stop.set()
+                return bad_member
+
+    return None
+
+
+def _testzip(
+    reopen: Callable[[], IO[bytes]], infos: list[ZipInfo], stop: threading.Event
+) -> str | None:
+    with reopen() as f, ZipFile(f) as zip:
+        for info in infos:
+            if stop.is_set():
+                return None
+
+            try:
+                with zip.open(info) as member:
+                    while member.read(_CRC_CHUNK_SIZE) and not stop.is_set():
+                        pass
+            except BadZipFile:
+                return info.filename
+
+    return None
+
+
+def _reopener(f: IO[bytes]) -> Callable[[], IO[bytes]] | None:
+    # opens another handle over the same contents, with a position of its own.
+    if isinstance(f, io.BytesIO):
+        return partial(io.BytesIO, f.getvalue())
+
+    if isinstance(f, io.BufferedReader) and isinstance(f.raw, io.FileIO):
+        path = Path(f.name)
+
+        return lambda: path.open("rb")
+
+    return None
@@ -1,10 +1,18 @@
 from pathlib import Path
 
+from fs_schema_validator.index import DirectoryIndex
 from fs_schema_validator.report import ValidationReport
 
 
-def _assert_path_exists(root_dir: Path, path: Path, report: ValidationReport) -> bool:
-    if not (root_dir / path).exists():
+def _assert_path_exists(
+    root_dir: Path, path: Path, report: ValidationReport, index: DirectoryIndex | None = None
+) -> bool:
+    if index is not None:
+        exists = index.exists(path)
+    else:
+        exists = (root_dir / path).exists()
+
+    if not exists:
         report.append_missing_file(path)
         return False
 
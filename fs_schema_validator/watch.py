@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import stat
+import struct
+import sys
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import NoReturn, Protocol, Self
+
+from fs_schema_validator.index import DirectoryIndex
+
+__all__ = [
+    "InotifyWatcher",
+    "PollingWatcher",
+    "Watcher",
+    "open_watcher",
+]
+
+
+class Watcher(Protocol):
+    def wait(self) -> set[Path] | None:
+        """Blocks until files change, returning their paths relative to the root dir.
+
+        `None` means that changes could not be tracked, and that everything may have changed.
+        """
+
+    def close(self) -> None: ...
+
+
+class PollingWatcher:
+    """Detects changes by diffing snapshots of the tree, taken every `interval` seconds."""
+
+    def __init__(self, root_dir: Path, interval: float) -> None:
+        self.root_dir = root_dir
+        self.interval = interval
+        self.snapshot = DirectoryIndex.scan(root_dir)
+
+    def wait(self) -> set[Path] | None:
+        while True:
+            time.sleep(self.interval)
+
+            snapshot = DirectoryIndex.scan(self.root_dir)
+            old, new = self.snapshot.entries, snapshot.entries
+            self.snapshot = snapshot
+
+            changed = {
+                Path(key)
+                for key in old.keys() | new.keys()
+                if old.get(key) != new.get(key)
+                and not (key in old and old[key].is_dir())
+                and not (key in new and new[key].is_dir())
+            }
+
+            if len(changed) > 0:
+                return changed
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+_IN_ATTRIB = 0x4
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+
+_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Detects changes through inotify, watching every directory of the tree.
+
+    Files are only reported once closed after writing, or moved, so that files still being
+    written are not validated halfway. Changes are batched until none happened for `debounce`
+    seconds.
+    """
+
+    def __init__(self, root_dir: Path, debounce: float) -> None:
+        self.root_dir = root_dir
+        self.debounce = debounce
+        self.libc = _libc()
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self.fd < 0:
+            _raise_errno()
+
+        self.dirs: dict[int, Path] = {}
+        self._watch_tree(Path())
+
+    def wait(self) -> set[Path] | None:
+        while True:
+            changed: set[Path] | None = set()
+            timeout = None
+
+            while select.select([self.fd], [], [], timeout)[0]:
+                changed = self._read_events(changed)
+                timeout = self.debounce
+
+            if changed is None or len(changed) > 0:
+                return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _read_events(self, changed: set[Path] | None) -> set[Path] | None:
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+
+            if mask & _IN_Q_OVERFLOW:
+                changed = None
+                continue
+
+            if mask & _IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+
+            if wd not in self.dirs:
+                continue
+
+            path = self.dirs[wd] / os.fsdecode(name)
+
+            if not mask & _IN_ISDIR:
+                # created files are reported once written and closed, links are never written.
+                if (
+                    changed is not None
+                    and len(name) > 0
+                    and (mask != _IN_CREATE or self._is_link(path))
+                ):
+                    changed.add(path)
+            elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                # files may have been written before the directory was watched.
+                files = self._watch_tree(path)
+
+                if changed is not None:
+                    changed |= files
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                # files below are not tracked, any of them may have been validated.
+                changed = None
+
+        return changed
+
+    def _is_link(self, path: Path) -> bool:
+        try:
+            st = os.lstat(self.root_dir / path)
+        except OSError:
+            return False
+
+        return stat.S_ISLNK(st.st_mode) or st.st_nlink > 1
+
+    def _watch_tree(self, top: Path) -> set[Path]:
+        files: set[Path] = set()
+
+        for dir_path, dir_names, file_names in os.walk(self.root_dir / top):
+            relative = Path(dir_path).relative_to(self.root_dir)
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dir_path), _WATCH_MASK)
+
+            if wd < 0:
+                if relative == Path():
+                    _raise_errno()
+
+                # e.g. removed in the meantime.
+                dir_names.clear()
+                continue
+
+            self.dirs[wd] = relative
+            files.update(relative / name for name in file_names)
+
+        return files
+
+
+def open_watcher(root_dir: Path, interval: float) -> InotifyWatcher | PollingWatcher:
+    """Watches `root_dir` through inotify where available, polling every `interval` otherwise.
+
+    `interval` is also how long inotify changes need to settle before being reported.
+    """
+
+    if sys.platform == "linux":
+        try:
+            return InotifyWatcher(root_dir, interval)
+        except OSError:
+            # e.g. out of watches, or not supported by the filesystem.
+            pass
+
+    return PollingWatcher(root_dir, interval)
+
+
+def _libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError("inotify is not available")
+
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+    return libc
+
+
+def _raise_errno() -> NoReturn:
+    errno = ctypes.get_errno()
+
+    raise OSError(errno, os.strerror(errno))
@@ -26,6 +26,11 @@ def test_cannot_coerce_range() -> None:
         evaluate("$foo == bar", {"foo": Range(1, 10)})
 
 
+def test_coerce_range_with_a_single_value() -> None:
+    assert evaluate("$foo == 3", {"foo": Range(3, 3)}) is True
+    assert evaluate("$foo != 3", {"foo": Range(3, 3)}) is False
+
+
 def test_cannot_coerce_enum_with_more_than_one_variant() -> None:
     with pytest.raises(CoercionError):
         evaluate("$foo == bar", {"foo": Enum({"foo", "bar"})})
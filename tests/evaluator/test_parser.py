@@ -2,6 +2,7 @@ import pytest
 
 from fs_schema_validator.evaluator.parser import (
     ParseError,
+    compile_template,
     parse_assignment,
     parse_expression,
     parse_template,
@@ -110,3 +111,22 @@ def test_assignment_fail() -> None:
 
     with pytest.raises(ParseError):
         parse_assignment("foo={}")
+
+
+def test_compiled_templates_are_cached() -> None:
+    compile_template.cache_clear()
+
+    first = compile_template("output_{$yaw_angle_idx}/foo.png")
+    second = compile_template("output_{$yaw_angle_idx}/foo.png")
+
+    assert first is second
+    assert compile_template.cache_info().hits == 1
+    assert compile_template.cache_info().misses == 1
+    assert list(first) == parse_template("output_{$yaw_angle_idx}/foo.png")
+
+
+def test_parse_template_returns_a_fresh_list() -> None:
+    template = parse_template("foo-{bar|baz}")
+    template.clear()
+
+    assert parse_template("foo-{bar|baz}") == [String("foo-"), Expansion(Enum({"bar", "baz"}))]
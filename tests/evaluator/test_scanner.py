@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from fs_schema_validator.evaluator.parser import (
+    ParseError,
+    parse_template,
+    parse_template_with_grammar,
+)
+from fs_schema_validator.evaluator.scanner import scan_template
+from fs_schema_validator.evaluator.values import String, Template
+
+TEMPLATES = [
+    "",
+    " ",
+    "foo",
+    "  foo  ",
+    "output_0/plot_slices_results.json",
+    "foo-{bar|baz}-{0..10}.jpg",
+    "a {b} c",
+    "{a} {b}",
+    "\t{a}\n",
+    "{a }b",
+    "a { b } c",
+    "{ foo | bar }",
+    "{foo|}",
+    "{|}",
+    "{}",
+    "{:x}",
+    "{|:x}",
+    "{+}",
+    "{foo:>5}",
+    "{a:b:c}",
+    "{0..10:02}",
+    "{-4..+100}",
+    "{ 0 .. 3 }",
+    "{0..3 : 02}",
+    "{1..}",
+    "{..30}",
+    "{1..x}",
+    "{1...2}",
+    "{1..2x}",
+    "{1..2|3}",
+    "{$foo}",
+    "{$ab-c_d}",
+    "{$foo:02}",
+    "{$foo: 02 }",
+    "{ $foo}",
+    "{$foo }",
+    "{$a}",
+    "{$0}",
+    "{$-}",
+    "{$ab|c}",
+    "{a|$b}",
+    "{{6}}",
+    "foo-{{6}}",
+    "{{ 6 }}",
+    "^[0-9a-f]{{6}}$",
+    "{{a}b}}",
+    "{{a}}}",
+    "{{}}",
+    "{{",
+    "{",
+    "}",
+    "x}",
+    "{a:}",
+    "{ {a}}",
+    "output_{$yaw_angle_idx}/totalp_coeff{|_empty}_{$axis}_{$slices_idx:02}.{$format}",
+]
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_equivalent_to_grammar(template: str) -> None:
+    _assert_equivalent(template)
+
+
+def test_fuzzed_equivalence() -> None:
+    rng = random.Random(0)  # noqa: S311
+    alphabet = ["{", "}", "{{", "}}", "$", "|", ":", ".", "..", "-", "+", " ", "\t"]
+    alphabet += ["a", "b", "foo", "0", "12", "_", "/", "x"]
+
+    for _ in range(5_000):
+        _assert_equivalent("".join(rng.choices(alphabet, k=rng.randint(0, 12))))
+
+
+def test_brace_free_strings_short_circuit() -> None:
+    assert scan_template("foo/bar.png") == [String("foo/bar.png")]
+    assert scan_template(" foo ") == [String("foo ")]
+
+
+def test_fallback_is_reported() -> None:
+    assert scan_template("{ foo | bar }") is None
+    assert scan_template("{$0}") is None
+
+
+def _assert_equivalent(template: str) -> None:
+    expected: Template | None
+
+    try:
+        expected = parse_template_with_grammar(template)
+    except ParseError:
+        expected = None
+
+    scanned = scan_template(template)
+
+    if expected is None:
+        assert scanned is None, template
+
+        with pytest.raises(ParseError):
+            parse_template(template)
+
+        return
+
+    assert scanned is None or scanned == expected, template
+    assert parse_template(template) == expected, template
@@ -0,0 +1,94 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from fs_schema_validator import Schema
+from fs_schema_validator.cache import ResultCache
+from fs_schema_validator.report import ValidationError
+
+SCHEMA = """
+  schema:
+    - type: json
+      path: data/{0..3}.json
+      spec:
+        type: int
+"""
+
+
+def _write_tree(root_dir: Path) -> None:
+    (root_dir / "data").mkdir()
+    (root_dir / "data" / "0.json").write_text("0")
+    (root_dir / "data" / "1.json").write_text('"one"')
+    (root_dir / "data" / "2.json").write_text("2")
+
+
+@pytest.mark.parametrize("hash_contents", [False, True])
+def test_cached_results_match_uncached(tmp_path: Path, hash_contents: bool) -> None:
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    _write_tree(root_dir)
+
+    schema = Schema.from_yaml(SCHEMA)
+    expected = schema.validate_(root_dir=root_dir)
+
+    with ResultCache.open(tmp_path / "cache", hash_contents) as cache:
+        assert schema.validate_(root_dir=root_dir, cache=cache) == expected
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    with ResultCache.open(tmp_path / "cache", hash_contents) as cache:
+        assert schema.validate_(root_dir=root_dir, cache=cache) == expected
+        assert (cache.hits, cache.misses) == (3, 0)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert (
+                schema.validate_(root_dir=root_dir, executor=executor, chunksize=2, cache=cache)
+                == expected
+            )
+
+
+def test_modified_files_are_revalidated(tmp_path: Path) -> None:
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    _write_tree(root_dir)
+
+    schema = Schema.from_yaml(SCHEMA)
+
+    with ResultCache.open(tmp_path / "cache") as cache:
+        schema.validate_(root_dir=root_dir, cache=cache)
+
+        path = root_dir / "data" / "1.json"
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text('"2"')
+        os.utime(path, ns=(mtime_ns + 1, mtime_ns + 1))
+
+        report = schema.validate_(root_dir=root_dir, cache=cache)
+
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert report.errors == [
+            ValidationError(
+                path=Path("data/1.json"), reason="root object: Input should be a valid integer"
+            ),
+            ValidationError(path=Path("data/3.json"), reason="does not exist"),
+        ]
+
+
+def test_validator_definition_is_part_of_the_key(tmp_path: Path) -> None:
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    _write_tree(root_dir)
+
+    with ResultCache.open(tmp_path / "cache") as cache:
+        Schema.from_yaml(SCHEMA).validate_(root_dir=root_dir, cache=cache)
+
+        report = Schema.from_yaml(SCHEMA.replace("int", "str")).validate_(
+            root_dir=root_dir, cache=cache
+        )
+
+        assert cache.hits == 0
+        assert [e.path for e in report.errors] == [
+            Path("data/0.json"),
+            Path("data/2.json"),
+            Path("data/3.json"),
+        ]
@@ -1,5 +1,11 @@
+import json
+import struct
 from pathlib import Path
+from typing import Any
+from zipfile import ZipFile
 
+import numpy as np
+import pydantic
 import pytest
 
 from fs_schema_validator import Schema
@@ -60,3 +66,276 @@ def schema() -> Schema:
           path: asset.gltf
     """
     )
+
+
+def test_structure_ok(tmp_path: Path) -> None:
+    (tmp_path / "asset.glb").symlink_to(FIXTURES_DIR / "asset.glb")
+    (tmp_path / "asset.gltf").symlink_to(FIXTURES_DIR / "asset.gltf")
+
+    assert STRUCTURE_SCHEMA.validate_(root_dir=tmp_path).errors == []
+
+
+def test_structure_fail(tmp_path: Path) -> None:
+    (tmp_path / "asset.glb").write_bytes((FIXTURES_DIR / "asset.glb").read_bytes()[:1024])
+    (tmp_path / "asset.gltf").write_text('{"asset": {"version": "2.0"}, "nodes": [{"mesh": 0}]}')
+
+    assert STRUCTURE_SCHEMA.validate_(root_dir=tmp_path).errors == [
+        ValidationError(
+            path=Path("asset.glb"),
+            reason="failed to deserialize: header declares 895732 bytes but the file is 1024 bytes long",
+        ),
+        ValidationError(
+            path=Path("asset.gltf"),
+            reason="nodes[0].mesh is not a valid index into meshes (got 0)",
+        ),
+    ]
+
+
+def test_structure_non_object_elements(tmp_path: Path) -> None:
+    (tmp_path / "asset.gltf").write_text(
+        '{"asset": {"version": "2.0"}, "nodes": [{}], "meshes": [5], "accessors": [{}, 7]}'
+    )
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: gltf
+          format: gltf
+          path: asset.gltf
+          depth: structure
+    """
+    )
+
+    assert [e.reason for e in schema.validate_(root_dir=tmp_path).errors] == [
+        "accessors[1] is not an object",
+        "meshes[0] is not an object",
+    ]
+
+
+def test_structure_bounds(tmp_path: Path) -> None:
+    document = {
+        "asset": {"version": "2.0"},
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}],
+        "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}],
+        "bufferViews": [{"buffer": 0, "byteLength": 24}],
+        "buffers": [{"byteLength": 36}],
+    }
+    (tmp_path / "asset.glb").write_bytes(_glb(document, bytes(36)))
+
+    assert STRUCTURE_SCHEMA.validate_(root_dir=tmp_path).errors[0] == ValidationError(
+        path=Path("asset.glb"), reason="accessors[0] ends at byte 36 past bufferViews[0] (24 bytes)"
+    )
+
+    document["bufferViews"] = [{"buffer": 0, "byteOffset": 12, "byteLength": 36}]
+    (tmp_path / "asset.glb").write_bytes(_glb(document, bytes(36)))
+
+    assert STRUCTURE_SCHEMA.validate_(root_dir=tmp_path).errors[0] == ValidationError(
+        path=Path("asset.glb"), reason="bufferViews[0] ends at byte 48 past buffers[0] (36 bytes)"
+    )
+
+    document["bufferViews"] = [{"buffer": 0, "byteLength": 36}]
+    (tmp_path / "asset.glb").write_bytes(_glb(document, bytes(24)))
+
+    assert STRUCTURE_SCHEMA.validate_(root_dir=tmp_path).errors[0] == ValidationError(
+        path=Path("asset.glb"), reason="buffers[0].byteLength is 36 but the BIN chunk is 24 bytes"
+    )
+
+
+def test_checks_require_structure_depth() -> None:
+    with pytest.raises(pydantic.ValidationError, match="require `depth: structure`"):
+        Schema.from_yaml(
+            """
+          schema:
+            - type: gltf
+              format: glb
+              path: asset.glb
+              checks: [bounds]
+        """
+        )
+
+
+def _glb(document: dict[str, Any], bin: bytes) -> bytes:
+    data = json.dumps(document).encode()
+    data += b" " * (-len(data) % 4)
+    chunks = struct.pack("<II", len(data), 0x4E4F534A) + data
+    chunks += struct.pack("<II", len(bin), 0x004E4942) + bin
+
+    return struct.pack("<4sII", b"glTF", 2, 12 + len(chunks)) + chunks
+
+
+STRUCTURE_SCHEMA = Schema.from_yaml(
+    """
+  schema:
+    - type: gltf
+      format: glb
+      path: asset.glb
+      depth: structure
+      checks: [bounds]
+    - type: gltf
+      format: gltf
+      path: asset.gltf
+      depth: structure
+      checks: [bounds]
+"""
+)
+
+
+def test_accessor_checks(tmp_path: Path) -> None:
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: gltf
+          format: glb
+          path: asset.glb
+          depth: structure
+          checks: [indices, finite, min_max]
+    """
+    )
+
+    (tmp_path / "asset.glb").symlink_to(FIXTURES_DIR / "asset.glb")
+    assert schema.validate_(root_dir=tmp_path).errors == []
+    (tmp_path / "asset.glb").unlink()
+
+    positions = np.array([[0, 0, 0], [1, np.nan, 0], [0, 1, 0]], dtype="<f4")
+    indices = np.array([0, 1, 3], dtype="<u2")
+    bin = positions.tobytes() + indices.tobytes() + bytes(2)
+    document = {
+        "asset": {"version": "2.0"},
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        "accessors": [
+            {
+                "bufferView": 0,
+                "componentType": 5126,
+                "count": 3,
+                "type": "VEC3",
+                "min": [0, 0, 0],
+                "max": [1, 2, 0],
+            },
+            {"bufferView": 1, "componentType": 5123, "count": 3, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteLength": 36},
+            {"buffer": 0, "byteOffset": 36, "byteLength": 6},
+        ],
+        "buffers": [{"byteLength": len(bin)}],
+    }
+    (tmp_path / "asset.glb").write_bytes(_glb(document, bin))
+
+    assert [e.reason for e in schema.validate_(root_dir=tmp_path).errors] == [
+        "accessors[0] contains 1 non-finite values",
+        "accessors[0].min is [0, 0, 0] but the data has [0.0, nan, 0.0]",
+        "accessors[0].max is [1, 2, 0] but the data has [1.0, nan, 0.0]",
+        "meshes[0].primitives[0].indices refers to vertex 3 but attributes have 3 vertices",
+    ]
+
+    with ZipFile(tmp_path / "assets.zip", mode="w") as zip:
+        zip.write(tmp_path / "asset.glb", "asset.glb")
+
+    zip_schema = Schema.from_yaml(
+        """
+      schema:
+        - type: zip
+          path: assets.zip
+          members:
+            - type: gltf
+              format: glb
+              path: asset.glb
+              depth: structure
+              checks: [indices]
+    """
+    )
+
+    assert zip_schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(
+            path=Path("assets.zip/asset.glb"),
+            reason="meshes[0].primitives[0].indices refers to vertex 3 but attributes have 3 vertices",
+        )
+    ]
+
+
+def test_accessor_checks_skip_what_structure_tolerates(tmp_path: Path) -> None:
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: gltf
+          format: glb
+          path: asset.glb
+          depth: structure
+          checks: [indices, finite]
+    """
+    )
+    indices = np.array([0, 1, 2, 0], dtype="<u2")
+    document: dict[str, Any] = {
+        "asset": {"version": "2.0"},
+        "nodes": [{"mesh": 0}],
+        "meshes": [
+            # an accessor without a buffer view, and without a count either.
+            {"primitives": [{"attributes": {"POSITION": 1}, "indices": 0}]},
+            {"primitives": 5},
+        ],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5123, "count": 4, "type": "SCALAR"},
+            {"componentType": 5126, "type": "VEC3"},
+        ],
+        "bufferViews": [{"buffer": 0, "byteLength": 8}],
+        "buffers": [{"byteLength": 8}],
+    }
+    (tmp_path / "asset.glb").write_bytes(_glb(document, indices.tobytes()))
+
+    assert schema.validate_(root_dir=tmp_path).errors == []
+
+
+def test_truncated_archive_member(tmp_path: Path) -> None:
+    data = (FIXTURES_DIR / "asset.glb").read_bytes()
+
+    with ZipFile(tmp_path / "assets.zip", mode="w") as zip:
+        # the header still declares the original length.
+        zip.writestr("asset.glb", data[:-20])
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: zip
+          path: assets.zip
+          members:
+            - type: gltf
+              format: glb
+              path: asset.glb
+              depth: structure
+              checks: [finite]
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(path=Path("assets.zip/asset.glb"), reason="truncated BIN chunk")
+    ]
+
+
+def test_truncated_file_read_by_several_validators(tmp_path: Path) -> None:
+    data = (FIXTURES_DIR / "asset.glb").read_bytes()
+    (tmp_path / "asset.glb").write_bytes(data[:-20])
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: gltf
+          format: glb
+          path: asset.glb
+          depth: structure
+          checks: [finite]
+        - type: file
+          path: asset.glb
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(
+            path=Path("asset.glb"),
+            reason=f"failed to deserialize: header declares {len(data)} bytes but the file is "
+            f"{len(data) - 20} bytes long",
+        )
+    ]
+
+    (tmp_path / "asset.glb").write_bytes(data)
+    assert schema.validate_(root_dir=tmp_path).errors == []
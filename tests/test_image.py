@@ -3,7 +3,9 @@ from pathlib import Path
 import pytest
 
 from fs_schema_validator import Schema
+from fs_schema_validator.evaluator.values import String
 from fs_schema_validator.report import ValidationError
+from fs_schema_validator.schemas.image import ImageDepth
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -48,28 +50,87 @@ def test_fail(schema: Schema, tmp_path: Path) -> None:
     ]
 
 
-@pytest.fixture
-def schema() -> Schema:
+def test_truncated_image_is_only_caught_when_decoding(tmp_path: Path) -> None:
+    (tmp_path / "image.png").write_bytes((FIXTURES_DIR / "image.png").read_bytes()[:400])
+
+    yaml = """
+      schema:
+        - type: image
+          format: png
+          path: image.png
+          depth: "{$depth}"
+    """
+
+    for depth in ("header", "open"):
+        schema = Schema.from_yaml(yaml, {"depth": String(depth)})
+        assert schema.validate_(root_dir=tmp_path).errors == []
+
+    decode = Schema.from_yaml(yaml, {"depth": String("decode")})
+    assert [e.reason for e in decode.validate_(root_dir=tmp_path).errors] == [
+        "failed to decode: image file is truncated"
+    ]
+
+
+def test_svg_header_requires_svg_root(tmp_path: Path) -> None:
+    (tmp_path / "image.svg").write_text("<html></html>")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: image
+          format: svg
+          path: image.svg
+          depth: header
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(path=Path("image.svg"), reason="file does not contain a valid svg"),
+    ]
+
+
+def test_images_are_opened_by_default() -> None:
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: image
+          format: png
+          path: image.png
+    """
+    )
+
+    assert schema.validators[0].depth is ImageDepth.OPEN  # type: ignore[union-attr]
+
+
+@pytest.fixture(params=["header", "open", "decode"])
+def schema(request: pytest.FixtureRequest) -> Schema:
     return Schema.from_yaml(
         """
       schema:
         - type: image
           format: png
+          depth: "{$depth}"
           path: image.png
         - type: image
           format: webp
+          depth: "{$depth}"
           path: image.webp
         - type: image
           format: jpeg
+          depth: "{$depth}"
           path: image.jpg
         - type: image
           format: svg
+          depth: "{$depth}"
           path: image.svg
         - type: image
           format: tiff
+          depth: "{$depth}"
           path: image.tif
         - type: image
           format: avif
+          depth: "{$depth}"
           path: image.avif
-    """
+    """,
+        {"depth": String(request.param)},
     )
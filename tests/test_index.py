@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from fs_schema_validator import Schema
+from fs_schema_validator.index import DirectoryIndex
+
+
+def test_scan(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "b.txt").write_text("hello")
+    (tmp_path / "c.txt").write_text("")
+    (tmp_path / "dangling").symlink_to(tmp_path / "nowhere")
+
+    index = DirectoryIndex.scan(tmp_path)
+
+    assert set(index) == {"a", "a/b.txt", "c.txt"}
+    assert index.entries["a"].is_dir()
+    assert index.entries["a/b.txt"].is_file()
+    assert index.entries["a/b.txt"].size == 5
+    assert not index.exists(Path("dangling"))
+
+
+def test_lookup_falls_back_to_stat(tmp_path: Path) -> None:
+    index = DirectoryIndex.scan(tmp_path)
+    (tmp_path / "late.txt").write_text("late")
+
+    entry = index.lookup(Path("late.txt"))
+
+    assert entry is not None
+    assert entry.size == 4
+    assert index.lookup(Path("late.txt/nested")) is None
+    assert index.lookup(Path("missing")) is None
+
+
+def test_symlinked_dirs_are_not_walked(tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "x.txt").write_text("x")
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+
+    index = DirectoryIndex.scan(tmp_path)
+
+    assert "link/x.txt" not in set(index)
+    assert index.exists(Path("link/x.txt"))
+
+
+def test_restrict(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+
+    index = DirectoryIndex.scan(tmp_path).restrict([Path("a.txt"), Path("missing")])
+
+    assert set(index) == {"a.txt"}
+
+
+def test_schema_with_index_matches_without(tmp_path: Path) -> None:
+    (tmp_path / "data").mkdir()
+
+    for i in range(0, 10, 2):
+        (tmp_path / "data" / f"{i}.txt").write_text("" if i == 4 else "content")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: data/{0..9}.txt
+    """
+    )
+    index = DirectoryIndex.scan(tmp_path)
+
+    expected = schema.validate_(root_dir=tmp_path)
+
+    assert schema.validate_(root_dir=tmp_path, index=index) == expected
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (
+            schema.validate_(root_dir=tmp_path, executor=executor, chunksize=3, index=index)
+            == expected
+        )
@@ -2,11 +2,13 @@ from pathlib import Path
 from typing import Any
 
 import orjson
+import pydantic
 import pytest
 
 from fs_schema_validator import Schema
 from fs_schema_validator.evaluator.values import String
 from fs_schema_validator.report import ValidationError
+from fs_schema_validator.schemas.json import _STREAM_BATCH_SIZE, spec_cache_clear, spec_cache_info
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -84,6 +86,31 @@ def test_binding_replacement_in_json_schema(tmp_path: Path) -> None:
     ]
 
 
+def test_multi_variant_expansion_in_spec(tmp_path: Path) -> None:
+    json_path = tmp_path / "file.json"
+    json_path.write_bytes(orjson.dumps({"foo": 1}))
+
+    schema = Schema.from_yaml(
+        """
+      bindings:
+        key: foo
+      schema:
+        - type: json
+          path: file.json
+          spec:
+            type: object
+            attrs:
+              "{$key}":
+                type: "{int|string}"
+    """
+    )
+
+    assert len(schema.validators) == 2
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(path=Path("file.json"), reason="`foo`: Input should be a valid string"),
+    ]
+
+
 def test_expansion_escaping(tmp_path: Path) -> None:
     json_path = tmp_path / "file.json"
     json_path.write_bytes(orjson.dumps("123abc"))
@@ -146,6 +173,183 @@ def test_nullable_items_in_array(tmp_path: Path) -> None:
     assert schema.validate_(root_dir=tmp_path).errors == []
 
 
+def test_identical_specs_are_compiled_once(tmp_path: Path) -> None:
+    for i in range(3):
+        (tmp_path / f"file-{i}.json").write_bytes(orjson.dumps([i]))
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: file-{0..2}.json
+          spec:
+            type: array
+            items:
+              type: int
+    """
+    )
+
+    spec_cache_clear()
+
+    assert schema.validate_(root_dir=tmp_path).errors == []
+    assert spec_cache_info().misses == 1
+    assert spec_cache_info().hits == 2
+    assert spec_cache_info().currsize == 1
+
+
+def test_stream_array(tmp_path: Path) -> None:
+    json_path = tmp_path / "file.json"
+    json_path.write_bytes(orjson.dumps([{"x": 1.0}, {"x": "2"}, {"y": 3.0}, {"x": None}]))
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: file.json
+          stream: true
+          spec:
+            type: array
+            max_items: 2
+            items:
+              type: object
+              attrs:
+                x:
+                  type: float
+    """
+    )
+
+    assert [e.reason for e in schema.validate_(root_dir=tmp_path).errors] == [
+        "`1.x`: Input should be a valid number",
+        "`2.x`: Field required",
+        "`3.x`: Input should be a valid number",
+        "root object: List should have at most 2 items after validation, not 4",
+    ]
+
+
+def test_stream_dict_with_max_errors(tmp_path: Path) -> None:
+    json_path = tmp_path / "file.json"
+    json_path.write_bytes(orjson.dumps({"a": 1, "b": "2", "cc": "3", "d": "4"}))
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: file.json
+          stream: true
+          max_errors: 2
+          spec:
+            type: dict
+            keys:
+              type: string
+              max_length: 1
+            values:
+              type: int
+    """
+    )
+
+    assert [e.reason for e in schema.validate_(root_dir=tmp_path).errors] == [
+        "`b`: Input should be a valid integer",
+        "`cc.[key]`: String should have at most 1 character",
+    ]
+
+
+def test_stream_invalid_json(tmp_path: Path) -> None:
+    json_path = tmp_path / "file.json"
+    json_path.write_text("[1, 2")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: file.json
+          stream: true
+          spec:
+            type: array
+            items:
+              type: int
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(
+            path=Path("file.json"),
+            reason="root object: Invalid JSON: expected `,` or `]` at offset 5",
+        ),
+    ]
+
+
+def test_stream_invalid_item_after_the_first_batch(tmp_path: Path) -> None:
+    # `tru` is scanned as an item, and lands in the second batch.
+    count = _STREAM_BATCH_SIZE // 3 + 10
+    json_path = tmp_path / "file.json"
+    json_path.write_text(f'[{", ".join(["1.5"] * count)}, tru, "a"]')
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: file.json
+          stream: true
+          spec:
+            type: array
+            items:
+              type: float
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(
+            path=Path("file.json"),
+            reason=f"`{count}`: Invalid JSON: EOF while parsing a value at line 1 column 3",
+        ),
+        ValidationError(
+            path=Path("file.json"),
+            reason=f"`{count + 1}`: Input should be a valid number",
+        ),
+    ]
+
+
+def test_stream_dict_with_invalid_key(tmp_path: Path) -> None:
+    json_path = tmp_path / "file.json"
+    json_path.write_text('{"a": 1, "b\\x": 2}')
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: file.json
+          stream: true
+          spec:
+            type: dict
+            keys:
+              type: string
+            values:
+              type: int
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).errors == [
+        ValidationError(
+            path=Path("file.json"),
+            reason='root object: Invalid JSON: invalid key "b\\x": Invalid \\escape',
+        ),
+    ]
+
+
+def test_stream_requires_a_container_spec() -> None:
+    with pytest.raises(pydantic.ValidationError, match="only `array` and `dict` specs"):
+        Schema.from_yaml(
+            """
+          schema:
+            - type: json
+              path: file.json
+              stream: true
+              spec:
+                type: int
+        """
+        )
+
+
 def test_missing(schema: Schema, tmp_path: Path) -> None:
     assert schema.validate_(root_dir=tmp_path).errors == [
         ValidationError(path=Path("file.json"), reason="does not exist")
@@ -0,0 +1,64 @@
+import io
+import json
+
+import pytest
+
+from fs_schema_validator.json_stream import JsonContainerReader, JsonSyntaxError
+
+DOCUMENTS = [
+    "[]",
+    " [ ] ",
+    "[1, 2.5e3, -3, true, false, null]",
+    '["a", "b\\"c", "[{", "\\\\", "\\u00e9"]',
+    '[[1, [2, [3]]], {"a": {"b": [1, {"c": "}"}]}}, []]',
+    '{"a": 1, "b": [1, 2], "c": {"d": "e"}, "": null}',
+    " {\n\t} ",
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_members_match_json_loads(document: str, chunk_size: int) -> None:
+    reader = JsonContainerReader(io.StringIO(document), chunk_size=chunk_size)
+    expected = json.loads(document)
+
+    opener = reader.open_container()
+
+    if opener == "[":
+        assert [json.loads(item) for item in reader.items()] == expected
+    else:
+        assert opener == "{"
+        assert {json.loads(k): json.loads(v) for k, v in reader.entries()} == expected
+
+    reader.finish()
+
+
+def test_scalar_documents_are_not_containers() -> None:
+    reader = JsonContainerReader(io.StringIO(" null "), chunk_size=2)
+
+    assert reader.open_container() is None
+    assert reader.rest() == "null "
+
+
+@pytest.mark.parametrize(
+    ("document", "message"),
+    [
+        ("[1 2]", "expected `,` or `]` at offset 3"),
+        ("[1,", "unexpected end of input"),
+        ('["abc', "unterminated string at offset 1"),
+        ("[[1, 2]", "expected `,` or `]` at offset 7"),
+        ("[1] 2", "trailing characters at offset 4"),
+        ("{1: 2}", "expected a string key at offset 1"),
+    ],
+)
+def test_syntax_errors(document: str, message: str) -> None:
+    reader = JsonContainerReader(io.StringIO(document), chunk_size=2)
+
+    with pytest.raises(JsonSyntaxError, match=message):
+        _drain(reader)
+
+
+def _drain(reader: JsonContainerReader) -> None:
+    opener = reader.open_container()
+    list(reader.items() if opener == "[" else reader.entries())
+    reader.finish()
@@ -0,0 +1,160 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pydantic
+import pytest
+
+from fs_schema_validator import LazySchema, Schema
+from fs_schema_validator.index import DirectoryIndex
+from fs_schema_validator.matching import PathMatch, PathMatcher, glob_to_regex
+from fs_schema_validator.report import ValidationError
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.parametrize(
+    ("glob", "matching", "not_matching"),
+    [
+        ("*.png", ["a.png", ".png"], ["a/b.png", "a.jpg"]),
+        ("output_*/*.png", ["output_0/a.png"], ["output_0/x/a.png", "output/a.png"]),
+        ("output_*/**/*.png", ["output_0/a.png", "output_0/x/y/a.png"], ["output_0.png"]),
+        ("**/*.json", ["a.json", "a/b/c.json"], ["a/b/c.jsonl"]),
+        ("data/**", ["data/a", "data/a/b"], ["data", "other/a"]),
+        ("img_?.[pj]ng", ["img_0.png", "img_1.jng"], ["img_10.png", "img_/.png"]),
+        ("[!a]*", ["b", "bb"], ["a", "ab"]),
+        ("a+(b).txt", ["a+(b).txt"], ["aab.txt"]),
+        ("[]b].txt", ["].txt", "b.txt"], ["a.txt"]),
+        ("[!]b].txt", ["a.txt"], ["].txt", "b.txt"]),
+        ("[!]", ["[!]"], ["a"]),
+    ],
+)
+def test_glob_to_regex(glob: str, matching: list[str], not_matching: list[str]) -> None:
+    regex = re.compile(glob_to_regex(glob))
+
+    for path in matching:
+        assert regex.fullmatch(path) is not None, path
+
+    for path in not_matching:
+        assert regex.fullmatch(path) is None, path
+
+
+def test_matcher_resolves_overlapping_patterns(tmp_path: Path) -> None:
+    for path in ["a/x.png", "a/y.jpg", "b/z.png", "b/nested/w.png"]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+    matcher = PathMatcher(
+        [
+            PathMatch(glob="**/*.png"),
+            PathMatch(glob="a/*"),
+            PathMatch(regex=r"(b)/.*\.png"),
+            PathMatch(regex=r"(?i)A/X\.PNG"),
+            PathMatch(glob="c/*"),
+        ]
+    )
+
+    assert matcher.resolve(DirectoryIndex.scan(tmp_path)) == [
+        [Path("a/x.png"), Path("b/nested/w.png"), Path("b/z.png")],
+        [Path("a/x.png"), Path("a/y.jpg")],
+        [Path("b/nested/w.png"), Path("b/z.png")],
+        [Path("a/x.png")],
+        [],
+    ]
+
+
+def test_match_validator(tmp_path: Path) -> None:
+    (tmp_path / "output_0").mkdir()
+    (tmp_path / "output_1").mkdir()
+    (tmp_path / "output_0" / "a.json").write_text("1")
+    (tmp_path / "output_0" / "b.json").write_text('"nope"')
+    (tmp_path / "output_1" / "c.json").write_text("2")
+    (tmp_path / "output_1" / "c.txt").write_text("")
+
+    yaml = """
+      schema:
+        - type: json
+          match:
+            glob: output_*/*.json
+            min: 1
+          spec:
+            type: int
+        - type: file
+          match:
+            regex: 'output_\\d+/.*\\.txt'
+            max: 0
+          allow_empty: true
+        - type: file
+          path: output_0/a.json
+    """
+
+    schema = Schema.from_yaml(yaml)
+    report = schema.validate_(root_dir=tmp_path)
+
+    assert report.errors == [
+        ValidationError(
+            path=Path("output_0/b.json"), reason="root object: Input should be a valid integer"
+        ),
+        ValidationError(
+            path=Path(r"output_\d+/.*\.txt"), reason="matched 1 files, expected at most 0"
+        ),
+    ]
+    assert sorted(report.valid_paths) == [
+        Path("output_0/a.json"),
+        Path("output_0/a.json"),
+        Path("output_1/c.json"),
+        Path("output_1/c.txt"),
+    ]
+
+    assert LazySchema.from_yaml(yaml).validate_(root_dir=tmp_path) == report
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert schema.validate_(root_dir=tmp_path, executor=executor) == report
+
+
+def test_match_expands_bindings(tmp_path: Path) -> None:
+    (tmp_path / "a.png").symlink_to(FIXTURES_DIR / "image.png")
+    (tmp_path / "b.webp").symlink_to(FIXTURES_DIR / "image.webp")
+
+    schema = Schema.from_yaml(
+        """
+      bindings:
+        image_formats: [png, webp, jpeg]
+      schema:
+        - type: image
+          match:
+            glob: "*.{$format}"
+            min: 1
+          format: "{$image_formats}"
+    """
+    )
+    report = schema.validate_(root_dir=tmp_path)
+
+    assert report.errors == [
+        ValidationError(path=Path("*.jpeg"), reason="matched 0 files, expected at least 1"),
+    ]
+    assert report.valid_paths == [Path("a.png"), Path("b.webp")]
+
+
+def test_match_and_path_are_exclusive() -> None:
+    with pytest.raises(pydantic.ValidationError, match="cannot be specified together"):
+        Schema.from_yaml(
+            """
+          schema:
+            - type: file
+              path: a.txt
+              match:
+                glob: "*.txt"
+        """
+        )
+
+
+def test_match_requires_a_single_pattern() -> None:
+    with pytest.raises(pydantic.ValidationError, match="exactly one of"):
+        PathMatch(glob="*", regex=".*")
+
+    with pytest.raises(pydantic.ValidationError, match="invalid regex"):
+        PathMatch(regex="(")
+
+    with pytest.raises(pydantic.ValidationError, match="invalid glob"):
+        PathMatch(glob="out/[z-a].png")
@@ -0,0 +1,86 @@
+import io
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from fs_schema_validator.output import JsonlOutput, JunitOutput
+from fs_schema_validator.report import ValidationReport
+
+
+def _reports() -> list[ValidationReport]:
+    ok = ValidationReport()
+    ok.mark_file_as_ok(Path("a.png"))
+
+    failed = ValidationReport()
+    failed.append(Path("b & c.json"), "root object: <missing>")
+    failed.append(Path("b & c.json"), "too big")
+
+    return [ok, failed]
+
+
+def test_jsonl_output() -> None:
+    f = io.StringIO()
+    output = JsonlOutput(f)
+    output.begin()
+
+    for report in _reports():
+        output.write(report)
+
+    output.end()
+
+    assert [json.loads(line) for line in f.getvalue().splitlines()] == [
+        {"path": "a.png", "errors": []},
+        {"path": "b & c.json", "errors": ["root object: <missing>", "too big"]},
+    ]
+
+
+def test_junit_output_is_well_formed() -> None:
+    f = io.StringIO()
+    output = JunitOutput(f)
+    output.begin()
+
+    for report in _reports():
+        output.write(report)
+
+    output.end()
+
+    suite = ET.fromstring(f.getvalue().encode())  # noqa: S314
+    cases = suite.findall("testcase")
+
+    assert [case.get("name") for case in cases] == ["a.png", "b & c.json"]
+    assert cases[0].find("failure") is None
+
+    failure = cases[1].find("failure")
+    assert failure is not None
+    assert failure.get("message") == "root object: <missing>"
+    assert failure.text == "root object: <missing>\ntoo big"
+
+
+def test_results_of_a_path_are_merged() -> None:
+    # e.g. an empty file, both marked as ok and reported as empty.
+    ok = ValidationReport()
+    ok.mark_file_as_ok(Path("a.txt"))
+    failed = ValidationReport()
+    failed.append(Path("a.txt"), "cannot be empty")
+    other = ValidationReport()
+    other.mark_file_as_ok(Path("b.txt"))
+
+    jsonl = io.StringIO()
+    junit = io.StringIO()
+
+    for output in (JsonlOutput(jsonl), JunitOutput(junit)):
+        output.begin()
+
+        for report in (ok, failed, other):
+            output.write(report)
+
+        output.end()
+
+    assert [json.loads(line) for line in jsonl.getvalue().splitlines()] == [
+        {"path": "a.txt", "errors": ["cannot be empty"]},
+        {"path": "b.txt", "errors": []},
+    ]
+
+    cases = ET.fromstring(junit.getvalue().encode()).findall("testcase")  # noqa: S314
+    assert [case.get("name") for case in cases] == ["a.txt", "b.txt"]
+    assert [case.find("failure") is not None for case in cases] == [True, False]
@@ -0,0 +1,71 @@
+import pickle
+from pathlib import Path
+
+from fs_schema_validator.report import ValidationError, ValidationReport
+
+
+def _report(errors: list[tuple[str, str]], valid_paths: list[str]) -> ValidationReport:
+    report = ValidationReport()
+
+    for path, reason in errors:
+        report.append(Path(path), reason)
+
+    for path in valid_paths:
+        report.mark_file_as_ok(Path(path))
+
+    return report
+
+
+def test_paths_and_reasons_are_interned() -> None:
+    report = _report([("a", "does not exist"), ("b", "does not exist"), ("a", "too big")], ["c"])
+
+    assert report._paths == [Path("a"), Path("b"), Path("c")]
+    assert report._reasons == ["does not exist", "too big"]
+    assert report.count() == 4
+    assert not report.okay()
+
+
+def test_extend_remaps_ids() -> None:
+    report = _report([("a", "too big")], ["b"])
+    report.extend(_report([("c", "too small"), ("a", "too big")], ["a"]))
+
+    assert report.errors == [
+        ValidationError(path=Path("a"), reason="too big"),
+        ValidationError(path=Path("c"), reason="too small"),
+        ValidationError(path=Path("a"), reason="too big"),
+    ]
+    assert report.valid_paths == [Path("b"), Path("a")]
+    assert len(report._paths) == 3
+    assert len(report._reasons) == 2
+
+
+def test_grouped_by_path_keeps_reason_order() -> None:
+    report = _report([("b", "first"), ("a", "only"), ("b", "second")], [])
+
+    assert list(report.grouped_by_path()) == [
+        (Path("a"), ["only"]),
+        (Path("b"), ["first", "second"]),
+    ]
+
+
+def test_serialization_roundtrip() -> None:
+    report = _report([("a/b.txt", "cannot be empty")], ["a/c.txt"])
+
+    assert ValidationReport.from_json(report.to_json()) == report
+
+    unpickled = pickle.loads(pickle.dumps(report))  # noqa: S301
+    assert unpickled == report
+
+    unpickled.append(Path("a/b.txt"), "cannot be empty")
+    assert unpickled._paths == report._paths
+
+
+def test_discard_removes_paths_and_archive_members() -> None:
+    report = _report(
+        [("a.zip/x.png", "cannot be empty"), ("b.txt", "does not exist"), ("a.zip", "too big")],
+        ["a.zip/y.png", "a.zipper", "c.txt"],
+    )
+    report.discard([Path("a.zip"), Path("c.txt")])
+
+    assert report.errors == [ValidationError(path=Path("b.txt"), reason="does not exist")]
+    assert report.valid_paths == [Path("a.zipper")]
@@ -1,8 +1,21 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
-from fs_schema_validator import Schema
+import pytest
+
+import fs_schema_validator
+from fs_schema_validator import LazySchema, Schema
+from fs_schema_validator.cache import ResultCache
 from fs_schema_validator.report import ValidationError
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
 
 def test_empty_schema_ok(tmp_path: Path) -> None:
     schema = Schema.from_yaml(
@@ -131,3 +144,576 @@ def test_if_expression(tmp_path: Path) -> None:
     assert schema.validate_(root_dir=tmp_path).errors == [
         ValidationError(path=Path("missing.png"), reason="does not exist"),
     ]
+
+
+def test_if_expression_per_combination() -> None:
+    yaml = """
+      bindings:
+        kind: [mesh, image, doc]
+        lod: [0, 3]
+      schema:
+        - type: file
+          path: "{$kind}/{$lod:02}.bin"
+          if: [$kind != doc, $lod != 2]
+        - type: file
+          path: "{$kind}.txt"
+          if: $kind == doc
+        # the condition holds for some values of a binding the validator does not use.
+        - type: file
+          path: "all.txt"
+          if: $lod != 0
+    """
+    expected = [
+        Path("image/00.bin"),
+        Path("image/01.bin"),
+        Path("image/03.bin"),
+        Path("mesh/00.bin"),
+        Path("mesh/01.bin"),
+        Path("mesh/03.bin"),
+        Path("doc.txt"),
+        Path("all.txt"),
+    ]
+
+    assert [v.path for v in Schema.from_yaml(yaml).validators] == expected
+    assert [v.path for v in LazySchema.from_yaml(yaml).validators()] == expected
+
+
+def test_if_expression_prunes_following_bindings() -> None:
+    schema = LazySchema.from_yaml(
+        """
+      bindings:
+        kind: [mesh, image]
+        frame: [0, 999999999]
+      schema:
+        - type: file
+          path: "{$kind}/{$frame}.bin"
+          if: [$kind == none, $frame == 0]
+    """
+    )
+
+    # frames of kinds that do not match are never enumerated.
+    assert list(schema.validators()) == []
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_parallel_validation_is_deterministic(
+    tmp_path: Path, executor_cls: type[ThreadPoolExecutor] | type[ProcessPoolExecutor]
+) -> None:
+    (tmp_path / "foo-1.txt").write_bytes(b"foo")
+    (tmp_path / "foo-3.txt").write_bytes(b"")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: foo-{0..4}.txt
+    """
+    )
+    sequential = schema.validate_(root_dir=tmp_path)
+
+    with executor_cls(max_workers=2) as executor:
+        parallel = schema.validate_(root_dir=tmp_path, executor=executor, chunksize=2)
+
+    assert parallel.errors == sequential.errors
+    assert parallel.valid_paths == sequential.valid_paths
+    assert parallel.errors == [
+        ValidationError(path=Path("foo-0.txt"), reason="does not exist"),
+        ValidationError(path=Path("foo-2.txt"), reason="does not exist"),
+        ValidationError(path=Path("foo-3.txt"), reason="cannot be empty"),
+        ValidationError(path=Path("foo-4.txt"), reason="does not exist"),
+    ]
+
+
+def test_lazy_schema_matches_eager_schema(tmp_path: Path) -> None:
+    (tmp_path / "foo-bar-1.txt").write_bytes(b"foo")
+
+    yaml = """
+      bindings:
+        range: [0, 2]
+        enum: [bar, baz]
+        flag: "on"
+      schema:
+        - type: file
+          path: "foo-{$enum}-{$range}.txt"
+        - type: file
+          path: skipped.txt
+          if: $flag == off
+    """
+    eager = Schema.from_yaml(yaml).validate_(root_dir=tmp_path)
+    lazy_schema = LazySchema.from_yaml(yaml)
+
+    for _ in range(2):
+        lazy = lazy_schema.validate_(root_dir=tmp_path)
+        assert lazy.errors == eager.errors
+        assert lazy.valid_paths == eager.valid_paths
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = lazy_schema.validate_(root_dir=tmp_path, executor=executor, chunksize=2)
+
+    assert parallel.errors == eager.errors
+    assert parallel.valid_paths == eager.valid_paths
+
+
+def test_lazy_schema_expands_on_demand() -> None:
+    schema = LazySchema.from_yaml(
+        """
+      bindings:
+        aa: [0, 999999]
+        bb: [0, 999999]
+      schema:
+        - type: file
+          path: "{$aa}/{$bb}/{0..999999}.txt"
+    """
+    )
+
+    assert [v.path for v in islice(schema.validators(), 2)] == [
+        Path("0/0/0.txt"),
+        Path("0/0/1.txt"),
+    ]
+
+
+def test_profile_records_timings(tmp_path: Path) -> None:
+    (tmp_path / "foo-0.txt").write_bytes(b"foo")
+    (tmp_path / "foo-1.txt").write_bytes(b"foobar")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: foo-{0..2}.txt
+    """
+    )
+
+    assert schema.validate_(root_dir=tmp_path).timings == []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report = schema.validate_(root_dir=tmp_path, executor=executor, profile=True)
+
+    assert [(t.path, t.type, t.size) for t in report.timings] == [
+        (Path("foo-0.txt"), "file", 3),
+        (Path("foo-1.txt"), "file", 6),
+        (Path("foo-2.txt"), "file", 0),
+    ]
+
+    stats = report.timing_stats()
+    assert list(stats) == ["file"]
+    assert stats["file"].count == 3
+    assert stats["file"].size == 9
+    assert stats["file"].p50 <= stats["file"].p95 <= stats["file"].max
+    assert report.slowest(1)[0].seconds == stats["file"].max
+
+
+def test_iter_validate_streams_reports_in_order(tmp_path: Path) -> None:
+    (tmp_path / "foo-1.txt").write_bytes(b"foo")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: foo-{0..2}.txt
+        - type: file
+          match:
+            glob: "*.png"
+            min: 1
+    """
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reports = list(schema.iter_validate(tmp_path, executor=executor))
+
+    assert [(r.valid_paths, [e.path for e in r.errors]) for r in reports] == [
+        ([], [Path("foo-0.txt")]),
+        ([Path("foo-1.txt")], []),
+        ([], [Path("foo-2.txt")]),
+        ([], [Path("*.png")]),
+    ]
+
+    it = schema.iter_validate(tmp_path)
+    assert not next(it).okay()
+    it.close()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_max_errors_stops_the_run(tmp_path: Path, parallel: bool) -> None:
+    (tmp_path / "foo-1.txt").write_bytes(b"foo")
+    (tmp_path / "doc.json").write_text('[1, "a", "b", "c"]')
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: doc.json
+          spec:
+            type: array
+            items:
+              type: int
+        - type: file
+          path: foo-{0..9}.txt
+    """
+    )
+
+    assert len(schema.validate_(root_dir=tmp_path).errors) == 12
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            report = schema.validate_(root_dir=tmp_path, executor=executor, max_errors=2)
+    else:
+        report = schema.validate_(root_dir=tmp_path, max_errors=2)
+
+    # files report at most `max_errors` errors too.
+    assert [e.path for e in report.errors] == [Path("doc.json"), Path("doc.json")]
+    assert report.valid_paths == []
+
+    report = schema.validate_(root_dir=tmp_path, max_errors=5)
+    assert [e.path for e in report.errors] == [Path("doc.json")] * 3 + [
+        Path("foo-0.txt"),
+        Path("foo-2.txt"),
+    ]
+    assert report.valid_paths == [Path("foo-1.txt")]
+
+
+def test_avalidate_matches_validate(tmp_path: Path) -> None:
+    for i in range(0, 20, 3):
+        (tmp_path / f"foo-{i}.txt").write_bytes(b"foo")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: foo-{0..19}.txt
+        - type: file
+          match:
+            glob: "*.txt"
+            max: 2
+    """
+    )
+    sequential = schema.validate_(root_dir=tmp_path)
+
+    for concurrency in (1, 4):
+        concurrent = asyncio.run(schema.avalidate(tmp_path, concurrency=concurrency))
+        assert concurrent.errors == sequential.errors
+        assert concurrent.valid_paths == sequential.valid_paths
+
+    budgeted = asyncio.run(schema.avalidate(tmp_path, concurrency=4, max_errors=3))
+    assert budgeted.errors == sequential.errors[:3]
+    assert budgeted.valid_paths == [Path("foo-0.txt"), Path("foo-3.txt")]
+
+
+def test_avalidate_keeps_cache_keys_off_the_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+
+    for i in range(4):
+        (root_dir / f"foo-{i}.txt").write_bytes(b"foo")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: foo-{0..5}.txt
+    """
+    )
+    key = ResultCache.key
+    threads = set()
+
+    def recording_key(self: ResultCache, *args: Any) -> str | None:
+        threads.add(threading.current_thread())
+        return key(self, *args)
+
+    monkeypatch.setattr(ResultCache, "key", recording_key)
+    sequential = schema.validate_(root_dir=root_dir)
+
+    with ResultCache.open(tmp_path / "cache") as cache:
+        for _ in range(2):
+            concurrent = asyncio.run(schema.avalidate(root_dir, concurrency=2, cache=cache))
+            assert concurrent.errors == sequential.errors
+            assert concurrent.valid_paths == sequential.valid_paths
+
+        assert cache.hits == 4
+
+    assert threading.main_thread() not in threads
+
+
+def test_repeated_binding_is_substituted_consistently() -> None:
+    yaml = """
+      bindings:
+        formats: [png, jpeg]
+      schema:
+        - type: image
+          format: "{$formats}"
+          path: "{$formats}/foo.{$formats}"
+    """
+    expected = [
+        ("jpeg", Path("jpeg/foo.jpeg")),
+        ("png", Path("png/foo.png")),
+    ]
+
+    schema = Schema.from_yaml(yaml)
+    assert [(v.format.value, v.path) for v in schema.validators] == expected  # type: ignore[union-attr]
+
+    lazy_schema = LazySchema.from_yaml(yaml)
+    assert [(v.format.value, v.path) for v in lazy_schema.validators()] == expected  # type: ignore[union-attr]
+
+
+def test_zipped_bindings_iterate_in_lock_step() -> None:
+    yaml = """
+      bindings:
+        names: [bar, foo]
+        sizes: [1, 2]
+        kinds: [a, b]
+      zip: [[names, sizes]]
+      schema:
+        - type: file
+          path: "{$kinds}/{$names}-{$sizes}.txt"
+    """
+    schema = Schema.from_yaml(yaml)
+    assert [v.path for v in schema.validators] == [
+        Path("a/bar-1.txt"),
+        Path("b/bar-1.txt"),
+        Path("a/foo-2.txt"),
+        Path("b/foo-2.txt"),
+    ]
+
+    with pytest.raises(ValueError, match="different lengths"):
+        Schema.from_yaml(yaml.replace("sizes: [1, 2]", "sizes: [1, 3]"))
+
+    with pytest.raises(ValueError, match="unknown bindings"):
+        Schema.from_yaml(yaml.replace("[[names, sizes]]", "[[names, counts]]"))
+
+
+def test_duplicate_validators_are_removed(tmp_path: Path) -> None:
+    (tmp_path / "foo.txt").write_bytes(b"foo")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: "{foo|bar}.txt"
+        - type: file
+          path: bar.txt
+        - type: file
+          path: foo.txt
+          allow_empty: true
+        - type: file
+          match:
+            glob: "*.txt"
+        - type: file
+          match:
+            glob: "*.txt"
+    """
+    )
+    # validators of the same path are grouped, in order of first appearance.
+    assert [(v.path, v.allow_empty) for v in schema.validators] == [  # type: ignore[union-attr]
+        (Path("bar.txt"), False),
+        (Path("foo.txt"), False),
+        (Path("foo.txt"), True),
+    ]
+    assert len(schema.matched_validators) == 1
+    assert schema.duplicates == 2
+
+    report = schema.validate_(root_dir=tmp_path)
+    assert report.errors == [ValidationError(path=Path("bar.txt"), reason="does not exist")]
+    assert report.valid_paths == [Path("foo.txt")] * 3
+
+
+def test_duplicate_validators_are_compared_as_typed() -> None:
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: foo.json
+          spec:
+            type: object
+            attrs:
+              a: {type: int}
+              b: {type: str}
+        - path: foo.json
+          type: json
+          spec:
+            attrs:
+              b: {type: str}
+              a: {type: int}
+            type: object
+        - type: file
+          path: foo.txt
+        - type: file
+          path: foo.txt
+          allow_empty: false
+    """
+    )
+    assert [v.path for v in schema.validators] == [Path("foo.json"), Path("foo.txt")]
+    assert schema.duplicates == 2
+
+
+def test_validators_are_grouped_and_compared_by_expanded_path() -> None:
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: image
+          format: png
+          path: img.{$format}
+        - type: file
+          path: other.txt
+        - type: file
+          path: img.png
+        - type: image
+          format: png
+          path: img.png
+    """
+    )
+
+    assert [(v.type, v.path) for v in schema.validators] == [
+        ("image", Path("img.png")),
+        ("file", Path("img.png")),
+        ("file", Path("other.txt")),
+    ]
+    assert schema.duplicates == 1
+
+
+@pytest.fixture
+def opens(monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Counts files opened for reading through `Path.open`, in this process only."""
+
+    counter: Counter[str] = Counter()
+    path_open = Path.open
+
+    def counting_open(self: Path, mode: str = "r", *args: Any, **kwargs: Any) -> Any:
+        if "r" in mode:
+            counter[self.name] += 1
+
+        return path_open(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+
+    return counter
+
+
+@pytest.mark.parametrize("executor", [None, "threads", "processes"])
+def test_validators_of_the_same_path_share_reads(
+    tmp_path: Path, executor: str | None, opens: Counter[str]
+) -> None:
+    (tmp_path / "doc.json").write_text('{"foo": 1}')
+    (tmp_path / "empty.json").write_bytes(b"")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: json
+          path: "{doc|empty|missing}.json"
+          spec:
+            type: object
+            attrs:
+              foo:
+                type: int
+        - type: file
+          path: "{doc|empty|missing}.json"
+        - type: json
+          path: doc.json
+          spec:
+            type: object
+            attrs:
+              foo:
+                type: str
+    """
+    )
+    expected = [
+        (Path("doc.json"), "json"),
+        (Path("doc.json"), "file"),
+        (Path("doc.json"), "json"),
+        (Path("empty.json"), "json"),
+        (Path("empty.json"), "file"),
+        (Path("missing.json"), "json"),
+        (Path("missing.json"), "file"),
+    ]
+    assert [(v.path, v.type) for v in schema.validators] == expected
+
+    if executor is None:
+        report = schema.validate_(root_dir=tmp_path)
+    else:
+        pool = ThreadPoolExecutor(2) if executor == "threads" else ProcessPoolExecutor(2)
+
+        with pool:
+            report = schema.validate_(root_dir=tmp_path, executor=pool, chunksize=2)
+
+    assert [(e.path, e.reason) for e in report.errors] == [
+        (Path("doc.json"), "`foo`: Input should be a valid string"),
+        (
+            Path("empty.json"),
+            "root object: Invalid JSON: EOF while parsing a value at line 1 column 0",
+        ),
+        (Path("empty.json"), "cannot be empty"),
+        (Path("missing.json"), "does not exist"),
+        (Path("missing.json"), "does not exist"),
+    ]
+    # `file` validators mark empty files as ok, along with their error.
+    assert report.valid_paths == [Path("doc.json"), Path("doc.json"), Path("empty.json")]
+
+    if executor != "processes":
+        # missing files are attempted once too, before validators report them.
+        assert opens == {"doc.json": 1, "empty.json": 1, "missing.json": 1}
+
+
+def test_validators_reading_headers_do_not_share_reads(tmp_path: Path, opens: Counter[str]) -> None:
+    (tmp_path / "asset.glb").symlink_to(FIXTURES_DIR / "asset.glb")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: gltf
+          format: glb
+          path: asset.glb
+          depth: structure
+        - type: gltf
+          format: glb
+          path: asset.glb
+          depth: structure
+          checks: [bounds]
+        - type: file
+          path: asset.glb
+    """
+    )
+    report = schema.validate_(root_dir=tmp_path, profile=True)
+
+    assert report.errors == []
+    # each reads the header and JSON chunk only, rather than the whole file upfront.
+    assert opens == {"asset.glb": 2}
+    assert [t.type for t in report.timings] == ["gltf", "gltf", "file"]
+
+
+def test_shared_reads_are_profiled(
+    tmp_path: Path, opens: Counter[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "doc.json").write_text("[]")
+
+    read_shared = fs_schema_validator._read_shared
+
+    def slow_read_shared(path: Path) -> bytes | None:
+        time.sleep(0.1)
+        return read_shared(path)
+
+    monkeypatch.setattr(fs_schema_validator, "_read_shared", slow_read_shared)
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: doc.json
+        - type: json
+          path: doc.json
+          spec:
+            type: array
+            items:
+              type: int
+    """
+    )
+    report = schema.validate_(root_dir=tmp_path, profile=True)
+
+    assert report.errors == []
+    assert opens == {"doc.json": 1}
+    # attributed to the validator that reads the file whole.
+    assert [(t.type, t.seconds >= 0.1) for t in report.timings] == [
+        ("file", False),
+        ("json", True),
+    ]
@@ -0,0 +1,99 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from fs_schema_validator import LiveValidation, Schema
+from fs_schema_validator.report import ValidationError
+from fs_schema_validator.watch import InotifyWatcher, PollingWatcher
+
+
+def test_live_validation_reruns_changed_files_only(tmp_path: Path) -> None:
+    (tmp_path / "foo-0.txt").write_bytes(b"foo")
+    (tmp_path / "a.json").write_text("[]")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: file
+          path: foo-{0..1}.txt
+        - type: json
+          match:
+            glob: "*.json"
+            min: 2
+          spec:
+            type: array
+            items:
+              type: int
+    """
+    )
+    live = LiveValidation(schema, tmp_path)
+    live.validate_all()
+
+    assert live.report.valid_paths == [Path("a.json"), Path("foo-0.txt")]
+    assert live.report.errors == [
+        ValidationError(path=Path("foo-1.txt"), reason="does not exist"),
+        ValidationError(path=Path("*.json"), reason="matched 1 files, expected at least 2"),
+    ]
+
+    (tmp_path / "foo-0.txt").unlink()
+    (tmp_path / "foo-1.txt").write_bytes(b"foo")
+    (tmp_path / "b.json").write_text('["b"]')
+
+    delta = live.revalidate({Path("foo-0.txt"), Path("foo-1.txt"), Path("b.json")})
+
+    assert delta.count() == 3
+    assert sorted(live.report.valid_paths) == [Path("a.json"), Path("foo-1.txt")]
+    assert sorted(live.report.errors, key=lambda e: e.path) == [
+        ValidationError(path=Path("b.json"), reason="`0`: Input should be a valid integer"),
+        ValidationError(path=Path("foo-0.txt"), reason="does not exist"),
+    ]
+
+
+def test_polling_watcher_reports_changed_files(tmp_path: Path) -> None:
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "a.txt").write_bytes(b"a")
+    (tmp_path / "b.txt").write_bytes(b"b")
+
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+
+    (tmp_path / "dir" / "a.txt").write_bytes(b"aa")
+    (tmp_path / "b.txt").unlink()
+    (tmp_path / "dir" / "c.txt").write_bytes(b"c")
+
+    assert watcher.wait() == {Path("dir/a.txt"), Path("b.txt"), Path("dir/c.txt")}
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is only available on linux")
+def test_inotify_watcher_reports_changed_files(tmp_path: Path) -> None:
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "b.txt").write_bytes(b"b")
+
+    with InotifyWatcher(tmp_path, debounce=0.05) as watcher:
+
+        def change() -> None:
+            (tmp_path / "dir" / "a.txt").write_bytes(b"a")
+            (tmp_path / "b.txt").unlink()
+            (tmp_path / "new" / "deep").mkdir(parents=True)
+            (tmp_path / "new" / "deep" / "c.txt").write_bytes(b"c")
+
+        thread = threading.Thread(target=change)
+        thread.start()
+        changed = watcher.wait()
+        thread.join()
+
+        # files of new directories may be reported by their own events or by the initial walk.
+        assert changed is not None
+        assert {Path("dir/a.txt"), Path("b.txt")} <= changed
+        assert changed <= {Path("dir/a.txt"), Path("b.txt"), Path("new/deep/c.txt")}
+
+        (tmp_path / "new" / "deep" / "c.txt").write_bytes(b"cc")
+        assert watcher.wait() == {Path("new/deep/c.txt")}
+
+        (tmp_path / "b.txt").write_bytes(b"b")
+        assert watcher.wait() == {Path("b.txt")}
+
+        (tmp_path / "symlink.txt").symlink_to("b.txt")
+        (tmp_path / "hardlink.txt").hardlink_to(tmp_path / "b.txt")
+        assert watcher.wait() == {Path("symlink.txt"), Path("hardlink.txt")}
@@ -1,9 +1,15 @@
 from pathlib import Path
 from zipfile import ZipFile
 
+import pytest
+
+import fs_schema_validator
 from fs_schema_validator import Schema
+from fs_schema_validator.evaluator.values import String
 from fs_schema_validator.report import ValidationError
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
 
 def test_ok(tmp_path: Path) -> None:
     zip_path = tmp_path / "file.zip"
@@ -37,3 +43,158 @@ def test_ko(tmp_path: Path) -> None:
     assert schema.validate_(root_dir=tmp_path).errors == [
         ValidationError(path=Path("file.zip"), reason="File is not a zip file"),
     ]
+
+
+def test_headers_depth_skips_crc_checks(tmp_path: Path) -> None:
+    zip_path = tmp_path / "file.zip"
+
+    with ZipFile(zip_path, mode="w") as zip:
+        zip.writestr("foo.txt", "bar")
+
+    data = zip_path.read_bytes()
+    zip_path.write_bytes(data.replace(b"bar", b"baz", 1))
+
+    yaml = """
+      schema:
+        - type: zip
+          path: file.zip
+          depth: "{$depth}"
+          crc_jobs: "{$crc_jobs}"
+    """
+
+    assert (
+        Schema.from_yaml(yaml, {"depth": String("headers"), "crc_jobs": String("1")})
+        .validate_(root_dir=tmp_path)
+        .errors
+        == []
+    )
+
+    for crc_jobs in ["1", "4"]:
+        assert Schema.from_yaml(
+            yaml, {"depth": String("crc"), "crc_jobs": String(crc_jobs)}
+        ).validate_(root_dir=tmp_path).errors == [
+            ValidationError(path=Path("file.zip"), reason="crc checks failed"),
+        ]
+
+    zip_path.write_bytes(b"XXXX" + data[4:])
+
+    assert Schema.from_yaml(yaml, {"depth": String("headers"), "crc_jobs": String("1")}).validate_(
+        root_dir=tmp_path
+    ).errors == [
+        ValidationError(path=Path("file.zip"), reason="Bad magic number for file header"),
+    ]
+
+
+def test_members(tmp_path: Path) -> None:
+    with ZipFile(tmp_path / "file.zip", mode="w") as zip:
+        zip.write(FIXTURES_DIR / "image.png", "images/a.png")
+        zip.write(FIXTURES_DIR / "image.jpg", "images/b.png")
+        zip.writestr("data.json", "[1, 2]")
+        zip.writestr("empty.txt", "")
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: zip
+          path: file.zip
+          members:
+            - type: image
+              format: png
+              depth: "{header|decode}"
+              path: images/{a|b|c}.{$format}
+            - type: json
+              path: data.json
+              spec:
+                type: array
+                items:
+                  type: int
+            - type: file
+              path: empty.txt
+    """
+    )
+
+    assert len(schema.validators) == 1
+
+    report = schema.validate_(root_dir=tmp_path)
+
+    assert report.errors == [
+        ValidationError(
+            path=Path("file.zip/images/b.png"), reason="image is not in png format (got jpeg)"
+        ),
+        ValidationError(path=Path("file.zip/images/c.png"), reason="does not exist"),
+        ValidationError(
+            path=Path("file.zip/images/b.png"), reason="image is not in png format (got jpeg)"
+        ),
+        ValidationError(path=Path("file.zip/images/c.png"), reason="does not exist"),
+        ValidationError(path=Path("file.zip/empty.txt"), reason="cannot be empty"),
+    ]
+    assert report.valid_paths == [
+        Path("file.zip/images/a.png"),
+        Path("file.zip/images/a.png"),
+        Path("file.zip/data.json"),
+        Path("file.zip/empty.txt"),
+        Path("file.zip"),
+    ]
+
+
+def test_bindings_reused_by_members_only_expand_into_members() -> None:
+    schema = Schema.from_yaml(
+        """
+      bindings:
+        ix: [0, 2]
+        kind: [a, b]
+      schema:
+        - type: zip
+          path: "{$kind}.zip"
+          members:
+            - type: file
+              path: "data/{$ix}/{$ix}.bin"
+            - type: file
+              path: "{$kind}.txt"
+    """
+    )
+
+    assert [
+        (v.path, [m.path for m in v.members])  # type: ignore[union-attr]
+        for v in schema.validators
+    ] == [
+        (
+            Path(f"{kind}.zip"),
+            [Path(f"data/{ix}/{ix}.bin") for ix in range(3)] + [Path(f"{kind}.txt")],
+        )
+        for kind in ("a", "b")
+    ]
+
+
+@pytest.mark.parametrize("max_shared_read_size", [0, 1 << 20])
+def test_validators_of_the_same_archive_share_its_contents(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, max_shared_read_size: int
+) -> None:
+    monkeypatch.setattr(fs_schema_validator, "_MAX_SHARED_READ_SIZE", max_shared_read_size)
+
+    zip_path = tmp_path / "file.zip"
+
+    with ZipFile(zip_path, mode="w") as zip:
+        zip.writestr("foo.txt", "bar")
+
+    zip_path.write_bytes(zip_path.read_bytes().replace(b"bar", b"baz", 1))
+
+    schema = Schema.from_yaml(
+        """
+      schema:
+        - type: zip
+          path: file.zip
+          depth: headers
+        - type: zip
+          path: file.zip
+          crc_jobs: 4
+        - type: file
+          path: file.zip
+    """
+    )
+    report = schema.validate_(root_dir=tmp_path)
+
+    assert report.errors == [
+        ValidationError(path=Path("file.zip"), reason="crc checks failed"),
+    ]
+    assert report.valid_paths == [Path("file.zip"), Path("file.zip")]